@@ -1,13 +1,89 @@
 from .safe_core import QuantumResearchPlatform, MaterialScienceTools, PharmaResearchTools
 from .health_monitoring import HealthMonitoringSystem, MetabolicMirror
+from .cohort import CohortMonitor
+from .streaming import StreamingMonitor
+from .screening import MaterialScreeningEngine
+from .compound_library import CompoundLibrary, convert_text_library, write_compound_library
+from .result_cache import ResultCache
+from .quantum_simulator import StateVectorSimulator
+from .quantum_circuit import QuantumCircuit, compile_circuit
+from .property_sweep import property_sweep
+from .results import DockedCompound, MaterialCandidate, PropertyPrediction, QuantumResult
+from .result_sink import ResultSink, read_results
+from . import instrumentation
+from .log_utils import configure_logging, shutdown_logging
+from .alerts import AlertCode, AlertEngine, AlertEvent
+from .sensor_frames import FRAME_DTYPE, decode_frames, encode_frames
+from .pareto import ParetoFront
 
 __all__ = [
     "QuantumResearchPlatform",
     "MaterialScienceTools", 
     "PharmaResearchTools",
     "HealthMonitoringSystem",
-    "MetabolicMirror"
+    "MetabolicMirror",
+    "CohortMonitor",
+    "StreamingMonitor",
+    "MetabolicIngestService",
+    "MaterialScreeningEngine",
+    "CompoundLibrary",
+    "convert_text_library",
+    "write_compound_library",
+    "ResultCache",
+    "BatchChartRenderer",
+    "render_charts_parallel",
+    "HybridScheduler",
+    "SerialBackend",
+    "ThreadPoolBackend",
+    "ProcessPoolBackend",
+    "StateVectorSimulator",
+    "QuantumCircuit",
+    "compile_circuit",
+    "property_sweep",
+    "MaterialCandidate",
+    "DockedCompound",
+    "PropertyPrediction",
+    "QuantumResult",
+    "ResultSink",
+    "read_results",
+    "instrumentation",
+    "configure_logging",
+    "shutdown_logging",
+    "AlertCode",
+    "AlertEngine",
+    "AlertEvent",
+    "FRAME_DTYPE",
+    "decode_frames",
+    "encode_frames",
+    "ParetoFront"
 ]
 
+# asyncio 接入服务、进程池调度与并行绘图在首次访问时才导入，import abn_qss_demo 不加载
+# asyncio / multiprocessing（PEP 562 模块级 __getattr__）
+_LAZY_IMPORTS = {
+    "MetabolicIngestService": ".metabolic_service",
+    "BatchChartRenderer": ".rendering",
+    "render_charts_parallel": ".rendering",
+    "HybridScheduler": ".scheduler",
+    "SerialBackend": ".scheduler",
+    "ThreadPoolBackend": ".scheduler",
+    "ProcessPoolBackend": ".scheduler",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __version__ = "0.1.0"
 __author__ = "ABN-QSS Team"
@@ -0,0 +1,180 @@
+"""
+告警引擎 - 按患者跟踪告警状态，只在进入/解除告警时输出事件
+
+与逐样本重建提醒字符串列表的 _generate_insights 不同，AlertEngine 为每个槽位（患者）保存各告警的
+当前状态：进入与解除使用不同阈值（迟滞），条件须连续满足 debounce 个样本才切换（去抖），
+状态不变时不输出任何内容。事件以紧凑的数值代码表示，可批量输出为结构化数组。
+"""
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+
+
+class AlertCode(IntEnum):
+    """告警代码；状态位掩码中代码 c 对应第 c - 1 位"""
+    DEVIATION = 1   # 显著生理偏离
+    METABOLIC = 2   # 代谢状态异常
+
+
+ALERT_MESSAGES: Dict[AlertCode, Tuple[str, str]] = {
+    AlertCode.DEVIATION: ("⚠️ 系统检测到显著生理偏离，建议适当休息", "✅ 生理偏离已恢复"),
+    AlertCode.METABOLIC: ("🔍 代谢状态异常，建议关注血糖水平", "✅ 代谢状态恢复正常"),
+}
+
+# 批量事件：槽位、告警代码、进入 (True) / 解除 (False)
+ALERT_EVENT_DTYPE = np.dtype([("slot", "<i8"), ("code", "u1"), ("active", "?")])
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+class AlertEvent(NamedTuple):
+    """单个告警状态切换"""
+    slot: int
+    code: AlertCode
+    active: bool
+
+    @property
+    def message(self) -> str:
+        entered, cleared = ALERT_MESSAGES[self.code]
+        return entered if self.active else cleared
+
+
+class AlertEngine:
+    """增量告警引擎
+
+    偏离告警在 deviation_score > deviation_enter 时进入，≤ deviation_exit 时解除；
+    代谢告警在 metabolic_rate 落在 (metabolic_low, metabolic_high) 之外时进入，
+    回到 (metabolic_low + metabolic_margin, metabolic_high - metabolic_margin) 之内时解除。
+    deviation_exit = deviation_enter、metabolic_margin = 0、debounce = 1 时与 _generate_insights 的判定一致。
+    NaN 输入保持当前状态。
+    """
+
+    def __init__(self, deviation_enter: float = 0.15, deviation_exit: float = 0.12,
+                 metabolic_low: float = 0.9, metabolic_high: float = 1.1, metabolic_margin: float = 0.02,
+                 debounce: int = 1, initial_capacity: int = 1024):
+        if deviation_exit > deviation_enter:
+            raise ValueError("deviation_exit 不能大于 deviation_enter")
+        if metabolic_margin < 0 or metabolic_low + 2 * metabolic_margin >= metabolic_high:
+            raise ValueError("metabolic_margin 必须非负且小于正常区间的一半")
+        if debounce < 1:
+            raise ValueError("debounce 至少为 1")
+        self.deviation_enter = deviation_enter
+        self.deviation_exit = deviation_exit
+        self.metabolic_low = metabolic_low
+        self.metabolic_high = metabolic_high
+        self.metabolic_margin = metabolic_margin
+        self.debounce = debounce
+        capacity = max(1, initial_capacity)
+        self._active = np.zeros((capacity, len(AlertCode)), dtype=bool)
+        self._pending = np.zeros((capacity, len(AlertCode)), dtype=np.int32)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._active)
+
+    def _ensure_capacity(self, max_slot: int) -> None:
+        if max_slot < self.capacity:
+            return
+        new = self.capacity
+        while new <= max_slot:
+            new *= 2
+        active = np.zeros((new, len(AlertCode)), dtype=bool)
+        pending = np.zeros((new, len(AlertCode)), dtype=np.int32)
+        active[:self.capacity] = self._active
+        pending[:self.capacity] = self._pending
+        self._active, self._pending = active, pending
+
+    def _conditions(self, deviation: np.ndarray, rate: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """返回 (进入条件, 解除条件)，形状均为 (样本数, 告警数)"""
+        enter = np.empty((len(deviation), len(AlertCode)), dtype=bool)
+        leave = np.empty_like(enter)
+        enter[:, 0] = deviation > self.deviation_enter
+        leave[:, 0] = deviation <= self.deviation_exit
+        enter[:, 1] = (rate <= self.metabolic_low) | (rate >= self.metabolic_high)
+        leave[:, 1] = (rate > self.metabolic_low + self.metabolic_margin) & \
+                      (rate < self.metabolic_high - self.metabolic_margin)
+        return enter, leave
+
+    def update(self, deviation_score: ArrayLike, metabolic_rate: ArrayLike,
+               slots: Optional[ArrayLike] = None) -> np.ndarray:
+        """处理一个时刻的一批患者（slots 不得重复，省略时为 0..n-1），返回本次切换的事件数组"""
+        deviation = np.asarray(deviation_score, dtype=np.float64)
+        rate = np.asarray(metabolic_rate, dtype=np.float64)
+        if deviation.shape != rate.shape:
+            raise ValueError("deviation_score 与 metabolic_rate 长度不一致")
+        slots = np.arange(len(deviation)) if slots is None else np.asarray(slots, dtype=np.intp)
+        if len(slots) != len(deviation):
+            raise ValueError(f"槽位数 {len(slots)} 与样本数 {len(deviation)} 不一致")
+        if len(slots) == 0:
+            return np.empty(0, dtype=ALERT_EVENT_DTYPE)
+        self._ensure_capacity(int(slots.max()))
+
+        enter, leave = self._conditions(deviation, rate)
+        active = self._active[slots]
+        flip = np.where(active, leave, enter)
+        pending = np.where(flip, self._pending[slots] + 1, 0)
+        fire = pending >= self.debounce
+        if fire.any():
+            active ^= fire
+            pending[fire] = 0
+            self._active[slots] = active
+        self._pending[slots] = pending
+
+        rows, cols = np.nonzero(fire)
+        events = np.empty(len(rows), dtype=ALERT_EVENT_DTYPE)
+        events["slot"] = slots[rows]
+        events["code"] = cols + 1
+        events["active"] = active[rows, cols]
+        return events
+
+    def update_one(self, slot: int, deviation_score: float, metabolic_rate: float) -> List[AlertEvent]:
+        """单个样本的标量快速路径，与 update 的判定一致"""
+        self._ensure_capacity(slot)
+        low, high, margin = self.metabolic_low, self.metabolic_high, self.metabolic_margin
+        conditions = (
+            (deviation_score > self.deviation_enter, deviation_score <= self.deviation_exit),
+            (metabolic_rate <= low or metabolic_rate >= high, low + margin < metabolic_rate < high - margin),
+        )
+        active_row, pending_row = self._active[slot], self._pending[slot]
+        events = []
+        for col, (enter, leave) in enumerate(conditions):
+            active = bool(active_row[col])
+            if not (leave if active else enter):
+                pending_row[col] = 0
+                continue
+            pending = pending_row[col] + 1
+            if pending >= self.debounce:
+                active_row[col] = not active
+                pending = 0
+                events.append(AlertEvent(slot, AlertCode(col + 1), not active))
+            pending_row[col] = pending
+        return events
+
+    def active_codes(self, slots: Optional[ArrayLike] = None) -> np.ndarray:
+        """各槽位当前告警的位掩码（uint8），0 表示无告警"""
+        active = self._active if slots is None else self._active[np.asarray(slots, dtype=np.intp)]
+        weights = (1 << np.arange(len(AlertCode))).astype(np.uint8)
+        return (active * weights).sum(axis=1, dtype=np.uint8)
+
+    def active_alerts(self, slot: int) -> List[AlertCode]:
+        """某个槽位当前处于告警状态的代码"""
+        if slot >= self.capacity:
+            return []
+        return [AlertCode(col + 1) for col in np.flatnonzero(self._active[slot])]
+
+    def reset(self, slots: Optional[ArrayLike] = None) -> None:
+        """清除状态（槽位被新患者复用时调用），省略 slots 时清除全部"""
+        if slots is None:
+            self._active[:] = False
+            self._pending[:] = 0
+            return
+        slots = np.asarray(slots, dtype=np.intp)
+        slots = slots[slots < self.capacity]
+        self._active[slots] = False
+        self._pending[slots] = 0
+
+
+def events_to_list(events: np.ndarray) -> List[AlertEvent]:
+    """把事件数组转换为 AlertEvent 列表"""
+    return [AlertEvent(int(slot), AlertCode(int(code)), bool(active))
+            for slot, code, active in zip(events["slot"], events["code"], events["active"])]
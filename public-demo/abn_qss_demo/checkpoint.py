@@ -0,0 +1,38 @@
+"""
+断点续算 - 长时间筛选任务的检查点文件
+
+检查点是单个 .npz 文件：meta 成员保存 JSON 元数据（任务参数、已完成进度、随机流状态），
+其余成员保存当前 top-k 等数组。写入时先写临时文件再 os.replace，崩溃时磁盘上总是上一个完整检查点。
+"""
+import json
+import os
+from typing import Dict, Tuple
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, meta: Dict, arrays: Dict[str, np.ndarray]) -> None:
+    """原子写入检查点"""
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    payload = dict(meta, version=CHECKPOINT_VERSION)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, meta=np.frombuffer(json.dumps(payload).encode("utf-8"), dtype=np.uint8), **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, kind: str) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """读取检查点，kind 与记录的任务类型不符时抛出 ValueError"""
+    with np.load(os.fspath(path)) as data:
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+    if meta.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"不支持的检查点版本: {meta.get('version')}")
+    if meta.get("kind") != kind:
+        raise ValueError(f"检查点类型不符: {meta.get('kind')} != {kind}")
+    return meta, arrays
@@ -0,0 +1,174 @@
+"""
+群体监测模块 - 以列式基线表同时监测大量佩戴者
+"""
+from typing import Dict, List, Optional, Any, Hashable, Sequence, Union
+import numpy as np
+
+from .health_monitoring import (
+    SENSOR_CHANNELS, MetabolicMirror, _DERIVED_KEYS, _as_columns, _batch_harmony
+)
+from .alerts import AlertEngine
+from .instrumentation import instrumented
+
+
+class CohortMonitor:
+    """群体监测器：所有患者的基线存放在一张 (槽位, 通道) 的共享数组表中
+
+    基线表中的 NaN 表示该患者的基线缺少此通道。删除患者只释放槽位，
+    新患者优先复用空闲槽位，容量不足时按倍数扩容，不会重建整张表。
+    每个槽位另记录该患者基线字典的键顺序，偏离度按此顺序逐列累加，
+    因此每个患者的结果与以其基线单独调用 real_time_monitoring 逐位一致。
+    配置 alert_engine 时按槽位跟踪告警状态，monitor_tick 额外返回 alert_events（只含状态切换）。
+    """
+
+    def __init__(self, channels: Sequence[str] = SENSOR_CHANNELS, initial_capacity: int = 1024,
+                 alert_engine: Optional[AlertEngine] = None):
+        self.channels = tuple(channels)
+        self._channel_index = {name: i for i, name in enumerate(self.channels)}
+        capacity = max(1, initial_capacity)
+        self._baselines = np.full((capacity, len(self.channels)), np.nan)
+        self._orders = np.tile(np.arange(len(self.channels), dtype=np.intp), (capacity, 1))
+        self._active = np.zeros(capacity, dtype=bool)
+        self._slot_ids: List[Optional[Hashable]] = [None] * capacity
+        self._index: Dict[Hashable, int] = {}
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self.alert_engine = alert_engine
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, patient_id: Hashable) -> bool:
+        return patient_id in self._index
+
+    @property
+    def capacity(self) -> int:
+        """基线表当前容量（槽位数）"""
+        return len(self._active)
+
+    @property
+    def patient_ids(self) -> List[Hashable]:
+        """按槽位顺序排列的在册患者，即 monitor_tick 默认的读数顺序"""
+        return [self._slot_ids[slot] for slot in np.flatnonzero(self._active)]
+
+    def add_patient(self, patient_id: Hashable, baseline_data: Dict) -> int:
+        """登记患者基线，返回其槽位；已登记的患者会被覆盖基线"""
+        row = np.full(len(self.channels), np.nan)
+        order = []
+        for key, value in baseline_data.items():
+            if key in _DERIVED_KEYS:
+                continue
+            if key not in self._channel_index:
+                raise ValueError(f"未知通道: {key}")
+            row[self._channel_index[key]] = value
+            order.append(self._channel_index[key])
+        # 基线中没有的通道排在最后，其基线为 NaN，不参与累加
+        order.extend(i for i in range(len(self.channels)) if i not in order)
+
+        slot = self._index.get(patient_id)
+        if slot is None:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+            if self.alert_engine is not None:
+                self.alert_engine.reset([slot])
+            self._index[patient_id] = slot
+            self._slot_ids[slot] = patient_id
+            self._active[slot] = True
+        self._baselines[slot] = row
+        self._orders[slot] = order
+        return slot
+
+    def remove_patient(self, patient_id: Hashable) -> None:
+        """移除患者并释放其槽位"""
+        slot = self._index.pop(patient_id, None)
+        if slot is None:
+            raise KeyError(f"患者不存在: {patient_id}")
+        self._baselines[slot] = np.nan
+        self._active[slot] = False
+        self._slot_ids[slot] = None
+        self._free.append(slot)
+
+    def slots(self, patient_ids: Sequence[Hashable]) -> np.ndarray:
+        """把患者 id 转换为槽位数组；患者集合不变时可缓存后传给 monitor_tick"""
+        try:
+            return np.array([self._index[pid] for pid in patient_ids], dtype=np.intp)
+        except KeyError as e:
+            raise KeyError(f"患者不存在: {e.args[0]}") from None
+
+    def patient_at(self, slot: int) -> Optional[Hashable]:
+        """槽位上的患者 id（空闲槽位为 None），用于解析告警事件的 slot"""
+        return self._slot_ids[slot]
+
+    def baseline(self, patient_id: Hashable) -> Dict[str, float]:
+        """取回某个患者的基线（按登记时的键顺序，省略缺失通道）"""
+        slot = self.slots([patient_id])[0]
+        row = self._baselines[slot]
+        return {self.channels[i]: float(row[i]) for i in self._orders[slot] if not np.isnan(row[i])}
+
+    @instrumented(items=lambda result: len(result["deviation_score"]))
+    def monitor_tick(self, readings: Union[Dict[str, Any], np.ndarray],
+                     patient_ids: Optional[Sequence[Hashable]] = None,
+                     slots: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """一次数组运算处理一个时刻所有患者的读数
+
+        readings 为 {通道: 数组} 字典或 (患者数, 通道数) 二维数组（列顺序为 self.channels）。
+        行顺序由 slots 或 patient_ids 指定，两者都省略时对应 self.patient_ids。
+        """
+        if slots is None:
+            slots = self.slots(patient_ids) if patient_ids is not None else np.flatnonzero(self._active)
+        slots = np.asarray(slots, dtype=np.intp)
+
+        columns = _as_columns(readings, self.channels)
+        n = len(slots)
+        if any(len(column) != n for column in columns.values()):
+            raise ValueError(f"读数行数与患者数 {n} 不一致")
+
+        table = self._baselines[slots]
+        baseline = {name: table[:, i] for i, name in enumerate(self.channels)}
+
+        deviation_score = self._ordered_deviation(table, self._orders[slots], columns, n)
+        system_harmony = _batch_harmony(deviation_score)
+        metabolic = MetabolicMirror._batch_metabolic_state(baseline, columns, n)
+
+        result = {
+            "deviation_score": deviation_score,
+            "system_harmony": system_harmony,
+            "metabolic_rate": metabolic["metabolic_rate"],
+            "metabolic_state": metabolic["state"],
+            "health_status": np.where(system_harmony > 0.8, "optimal", "suboptimal")
+        }
+        if self.alert_engine is not None:
+            result["alert_events"] = self.alert_engine.update(deviation_score, metabolic["metabolic_rate"], slots)
+        return result
+
+    def _ordered_deviation(self, table: np.ndarray, orders: np.ndarray,
+                           columns: Dict[str, np.ndarray], n: int) -> np.ndarray:
+        """向量化偏离度：第 k 步累加每行基线的第 k 个键，与 _calculate_deviation 的累加顺序逐位一致"""
+        missing = np.full(n, np.nan)
+        current = np.column_stack([columns.get(name, missing) for name in self.channels])
+        base = np.take_along_axis(table, orders, axis=1)
+        current = np.take_along_axis(current, orders, axis=1)
+        total = np.zeros(n)
+        count = np.zeros(n)
+        for k in range(len(self.channels)):
+            valid = ~np.isnan(current[:, k]) & ~np.isnan(base[:, k]) & (base[:, k] != 0)
+            deviation = np.abs(current[:, k] - base[:, k]) / np.where(valid, base[:, k], 1.0)
+            total = np.where(valid, total + deviation, total)
+            count += valid
+        return np.divide(total, count, out=np.zeros(n), where=count > 0)
+
+    def _grow(self) -> None:
+        """容量翻倍，已有槽位保持不变"""
+        old = self.capacity
+        new = old * 2
+        baselines = np.full((new, len(self.channels)), np.nan)
+        baselines[:old] = self._baselines
+        orders = np.tile(np.arange(len(self.channels), dtype=np.intp), (new, 1))
+        orders[:old] = self._orders
+        self._orders = orders
+        active = np.zeros(new, dtype=bool)
+        active[:old] = self._active
+        self._baselines = baselines
+        self._active = active
+        self._slot_ids.extend([None] * (new - old))
+        self._free.extend(range(new - 1, old - 1, -1))
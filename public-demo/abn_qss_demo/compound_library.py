@@ -0,0 +1,227 @@
+"""
+化合物库文件格式 - 列式二进制文件 + numpy.memmap 零拷贝读取
+
+文件布局（小端）：
+    8 字节魔数 b"ABNQCPL1" | 8 字节头部长度 | JSON 头部 | 按 64 字节对齐的各列数据块
+
+固定列：
+    compound_id  定长字节串 id
+    key          由 id 预先计算的 uint64 哈希键（对接、ADMET 打分直接使用）
+    id_order     按 id 排序的行号索引，用于 lookup 二分查找
+可选列：smiles（定长字节串）以及任意数量的 float64 描述符列。
+"""
+import csv
+import json
+import os
+import struct
+from typing import Dict, List, Optional, Any, Iterator, Sequence, Tuple, Union
+import numpy as np
+
+from .keyed_random import hash_ids
+
+MAGIC = b"ABNQCPL1"
+FORMAT_VERSION = 1
+_ALIGNMENT = 64
+_RESERVED_COLUMNS = ("compound_id", "key", "id_order", "smiles")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _layout(n: int, columns: List[Tuple[str, np.dtype]]) -> Tuple[bytes, Dict[str, Dict], int]:
+    """计算头部与各列偏移，返回 (头部字节, 列描述, 文件总长度)"""
+    specs = [{"name": name, "dtype": np.dtype(dtype).str, "offset": 0} for name, dtype in columns]
+    # 头部长度依赖偏移数字的位数，迭代到稳定为止
+    header = b""
+    while True:
+        offset = _align(len(MAGIC) + 8 + len(header))
+        for spec in specs:
+            spec["offset"] = offset
+            offset = _align(offset + n * np.dtype(spec["dtype"]).itemsize)
+        new_header = json.dumps({"version": FORMAT_VERSION, "n_compounds": n, "columns": specs}).encode("utf-8")
+        if len(new_header) == len(header):
+            return new_header, {spec["name"]: spec for spec in specs}, offset
+        header = new_header
+
+
+def _create(path: PathLike, n: int, columns: List[Tuple[str, np.dtype]]) -> Dict[str, np.memmap]:
+    """创建定长文件并返回各列的可写 memmap"""
+    header, specs, total = _layout(n, columns)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        f.truncate(max(total, 1))
+    return {
+        name: np.memmap(path, dtype=np.dtype(spec["dtype"]), mode="r+", offset=spec["offset"], shape=(n,))
+        for name, spec in specs.items()
+    } if n else {}
+
+
+def write_compound_library(path: PathLike, compound_ids: Sequence[str],
+                           descriptors: Optional[Dict[str, Sequence[float]]] = None,
+                           smiles: Optional[Sequence[str]] = None) -> "CompoundLibrary":
+    """把内存中的化合物数据写成库文件并打开"""
+    ids = np.char.encode(np.asarray(compound_ids, dtype=str), "utf-8")
+    descriptors = {name: np.asarray(values, dtype=np.float64) for name, values in (descriptors or {}).items()}
+    for name in descriptors:
+        if name in _RESERVED_COLUMNS:
+            raise ValueError(f"描述符名与保留列冲突: {name}")
+
+    columns = [("compound_id", ids.dtype), ("key", np.dtype("<u8")), ("id_order", np.dtype("<i8"))]
+    smiles_array = None
+    if smiles is not None:
+        smiles_array = np.char.encode(np.asarray(smiles, dtype=str), "utf-8")
+        columns.append(("smiles", smiles_array.dtype))
+    columns.extend((name, np.dtype("<f8")) for name in descriptors)
+
+    maps = _create(path, len(ids), columns)
+    if maps:
+        maps["compound_id"][:] = ids
+        maps["key"][:] = hash_ids(ids)
+        maps["id_order"][:] = np.argsort(ids, kind="stable")
+        if smiles_array is not None:
+            maps["smiles"][:] = smiles_array
+        for name, values in descriptors.items():
+            maps[name][:] = values
+        for column in maps.values():
+            column.flush()
+    return CompoundLibrary(path)
+
+
+def convert_text_library(source: PathLike, destination: PathLike, chunk_size: int = 100_000) -> "CompoundLibrary":
+    """把 CSV 文本库转换为库文件，两遍流式处理，内存占用与库大小无关
+
+    CSV 须有表头：compound_id 列（缺省取第一列）为 id，可选 smiles 列，其余列按 float 解析为描述符。
+    """
+    with open(source, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        id_col = header.index("compound_id") if "compound_id" in header else 0
+        smiles_col = header.index("smiles") if "smiles" in header else None
+        descriptor_cols = [i for i in range(len(header)) if i not in (id_col, smiles_col)]
+
+        n = id_width = smiles_width = 0
+        for row in reader:
+            n += 1
+            id_width = max(id_width, len(row[id_col].encode("utf-8")))
+            if smiles_col is not None:
+                smiles_width = max(smiles_width, len(row[smiles_col].encode("utf-8")))
+
+    columns = [("compound_id", np.dtype(f"S{max(id_width, 1)}")), ("key", np.dtype("<u8")),
+               ("id_order", np.dtype("<i8"))]
+    if smiles_col is not None:
+        columns.append(("smiles", np.dtype(f"S{max(smiles_width, 1)}")))
+    columns.extend((header[i], np.dtype("<f8")) for i in descriptor_cols)
+    maps = _create(destination, n, columns)
+
+    with open(source, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        start = 0
+        while start < n:
+            rows = [row for _, row in zip(range(chunk_size), reader)]
+            stop = start + len(rows)
+            ids = np.char.encode(np.asarray([row[id_col] for row in rows], dtype=str), "utf-8")
+            maps["compound_id"][start:stop] = ids
+            maps["key"][start:stop] = hash_ids(ids)
+            if smiles_col is not None:
+                maps["smiles"][start:stop] = [row[smiles_col].encode("utf-8") for row in rows]
+            for i in descriptor_cols:
+                maps[header[i]][start:stop] = [float(row[i]) for row in rows]
+            start = stop
+
+    if maps:
+        maps["id_order"][:] = np.argsort(maps["compound_id"], kind="stable")
+        for column in maps.values():
+            column.flush()
+    return CompoundLibrary(destination)
+
+
+class CompoundLibrary:
+    """只读化合物库：打开时只解析头部，各列以 numpy.memmap 按需零拷贝读取"""
+
+    def __init__(self, path: PathLike):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"不是化合物库文件: {self.path}")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"不支持的库文件版本: {header['version']}")
+
+        self.n_compounds: int = header["n_compounds"]
+        self._specs: Dict[str, Dict[str, Any]] = {spec["name"]: spec for spec in header["columns"]}
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.n_compounds
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 跨进程传递时只传路径与头部，由接收方重新映射，避免把整列数据序列化
+        state = self.__dict__.copy()
+        state["_columns"] = {}
+        return state
+
+    def __repr__(self) -> str:
+        return f"CompoundLibrary({self.path!r}, n_compounds={self.n_compounds})"
+
+    @property
+    def name(self) -> str:
+        """库名（文件名去掉扩展名）"""
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._specs)
+
+    @property
+    def descriptor_names(self) -> List[str]:
+        return [name for name in self._specs if name not in _RESERVED_COLUMNS]
+
+    def column(self, name: str) -> np.ndarray:
+        """取某一列的只读 memmap 视图"""
+        if name not in self._columns:
+            spec = self._specs.get(name)
+            if spec is None:
+                raise KeyError(f"列不存在: {name}")
+            if self.n_compounds == 0:
+                self._columns[name] = np.empty(0, dtype=np.dtype(spec["dtype"]))
+            else:
+                self._columns[name] = np.memmap(self.path, dtype=np.dtype(spec["dtype"]), mode="r",
+                                                offset=spec["offset"], shape=(self.n_compounds,))
+        return self._columns[name]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.column("compound_id")
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self.column("key")
+
+    def iter_chunks(self, chunk_size: int = 100_000, columns: Sequence[str] = ("compound_id", "key"),
+                    start: int = 0) -> Iterator[Dict[str, np.ndarray]]:
+        """从第 start 行起按块产出所请求列的切片视图（不复制数据）"""
+        maps = [(name, self.column(name)) for name in columns]
+        for start in range(start, self.n_compounds, chunk_size):
+            yield {name: column[start:start + chunk_size] for name, column in maps}
+
+    def lookup(self, compound_ids: Union[str, Sequence[str]]) -> Union[int, np.ndarray]:
+        """按 id 二分查找行号，找不到时抛出 KeyError"""
+        single = isinstance(compound_ids, str)
+        wanted = np.char.encode(np.atleast_1d(np.asarray(compound_ids, dtype=str)), "utf-8")
+        ids, order = self.ids, self.column("id_order")
+        rows = np.zeros(len(wanted), dtype=np.int64)
+        found = np.zeros(len(wanted), dtype=bool)
+        if len(order):
+            pos = np.minimum(np.searchsorted(ids, wanted, sorter=order), len(order) - 1)
+            rows = np.asarray(order[pos])
+            found = ids[rows] == wanted
+        if not found.all():
+            raise KeyError(f"化合物不存在: {wanted[~found][0].decode('utf-8')}")
+        return int(rows[0]) if single else np.asarray(rows)
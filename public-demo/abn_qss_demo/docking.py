@@ -0,0 +1,181 @@
+"""
+化合物库级分子对接筛选 - 分块流式打分 + 有界 top-k
+"""
+import os
+from itertools import islice
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple, Union
+import numpy as np
+
+from .checkpoint import load_checkpoint, save_checkpoint
+from .compound_library import CompoundLibrary
+from .keyed_random import hash_ids, keyed_uniform
+from .result_sink import ResultSink
+from .results import DockedCompound
+from .selection import select_top_k
+
+CompoundSource = Union[CompoundLibrary, str, "os.PathLike[str]", Iterable[str]]
+
+
+DOCKING_CHECKPOINT_KIND = "docking_screen"
+
+
+def iter_compound_chunks(source: CompoundSource, chunk_size: int,
+                         skip: int = 0) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """把化合物来源切成 (定长字节串 id, uint64 键) 数组块，跳过前 skip 个化合物
+
+    source 可以是 CompoundLibrary（直接读取 memmap 中的 id 与预计算键，不复制数据）、
+    文本文件路径（每行一个 id，逗号分隔时取第一列）或 id 的可迭代对象。
+    """
+    if isinstance(source, CompoundLibrary):
+        for chunk in source.iter_chunks(chunk_size, start=skip):
+            yield chunk["compound_id"], chunk["key"]
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            lines = (line.split(",", 1)[0].strip() for line in f)
+            yield from iter_compound_chunks((line for line in lines if line), chunk_size, skip)
+        return
+
+    iterator = islice(source, skip, None)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        ids = np.char.encode(np.asarray(chunk, dtype=str), "utf-8")
+        yield ids, hash_ids(ids)
+
+
+def score_compounds(keys: np.ndarray, seed: int = 0) -> Dict[str, np.ndarray]:
+    """按化合物键向量化地计算对接结果，每个化合物的分数只取决于其 id 与 seed"""
+    base_score = 0.1 + 0.7 * keyed_uniform(keys, seed, 0)
+    quantum_boost = 0.05 + 0.10 * keyed_uniform(keys, seed, 1)
+    return {
+        "docking_score": np.round(base_score + quantum_boost, 3),
+        "quantum_enhancement": np.round(quantum_boost, 3),
+        "binding_affinity_nm": 1 + 99 * keyed_uniform(keys, seed, 2),
+        "drug_likeness": np.round(0.6 + 0.35 * keyed_uniform(keys, seed, 3), 3)
+    }
+
+
+def stream_docking_screen(target_pdb: str, compounds: CompoundSource, top_k: int = 5,
+                          chunk_size: int = 100_000, seed: int = 0, library_name: Optional[str] = None,
+                          as_records: bool = False, sink: Optional[ResultSink] = None,
+                          checkpoint: Optional[str] = None, checkpoint_every: int = 10) -> Dict:
+    """流式对接筛选：逐块打分，只保留当前 top-k，峰值内存与库大小无关
+
+    排名语义与 quantum_docking_screen 的 sort(reverse=True)[:top_k] 一致：
+    按对接分数降序，平分时库中靠前的化合物优先；结果与 chunk_size 无关。
+    as_records=True 时 top_compounds 为 DockedCompound 列表（binding_affinity 为 nM 数值）。
+    传入 sink 时每块的 id 与全部打分列都写入 sink（一块一个行组）。
+    传入 checkpoint 时每处理 checkpoint_every 块原子写入一次检查点，可用 resume_docking_screen 续算。
+    """
+    if sink is not None and checkpoint is not None:
+        raise ValueError("sink 与 checkpoint 不能同时使用")
+    if library_name is None:
+        if isinstance(compounds, CompoundLibrary):
+            library_name = compounds.name
+        elif isinstance(compounds, (str, os.PathLike)):
+            library_name = os.fspath(compounds)
+        else:
+            library_name = "<stream>"
+    state = {
+        "kind": DOCKING_CHECKPOINT_KIND,
+        "target": target_pdb,
+        "library": library_name,
+        "source": _describe_source(compounds),
+        "top_k": top_k,
+        "chunk_size": chunk_size,
+        "seed": seed,
+        "checkpoint_every": checkpoint_every,
+        "n_screened": 0,
+        "complete": False,
+    }
+    top = (np.empty(0), np.empty(0, dtype=np.int64), np.empty(0, dtype="S1"))
+    return _dock_from(compounds, state, top, as_records, sink, checkpoint)
+
+
+def _describe_source(compounds: CompoundSource) -> Dict:
+    """记录续算时重新打开来源所需的信息；迭代器来源无法重新打开"""
+    if isinstance(compounds, CompoundLibrary):
+        return {"type": "library", "path": os.path.abspath(compounds.path)}
+    if isinstance(compounds, (str, os.PathLike)):
+        return {"type": "text", "path": os.path.abspath(os.fspath(compounds))}
+    return {"type": "stream", "path": None}
+
+
+def resume_docking_screen(checkpoint: str, compounds: Optional[CompoundSource] = None,
+                          as_records: bool = False) -> Dict:
+    """从检查点继续对接筛选，结果与不中断运行一致
+
+    来源为库文件或文本文件时自动重新打开；迭代器来源须重新传入同一序列（从头开始，已处理部分会被跳过）。
+    """
+    state, arrays = load_checkpoint(checkpoint, DOCKING_CHECKPOINT_KIND)
+    if compounds is None:
+        source = state["source"]
+        if source["type"] == "stream":
+            raise ValueError("检查点的化合物来源是迭代器，续算时须传入 compounds")
+        compounds = CompoundLibrary(source["path"]) if source["type"] == "library" else source["path"]
+    top = (arrays["top_scores"], arrays["top_order"], arrays["top_ids"])
+    return _dock_from(compounds, state, top, as_records, None, checkpoint)
+
+
+def _dock_from(compounds: CompoundSource, state: Dict, top: Tuple[np.ndarray, np.ndarray, np.ndarray],
+               as_records: bool, sink: Optional[ResultSink], checkpoint: Optional[str]) -> Dict:
+    """从 state["n_screened"] 个化合物之后继续打分；top 为此前的 (分数, 序号, id)"""
+    top_scores, top_order, top_ids = top
+    top_k, seed = state["top_k"], state["seed"]
+    n_screened = state["n_screened"]
+    chunks_done = 0
+
+    def save() -> None:
+        state["n_screened"] = n_screened
+        save_checkpoint(checkpoint, state, {"top_scores": top_scores, "top_order": top_order, "top_ids": top_ids})
+
+    for ids, keys in iter_compound_chunks(compounds, state["chunk_size"], skip=n_screened):
+        fields = score_compounds(keys, seed)
+        scores = fields["docking_score"]
+        if sink is not None:
+            sink.append({"compound_id": ids, **fields})
+        order = np.arange(n_screened, n_screened + len(ids))
+        n_screened += len(ids)
+
+        all_scores = np.concatenate([top_scores, scores])
+        all_order = np.concatenate([top_order, order])
+        all_ids = np.concatenate([top_ids, ids])
+        keep = select_top_k(all_scores, all_order, top_k)
+        top_scores, top_order, top_ids = all_scores[keep], all_order[keep], all_ids[keep]
+        chunks_done += 1
+        if checkpoint is not None and chunks_done % state["checkpoint_every"] == 0:
+            save()
+
+    if checkpoint is not None:
+        state["complete"] = True
+        save()
+    return {
+        "target": state["target"],
+        "library": state["library"],
+        "top_compounds": docked_compounds(top_ids, seed) if as_records else _compound_dicts(top_ids, seed),
+        "n_screened": n_screened,
+        "quantum_improvement": "15-25% accuracy enhancement"
+    }
+
+
+def docked_compounds(ids: np.ndarray, seed: int) -> List[DockedCompound]:
+    """把入选化合物展开为 DockedCompound"""
+    fields = score_compounds(hash_ids(ids), seed)
+    return [
+        DockedCompound(
+            compound_id=compound_id.decode("utf-8"),
+            docking_score=float(fields["docking_score"][i]),
+            quantum_enhancement=float(fields["quantum_enhancement"][i]),
+            binding_affinity=float(fields["binding_affinity_nm"][i]),
+            drug_likeness=float(fields["drug_likeness"][i])
+        )
+        for i, compound_id in enumerate(ids.tolist())
+    ]
+
+
+def _compound_dicts(ids: np.ndarray, seed: int) -> List[Dict]:
+    """把入选化合物展开为与 quantum_docking_screen 相同风格的字典"""
+    return [compound.to_dict() for compound in docked_compounds(ids, seed)]
@@ -1,16 +1,24 @@
 """
 字体配置工具 - 解决Matplotlib中文显示问题
+
+matplotlib 只在首次绘图时才导入，字体探测结果会被缓存，
+因此导入本模块（以及 abn_qss_demo 包）不会触发任何绘图后端初始化。
 """
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+import functools
+import logging
 import platform
 import os
+from typing import Optional
 
-def setup_chinese_font():
-    """
-    配置Matplotlib中文字体支持
-    自动检测系统并设置合适的中文字体
-    """
+from .log_utils import log_event
+
+logger = logging.getLogger(__name__)
+
+_font_configured: Optional[bool] = None
+
+@functools.lru_cache(maxsize=None)
+def find_chinese_font() -> Optional[str]:
+    """探测当前系统可用的中文字体文件，结果缓存，只探测一次"""
     # 获取系统类型
     system = platform.system()
     
@@ -33,31 +41,49 @@ def setup_chinese_font():
     }
     
     # 尝试找到可用的中文字体
-    available_font = None
     for font_path in font_paths.get(system, []):
         if os.path.exists(font_path):
-            available_font = font_path
-            break
+            return font_path
+    return None
+
+def setup_chinese_font(force: bool = False) -> bool:
+    """
+    配置Matplotlib中文字体支持
+    自动检测系统并设置合适的中文字体；已配置过时直接返回缓存结果
+    """
+    global _font_configured
+    if _font_configured is not None and not force:
+        return _font_configured
     
+    # 只修改全局 rcParams，不导入 pyplot，无界面节点上也不会初始化 GUI 后端
+    import matplotlib
+    import matplotlib.font_manager as fm
+    
+    available_font = find_chinese_font()
     if available_font:
         # 设置字体
+        fm.fontManager.addfont(available_font)
         chinese_font = fm.FontProperties(fname=available_font)
-        plt.rcParams['font.family'] = chinese_font.get_name()
-        plt.rcParams['axes.unicode_minus'] = False  # 正确显示负号
+        matplotlib.rcParams['font.family'] = chinese_font.get_name()
+        matplotlib.rcParams['axes.unicode_minus'] = False  # 正确显示负号
         
-        print(f"✅ 中文字体设置成功: {available_font}")
-        return True
+        log_event(logger, logging.INFO, "font.configured", "中文字体设置成功: %s", available_font,
+                  font=available_font)
+        _font_configured = True
     else:
         # 如果没有找到系统字体，使用Matplotlib的默认设置
-        plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial Unicode MS', 'SimHei']
-        plt.rcParams['axes.unicode_minus'] = False
-        print("⚠️  使用备用字体配置，中文显示可能不完美")
-        return False
+        matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial Unicode MS', 'SimHei']
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        log_event(logger, logging.WARNING, "font.fallback", "使用备用字体配置，中文显示可能不完美")
+        _font_configured = False
+    return _font_configured
 
 def safe_plot_with_chinese(title, xlabel, ylabel, plot_function, **kwargs):
     """
     安全绘图函数 - 自动处理中文显示
     """
+    import matplotlib.pyplot as plt
+    
     # 设置中文字体
     setup_chinese_font()
     
@@ -80,6 +106,3 @@ def safe_plot_with_chinese(title, xlabel, ylabel, plot_function, **kwargs):
         plt.tight_layout()
     
     plt.show()
-
-# 初始化字体配置
-setup_chinese_font()
@@ -1,6 +1,70 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Union
 import numpy as np
 
+from .alerts import AlertEngine
+from .instrumentation import instrumented
+
+# 健康模块使用的传感器通道（二维数据块的默认列顺序）
+SENSOR_CHANNELS = ("heart_rate", "hrv", "blood_oxygen", "skin_conductance", "temperature", "impedance")
+
+# 基线中由系统派生、不参与偏离度计算的字段
+_DERIVED_KEYS = ('resilience_score', 'harmony_index', 'status')
+
+
+def _as_columns(samples: Union[Dict[str, Any], np.ndarray],
+                channels: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """把列式数据块统一转换为 {通道: float64 数组}，NaN 表示该样本缺少此通道
+
+    结构化数组（如 decode_frames 的帧数组）按字段名取出 channels（默认 SENSOR_CHANNELS）中存在的通道。
+    """
+    if isinstance(samples, dict):
+        columns = {key: np.asarray(value, dtype=np.float64) for key, value in samples.items()}
+    elif isinstance(samples, np.ndarray) and samples.dtype.names is not None:
+        names = tuple(channels) if channels is not None else SENSOR_CHANNELS
+        columns = {name: samples[name].astype(np.float64) for name in names if name in samples.dtype.names}
+    else:
+        block = np.asarray(samples, dtype=np.float64)
+        if block.ndim != 2:
+            raise ValueError("数据块必须是二维数组 (样本数, 通道数)")
+        names = tuple(channels) if channels is not None else SENSOR_CHANNELS
+        if block.shape[1] != len(names):
+            raise ValueError(f"数据块列数 {block.shape[1]} 与通道数 {len(names)} 不一致")
+        columns = {name: block[:, i] for i, name in enumerate(names)}
+
+    shapes = {column.shape for column in columns.values()}
+    if len(shapes) > 1 or any(len(shape) != 1 for shape in shapes):
+        raise ValueError("各通道必须是等长的一维数组")
+    return columns
+
+
+def _column_length(columns: Dict[str, np.ndarray]) -> int:
+    """列式数据块的样本数"""
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def _batch_deviation(baseline: Dict[str, Any], columns: Dict[str, np.ndarray], n: int) -> np.ndarray:
+    """向量化偏离度：与 _calculate_deviation 按相同的键顺序逐列累加，结果逐位一致
+
+    基线值可以是标量，也可以是逐样本数组（NaN 表示该样本的基线缺少此通道）。
+    """
+    total = np.zeros(n)
+    count = np.zeros(n)
+    for key, baseline_val in baseline.items():
+        if key in _DERIVED_KEYS or key not in columns:
+            continue
+        base = np.asarray(baseline_val, dtype=np.float64)
+        current = columns[key]
+        valid = ~np.isnan(current) & ~np.isnan(base) & (base != 0)
+        deviation = np.abs(current - base) / np.where(valid, base, 1.0)
+        total = np.where(valid, total + deviation, total)
+        count += valid
+    return np.divide(total, count, out=np.zeros(n), where=count > 0)
+
+
+def _batch_harmony(deviation_score: np.ndarray) -> np.ndarray:
+    """向量化系统和谐度"""
+    return 1.0 / (1.0 + deviation_score * 10)
+
 class MetabolicMirror:
     """代谢镜像：无创代谢监测系统"""
     
@@ -11,6 +75,7 @@ class MetabolicMirror:
         """设置代谢基线"""
         self.metabolic_baseline = baseline_data
         
+    @instrumented()
     def analyze_metabolic_state(self, current_data: Dict) -> Dict:
         """分析当前代谢状态"""
         if self.metabolic_baseline is None:
@@ -27,8 +92,37 @@ class MetabolicMirror:
             "state": "normal" if 0.9 < metabolic_rate < 1.1 else "abnormal",
             "confidence": 0.85
         }
+
+    @instrumented(items=lambda result: len(result["metabolic_rate"]))
+    def batch_analyze_metabolic_state(self, samples: Union[Dict[str, Any], np.ndarray],
+                                      channels: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """批量分析代谢状态（列式输入），与 analyze_metabolic_state 逐样本结果一致"""
+        if self.metabolic_baseline is None:
+            raise ValueError("请先设置代谢基线")
+        columns = _as_columns(samples, channels)
+        return self._batch_metabolic_state(self.metabolic_baseline, columns, _column_length(columns))
+
+    @staticmethod
+    def _batch_metabolic_state(baseline: Dict[str, Any], columns: Dict[str, np.ndarray],
+                               n: int) -> Dict[str, np.ndarray]:
+        """向量化代谢状态核心，缺失的通道（或 NaN）按 1 处理"""
+        ratios = []
+        for key in ('impedance', 'heart_rate'):
+            current = columns.get(key)
+            current = np.ones(n) if current is None else np.where(np.isnan(current), 1.0, current)
+            base = np.asarray(baseline.get(key, 1), dtype=np.float64)
+            ratios.append(current / np.where(np.isnan(base), 1.0, base))
+
+        metabolic_rate = (ratios[0] + ratios[1]) / 2
+        normal = (metabolic_rate > 0.9) & (metabolic_rate < 1.1)
+        return {
+            "metabolic_rate": metabolic_rate,
+            "state": np.where(normal, "normal", "abnormal"),
+            "confidence": np.full(n, 0.85)
+        }
     
     @staticmethod
+    @instrumented()
     def non_invasive_metabolic_analysis(current_data: Dict) -> Dict:
         """无创代谢分析"""
         glucose_value = 95 + (current_data.get('heart_rate', 72) - 72) * 0.5
@@ -44,13 +138,39 @@ class MetabolicMirror:
             "metabolic_flexibility": 0.85
         }
 
+    @staticmethod
+    @instrumented(items=lambda result: len(result["glucose_value"]))
+    def batch_non_invasive_metabolic_analysis(samples: Union[Dict[str, Any], np.ndarray],
+                                              channels: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """批量无创代谢分析（列式输出），缺失的通道（或 NaN）按默认值处理"""
+        columns = _as_columns(samples, channels)
+        n = _column_length(columns)
+
+        def _column(key: str, default: float) -> np.ndarray:
+            values = columns.get(key)
+            return np.full(n, default) if values is None else np.where(np.isnan(values), default, values)
+
+        glucose_value = 95 + (_column('heart_rate', 72) - 72) * 0.5
+        lactate_level = 1.2 + (_column('skin_conductance', 2.5) - 2.5) * 0.1
+
+        return {
+            "glucose_value": glucose_value,
+            "glucose_trend": np.where((glucose_value >= 70) & (glucose_value <= 110), "stable", "variable"),
+            "lactate_level": lactate_level,
+            "ketone_bodies": np.full(n, 0.3),
+            "metabolic_flexibility": np.full(n, 0.85)
+        }
+
 class HealthMonitoringSystem:
     """健康监测系统：自平衡计算网络生理分析"""
     
-    def __init__(self):
+    def __init__(self, alert_engine: Optional[AlertEngine] = None):
         self.baseline = None
         self.metabolic_mirror = MetabolicMirror()
+        # 配置后 real_time_monitoring 额外返回 alert_events：只包含本样本引起的告警切换
+        self.alert_engine = alert_engine
         
+    @instrumented()
     def initialize_baseline(self, baseline_data: Dict) -> Dict:
         """建立健康基线"""
         self.baseline = baseline_data
@@ -67,6 +187,7 @@ class HealthMonitoringSystem:
             "status": "baseline_established"
         }
         
+    @instrumented()
     def real_time_monitoring(self, current_data: Dict) -> Dict:
         """实时监测当前生理状态"""
         if self.baseline is None:
@@ -82,13 +203,45 @@ class HealthMonitoringSystem:
         # 生成洞察提醒
         metastable_alerts = self._generate_insights(deviation_score, metabolic_analysis)
         
-        return {
+        result = {
             "deviation_score": deviation_score,
             "system_harmony": system_harmony,
             "metabolic_analysis": metabolic_analysis,
             "metastable_alerts": metastable_alerts,
             "health_status": "optimal" if system_harmony > 0.8 else "suboptimal"
         }
+        if self.alert_engine is not None:
+            result["alert_events"] = self.alert_engine.update_one(
+                0, deviation_score, metabolic_analysis["metabolic_rate"])
+        return result
+
+    @instrumented(items=lambda result: len(result["deviation_score"]))
+    def batch_monitoring(self, samples: Union[Dict[str, Any], np.ndarray],
+                         channels: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """批量监测：一次向量化处理一整块样本
+
+        samples 可以是 {通道: 等长数组} 的字典、(样本数, 通道数) 的二维数组（列顺序由 channels 指定，
+        默认 SENSOR_CHANNELS），或按通道名取字段的结构化数组（如 decode_frames 的帧数组）。
+        NaN 视为该样本缺少此通道。
+        每个样本的结果与 real_time_monitoring 逐个调用完全一致。
+        """
+        if self.baseline is None:
+            raise ValueError("请先调用 initialize_baseline 初始化基线")
+
+        columns = _as_columns(samples, channels)
+        n = _column_length(columns)
+
+        deviation_score = _batch_deviation(self.baseline, columns, n)
+        system_harmony = _batch_harmony(deviation_score)
+        metabolic = MetabolicMirror._batch_metabolic_state(self.metabolic_mirror.metabolic_baseline, columns, n)
+
+        return {
+            "deviation_score": deviation_score,
+            "system_harmony": system_harmony,
+            "metabolic_rate": metabolic["metabolic_rate"],
+            "metabolic_state": metabolic["state"],
+            "health_status": np.where(system_harmony > 0.8, "optimal", "suboptimal")
+        }
         
     def _calculate_resilience(self, data: Dict) -> float:
         """计算系统韧性分数"""
@@ -111,7 +264,7 @@ class HealthMonitoringSystem:
         total_deviation = 0
         count = 0
         for key in self.baseline:
-            if key in current_data and key not in ['resilience_score', 'harmony_index', 'status']:
+            if key in current_data and key not in _DERIVED_KEYS:
                 baseline_val = self.baseline[key]
                 current_val = current_data[key]
                 if baseline_val != 0:
@@ -0,0 +1,260 @@
+"""
+运行时埋点 - 公共方法的调用计数、延迟直方图与吞吐统计，可导出为字典或 Prometheus 文本
+
+默认关闭：关闭时类上绑定的就是原始方法，没有任何额外开销。enable() 把已登记方法替换为计时包装，
+disable() 换回原始方法；也可在导入前设置环境变量 ABN_QSS_INSTRUMENTATION=1。
+切换只影响之后从类上取得的方法，切换前已取出的绑定方法保持原样。profiling() 可把一段运行包在 cProfile 或
+tracemalloc 中并输出报告。
+"""
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Iterator, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 延迟直方图的桶上界（秒），最后一个桶为 +Inf
+LATENCY_BUCKETS = (1e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+
+class _State:
+    __slots__ = ("enabled",)
+
+    def __init__(self):
+        self.enabled = os.environ.get("ABN_QSS_INSTRUMENTATION", "") not in ("", "0")
+
+
+_state = _State()
+_lock = threading.Lock()
+
+
+class MethodStats:
+    """单个方法的累计统计"""
+    __slots__ = ("name", "calls", "errors", "total_seconds", "items", "buckets")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.items = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float, items: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.items += items
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """由直方图估计分位数（返回所在桶的上界）"""
+        if self.calls == 0:
+            return None
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else None,
+            "p50_seconds": self.quantile(0.5),
+            "p99_seconds": self.quantile(0.99),
+            "items": self.items,
+            "items_per_second": self.items / self.total_seconds if self.total_seconds > 0 else None,
+            "histogram": dict(zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], self.buckets)),
+        }
+
+
+_metrics: Dict[str, MethodStats] = {}
+
+# 已登记的方法：(模块名, __qualname__, 原始函数, 计时包装)
+_registry: List[Tuple[str, str, Callable[..., Any], Callable[..., Any]]] = []
+
+
+def _bind(active: bool) -> None:
+    """把已登记方法在其所属类上替换为计时包装（active）或原始函数"""
+    with _lock:
+        for module_name, qualname, fn, wrapper in _registry:
+            *path, attr = qualname.split(".")
+            owner: Any = sys.modules.get(module_name)
+            try:
+                for part in path:
+                    owner = getattr(owner, part)
+                current = vars(owner)[attr]
+            except (AttributeError, KeyError, TypeError):
+                continue  # 所属类尚未创建（导入中），创建时已按当时的开关选择了函数
+            target = wrapper if active else fn
+            if isinstance(current, staticmethod):
+                target = staticmethod(target)
+            setattr(owner, attr, target)
+
+
+def enable() -> None:
+    _state.enabled = True
+    _bind(True)
+
+
+def disable() -> None:
+    _state.enabled = False
+    _bind(False)
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset() -> None:
+    """清空全部统计"""
+    with _lock:
+        _metrics.clear()
+
+
+def _record(name: str, seconds: float, items: int, error: bool) -> None:
+    with _lock:
+        stats = _metrics.get(name)
+        if stats is None:
+            stats = _metrics[name] = MethodStats(name)
+        stats.observe(seconds, items, error)
+
+
+def instrumented(name: Optional[str] = None, items: Optional[Callable[[Any], int]] = None) -> Callable[[F], F]:
+    """方法埋点装饰器
+
+    name 默认为函数的 __qualname__；items(result) 返回本次调用处理的条目数，省略时每次调用计 1 条。
+    与 @staticmethod 同用时须放在其下方。类中的方法在埋点关闭时保持为原始函数，由 enable()/disable()
+    在类上换绑；无法换绑的函数（模块级或局部函数）返回每次检查开关的包装。
+    """
+    def decorate(fn: F) -> F:
+        metric = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                _record(metric, perf_counter() - start, 0, True)
+                raise
+            elapsed = perf_counter() - start
+            _record(metric, elapsed, items(result) if items is not None else 1, False)
+            return result
+
+        if "." not in fn.__qualname__ or "<locals>" in fn.__qualname__:
+            @functools.wraps(fn)
+            def checked(*args: Any, **kwargs: Any) -> Any:
+                if not _state.enabled:
+                    return fn(*args, **kwargs)
+                return timed(*args, **kwargs)
+            return checked  # type: ignore[return-value]
+
+        with _lock:
+            _registry.append((fn.__module__, fn.__qualname__, fn, timed))
+        return (timed if _state.enabled else fn)  # type: ignore[return-value]
+    return decorate
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """以字典形式导出全部统计"""
+    with _lock:
+        return {name: stats.as_dict() for name, stats in sorted(_metrics.items())}
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def to_prometheus(prefix: str = "abn_qss") -> str:
+    """以 Prometheus 文本格式导出全部统计"""
+    with _lock:
+        stats_list = [_metrics[name] for name in sorted(_metrics)]
+
+    lines: List[str] = []
+    for metric, kind, help_text, value in (
+        ("calls_total", "counter", "方法调用次数", lambda s: s.calls),
+        ("errors_total", "counter", "抛出异常的调用次数", lambda s: s.errors),
+        ("items_total", "counter", "处理的条目数", lambda s: s.items),
+    ):
+        lines.append(f"# HELP {prefix}_{metric} {help_text}")
+        lines.append(f"# TYPE {prefix}_{metric} {kind}")
+        lines.extend(f'{prefix}_{metric}{{method="{_label(s.name)}"}} {value(s)}' for s in stats_list)
+
+    duration = f"{prefix}_call_duration_seconds"
+    lines.append(f"# HELP {duration} 方法调用耗时")
+    lines.append(f"# TYPE {duration} histogram")
+    for s in stats_list:
+        method = _label(s.name)
+        cumulative = 0
+        for bound, count in zip([repr(b) for b in LATENCY_BUCKETS] + ["+Inf"], s.buckets):
+            cumulative += count
+            lines.append(f'{duration}_bucket{{method="{method}",le="{bound}"}} {cumulative}')
+        lines.append(f'{duration}_sum{{method="{method}"}} {s.total_seconds!r}')
+        lines.append(f'{duration}_count{{method="{method}"}} {s.calls}')
+    return "\n".join(lines) + "\n"
+
+
+class ProfileReport:
+    """profiling() 的结果：text 为报告正文，output 为写入的文件路径"""
+    __slots__ = ("mode", "text", "output")
+
+    def __init__(self, mode: str, output: Optional[str]):
+        self.mode = mode
+        self.text = ""
+        self.output = output
+
+
+@contextmanager
+def profiling(mode: str = "cprofile", output: Optional[str] = None, limit: int = 25) -> Iterator[ProfileReport]:
+    """把一段运行包在 cProfile（按累计耗时排序）或 tracemalloc（按分配行排序）中
+
+    退出时把报告写入 report.text，给出 output 时同时写入该文件。
+    """
+    if mode not in ("cprofile", "tracemalloc"):
+        raise ValueError(f"未知的分析模式: {mode}")
+    report = ProfileReport(mode, output)
+    stream = io.StringIO()
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    else:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        try:
+            yield report
+        finally:
+            trace = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if started:
+                tracemalloc.stop()
+            stream.write(f"current={current / 2**20:.2f} MiB peak={peak / 2**20:.2f} MiB\n")
+            for stat in trace.statistics("lineno")[:limit]:
+                stream.write(f"{stat}\n")
+
+    report.text = stream.getvalue()
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(report.text)
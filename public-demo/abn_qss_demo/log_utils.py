@@ -0,0 +1,173 @@
+"""
+日志工具 - 结构化、限流、经队列异步输出的日志通道
+
+包内各模块使用 logging.getLogger(__name__)，包的根 logger 只挂 NullHandler：
+未调用 configure_logging() 时不输出任何内容，也不向 stdout 写入。
+configure_logging() 安装 QueueHandler + QueueListener：调用方只把记录放入有界队列（队列满时丢弃并计数，
+从不阻塞），由后台线程负责格式化与终端 I/O；RateLimitFilter 按事件限制每个时间窗口内的条数，
+log_event 在创建记录之前就做限流判断。
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from time import monotonic
+from typing import Any, Dict, Optional, TextIO, Tuple, Union
+
+LOGGER_NAME = "abn_qss_demo"
+
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+# 记录属性中保存结构化字段的位置
+_EVENT = "event"
+_FIELDS = "fields"
+_ADMITTED = "rate_admitted"
+
+_active: Dict[str, Any] = {}
+_config_lock = threading.Lock()
+
+
+def log_event(logger: logging.Logger, level: int, event: str, msg: str, *args: Any, **fields: Any) -> None:
+    """输出一条结构化日志：event 为事件名（限流的键），fields 为附加字段
+
+    级别未启用时只做一次 isEnabledFor 判断；超出限流额度的消息在创建 LogRecord 之前就被丢弃。
+    """
+    if not logger.isEnabledFor(level):
+        return
+    limiter = _active.get("limiter")
+    if limiter is not None:
+        suppressed = limiter.admit(event)
+        if suppressed is None:
+            return
+        if suppressed:
+            fields["suppressed"] = suppressed
+    logger.log(level, msg, *args, extra={_EVENT: event, _FIELDS: fields, _ADMITTED: limiter})
+
+
+class RateLimitFilter(logging.Filter):
+    """按事件（无事件名时按消息模板）限流：每 per 秒最多放行 rate 条
+
+    被丢弃的条数累计后附在该事件下一条放行的记录上（fields["suppressed"]）。
+    """
+
+    def __init__(self, rate: int = 10, per: float = 1.0):
+        super().__init__()
+        if rate < 1 or per <= 0:
+            raise ValueError("rate 至少为 1，per 必须为正数")
+        self.rate = rate
+        self.per = per
+        self._windows: Dict[Any, Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, key: Any) -> Optional[int]:
+        """放行时返回此前被丢弃的条数，超出额度时返回 None"""
+        now = monotonic()
+        with self._lock:
+            start, count, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - start >= self.per:
+                start, count = now, 0
+            if count >= self.rate:
+                self._windows[key] = (start, count, suppressed + 1)
+                return None
+            self._windows[key] = (start, count + 1, 0)
+        return suppressed
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, _ADMITTED, None) is self:
+            return True  # log_event 已在创建记录前用本过滤器限流
+        suppressed = self.admit(getattr(record, _EVENT, None) or (record.name, record.msg))
+        if suppressed is None:
+            return False
+        if suppressed:
+            fields = dict(getattr(record, _FIELDS, None) or {})
+            fields["suppressed"] = suppressed
+            setattr(record, _FIELDS, fields)
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """文本格式：`时间 级别 logger [事件] 消息 key=value ...`；json_lines=True 时每条记录输出一行 JSON"""
+
+    def __init__(self, json_lines: bool = False):
+        super().__init__()
+        self.json_lines = json_lines
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = getattr(record, _EVENT, None)
+        fields = getattr(record, _FIELDS, None) or {}
+        message = record.getMessage()
+        if self.json_lines:
+            payload = {"time": record.created, "level": record.levelname, "logger": record.name,
+                       "event": event, "message": message}
+            payload.update(fields)
+            if record.exc_info:
+                payload["exc_info"] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+        parts = [self.formatTime(record), record.levelname, record.name]
+        if event:
+            parts.append(f"[{event}]")
+        parts.append(message)
+        parts.extend(f"{key}={value}" for key, value in fields.items())
+        text = " ".join(parts)
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """队列满时丢弃记录并计数，调用方从不阻塞"""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(level: Union[int, str] = logging.INFO, stream: Optional[TextIO] = None,
+                      json_lines: bool = False, rate: Optional[int] = 10, per: float = 1.0,
+                      queue_size: int = 10_000) -> logging.Handler:
+    """为包的根 logger 安装限流的队列日志通道，返回入队端 handler（dropped 为因队列满丢弃的条数）
+
+    stream 默认为 sys.stderr；rate=None 时不限流。重复调用会先关闭上一次安装的通道。
+    """
+    shutdown_logging()
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    handler = _NonBlockingQueueHandler(log_queue)
+    limiter = RateLimitFilter(rate, per) if rate is not None else None
+    if limiter is not None:
+        handler.addFilter(limiter)
+
+    output = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    output.setFormatter(StructuredFormatter(json_lines))
+    listener = logging.handlers.QueueListener(log_queue, output)
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.addHandler(handler)
+    with _config_lock:
+        _active.update(handler=handler, listener=listener, limiter=limiter)
+    listener.start()
+    return handler
+
+
+def shutdown_logging() -> None:
+    """停止后台输出线程（先输出队列中剩余的记录）并移除 configure_logging 安装的 handler"""
+    with _config_lock:
+        handler = _active.pop("handler", None)
+        listener = _active.pop("listener", None)
+        _active.pop("limiter", None)
+    if listener is not None:
+        listener.stop()
+    if handler is not None:
+        logging.getLogger(LOGGER_NAME).removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
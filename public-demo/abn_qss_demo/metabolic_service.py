@@ -0,0 +1,154 @@
+"""
+代谢分析接入服务 - asyncio 微批处理前端
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+import numpy as np
+
+from .health_monitoring import SENSOR_CHANNELS, MetabolicMirror
+from .instrumentation import instrumented
+
+
+class MetabolicIngestService:
+    """代谢分析接入服务：并发接收读数，按数量或时限合并为微批后向量化分析
+
+    submit 把读数放入有界队列，队列满时等待（即对生产者施加背压）。
+    批处理协程凑满 max_batch_size 个读数或距首个读数超过 max_delay 秒即处理一批。
+    每个读数的结果与逐个调用 MetabolicMirror 的对应方法一致。
+    """
+
+    def __init__(self, mirror: Optional[MetabolicMirror] = None, max_batch_size: int = 256,
+                 max_delay: float = 0.01, max_queue: int = 4096,
+                 channels: Sequence[str] = SENSOR_CHANNELS, latency_window: int = 10000):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size 必须为正数")
+        self.mirror = mirror if mirror is not None else MetabolicMirror()
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.channels = tuple(channels)
+        self.batches_processed = 0
+        self.readings_processed = 0
+        self._batch_latencies = deque(maxlen=latency_window)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "MetabolicIngestService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """启动批处理协程（需在事件循环中调用）"""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._worker = asyncio.ensure_future(self._batch_loop())
+
+    async def stop(self) -> None:
+        """处理完队列中剩余的读数后停止"""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def submit(self, reading: Dict) -> Dict:
+        """提交一个读数并等待其分析结果；队列已满时在此等待"""
+        if self._worker is None:
+            raise RuntimeError("服务尚未启动，请先调用 start()")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((reading, time.perf_counter(), future))
+        return await future
+
+    def latency_percentiles(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        """最近各批次的端到端延迟分位数（毫秒），从批内最早提交到结果交付"""
+        if not self._batch_latencies:
+            return {f"p{p:g}": 0.0 for p in percentiles}
+        values = np.percentile(np.fromiter(self._batch_latencies, dtype=np.float64), percentiles)
+        return {f"p{p:g}": float(v) * 1000 for p, v in zip(percentiles, values)}
+
+    async def _batch_loop(self) -> None:
+        """批处理主循环"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self._process_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _process_batch(self, batch: List[Tuple[Dict, float, asyncio.Future]]) -> None:
+        """对一个微批做向量化代谢分析并交付结果"""
+        readings = [item[0] for item in batch]
+        try:
+            results = self.analyze_batch(readings)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        self.batches_processed += 1
+        self.readings_processed += len(batch)
+        self._batch_latencies.append(time.perf_counter() - min(item[1] for item in batch))
+
+    @instrumented(items=len)
+    def analyze_batch(self, readings: List[Dict]) -> List[Dict]:
+        """同步批量分析，返回与 readings 一一对应的结果字典"""
+        columns = {
+            name: np.array([reading.get(name, np.nan) for reading in readings], dtype=np.float64)
+            for name in self.channels
+        }
+        non_invasive = MetabolicMirror.batch_non_invasive_metabolic_analysis(columns)
+        state = (self.mirror.batch_analyze_metabolic_state(columns)
+                 if self.mirror.metabolic_baseline is not None else None)
+
+        results = []
+        for i in range(len(readings)):
+            result: Dict[str, Any] = {
+                "non_invasive_analysis": {
+                    "glucose_trend": {
+                        "value": float(non_invasive["glucose_value"][i]),
+                        "trend": str(non_invasive["glucose_trend"][i])
+                    },
+                    "lactate_level": float(non_invasive["lactate_level"][i]),
+                    "ketone_bodies": 0.3,
+                    "metabolic_flexibility": 0.85
+                },
+                "metabolic_state": None
+            }
+            if state is not None:
+                result["metabolic_state"] = {
+                    "metabolic_rate": float(state["metabolic_rate"][i]),
+                    "state": str(state["state"][i]),
+                    "confidence": 0.85
+                }
+            results.append(result)
+        return results
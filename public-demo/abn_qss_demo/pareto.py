@@ -0,0 +1,82 @@
+"""
+Pareto 前沿工具 - 可逐块增量维护的多目标非支配集
+"""
+from typing import Optional, Sequence, Tuple
+import numpy as np
+
+# 目标：(字段名, 是否越大越好)
+Objectives = Sequence[Tuple[str, bool]]
+
+
+def objective_costs(records: np.ndarray, objectives: Objectives) -> np.ndarray:
+    """把结构化记录的目标字段转换为 (样本数, 目标数) 的代价矩阵，各列均为越小越好"""
+    costs = np.empty((len(records), len(objectives)), dtype=np.float64)
+    for j, (name, maximize) in enumerate(objectives):
+        costs[:, j] = records[name]
+        if maximize:
+            np.negative(costs[:, j], out=costs[:, j])
+    return costs
+
+
+def nondominated_mask(costs: np.ndarray) -> np.ndarray:
+    """返回代价矩阵中非支配行的掩码（目标完全相同的行互不支配，全部保留）
+
+    每轮取剩余行中字典序最小的代价向量（它不被任何行支配），用一次向量化比较
+    剔除被它支配的行，直到没有剩余。开销约为 O(行数 × 前沿大小)，前沿远小于输入时接近线性，
+    不需要对输入排序。
+    """
+    costs = np.asarray(costs, dtype=np.float64)
+    keep = np.zeros(len(costs), dtype=bool)
+    alive = np.arange(len(costs))
+    while len(alive):
+        remaining = costs[alive]
+        best = np.arange(len(alive))
+        for column in remaining.T:
+            values = column[best]
+            best = best[values == values.min()]
+        pivot = remaining[best[0]]
+        same = (remaining == pivot).all(axis=1)
+        dominated = (remaining >= pivot).all(axis=1)
+        keep[alive[same]] = True
+        alive = alive[~dominated]
+    return keep
+
+
+class ParetoFront:
+    """逐块增量维护的 Pareto 前沿
+
+    update 把新记录与当前前沿合并后重新求非支配集；由于 front(A ∪ B) = front(front(A) ∪ front(B))，
+    各块可以先在进程池中求出块内前沿再归并，结果与分块方式和归并顺序无关。
+    records 按目标的字典序（最优在前）排列，order 字段用于打破平分。
+    """
+
+    def __init__(self, objectives: Objectives, dtype: np.dtype, order: Optional[str] = None):
+        if not objectives:
+            raise ValueError("至少需要一个目标")
+        self.objectives = tuple(objectives)
+        self.order = order
+        self._records = np.empty(0, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def update(self, records: np.ndarray) -> None:
+        """并入一块记录"""
+        if len(records) == 0:
+            return
+        merged = np.concatenate([self._records, records])
+        self._records = merged[nondominated_mask(objective_costs(merged, self.objectives))]
+
+    @property
+    def records(self) -> np.ndarray:
+        """当前前沿，按目标字典序排列"""
+        costs = objective_costs(self._records, self.objectives)
+        keys = [costs[:, j] for j in reversed(range(costs.shape[1]))]
+        if self.order is not None:
+            keys.insert(0, self._records[self.order])
+        return self._records[np.lexsort(keys)]
+
+
+def pareto_front(records: np.ndarray, objectives: Objectives) -> np.ndarray:
+    """一次性求一批记录的非支配集（保持输入顺序）"""
+    return records[nondominated_mask(objective_costs(records, objectives))]
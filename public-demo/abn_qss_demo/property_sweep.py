@@ -0,0 +1,134 @@
+"""
+批量性质扫描 - 对大量组分 × 性质组合一次向量化计算，返回列式结果表
+"""
+import os
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Optional, Iterable, Sequence, Tuple, Union
+import numpy as np
+
+from .keyed_random import hash_ids, keyed_uniform
+from .result_sink import ResultSink
+
+# 与对接 (0-3)、ADMET (16-21) 使用的随机流错开
+_STREAM_OFFSET = 32
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _band_gap(keys: np.ndarray, seed: int, stream: int) -> np.ndarray:
+    base_gap = 0.5 + 2.5 * keyed_uniform(keys, seed, stream)
+    quantum_correction = -0.2 + 0.4 * keyed_uniform(keys, seed, stream + 1)
+    return np.round(np.maximum(0.1, base_gap + quantum_correction), 3)
+
+
+def _conductivity(keys: np.ndarray, seed: int, stream: int) -> np.ndarray:
+    base_cond = 1e-6 + (1e3 - 1e-6) * keyed_uniform(keys, seed, stream)
+    quantum_enhance = 1.5 + 1.5 * keyed_uniform(keys, seed, stream + 1)
+    return base_cond * quantum_enhance
+
+
+def _stability(keys: np.ndarray, seed: int, stream: int) -> np.ndarray:
+    return np.round(0.7 + 0.25 * keyed_uniform(keys, seed, stream), 3)
+
+
+# 性质名 -> (单位, 计算函数, 该性质的起始随机流)
+SWEEP_PROPERTIES: Dict[str, Tuple[str, Callable[[np.ndarray, int, int], np.ndarray], int]] = {
+    "band_gap": ("eV", _band_gap, _STREAM_OFFSET),
+    "conductivity": ("S/m", _conductivity, _STREAM_OFFSET + 2),
+    "stability": ("", _stability, _STREAM_OFFSET + 4),
+}
+_CONFIDENCE_STREAM = _STREAM_OFFSET + 5
+
+
+def _check_properties(properties: Sequence[str]) -> List[str]:
+    unknown = [p for p in properties if p not in SWEEP_PROPERTIES]
+    if unknown:
+        raise ValueError(f"不支持的性质: {unknown}，可选: {list(SWEEP_PROPERTIES)}")
+    return list(dict.fromkeys(properties))
+
+
+def _sweep_chunk(compositions: np.ndarray, properties: Sequence[str], seed: int) -> Dict[str, np.ndarray]:
+    """进程池任务：计算一块组分的全部性质列；每个组分的取值只取决于其名称与 seed"""
+    keys = hash_ids(compositions)
+    columns = {}
+    for prop in properties:
+        _, kernel, stream = SWEEP_PROPERTIES[prop]
+        columns[prop] = kernel(keys, seed, stream)
+    columns["quantum_confidence"] = np.round(0.85 + 0.1 * keyed_uniform(keys, seed, _CONFIDENCE_STREAM), 3)
+    return columns
+
+
+def property_sweep(compositions: Iterable[str], properties: Sequence[str], seed: int = 42,
+                   chunk_size: int = 100_000, workers: Optional[int] = 1,
+                   executor: Optional[Executor] = None,
+                   progress: Optional[ProgressCallback] = None,
+                   sink: Optional[ResultSink] = None) -> Union[Dict[str, np.ndarray], int]:
+    """对所有 组分 × 性质 组合做向量化预测，返回列式结果表
+
+    返回 {"composition": S 数组, <各性质>: float64 数组, "quantum_confidence": float64 数组}。
+    workers > 1 或传入 executor 时按块分发到进程池，同时在途的块不超过 2 × workers。
+    组分名列与结果表都会完整驻留内存；传入 sink 时不分配结果表，每块结果按顺序写入 sink
+    （一块一个行组），此时返回写入的行数。progress(已完成数, 总数) 在每块完成后调用。
+    """
+    properties = _check_properties(properties)
+    ids = np.asarray(compositions)
+    if ids.dtype.kind != "S":
+        ids = np.char.encode(ids.astype(str), "utf-8")
+    total = len(ids)
+
+    table = {"composition": ids}
+    if sink is None:
+        for name in properties + ["quantum_confidence"]:
+            table[name] = np.empty(total, dtype=np.float64)
+
+    def store(start: int, columns: Dict[str, np.ndarray]) -> None:
+        if sink is not None:
+            sink.append({"composition": ids[start:start + chunk_size], **columns})
+        else:
+            for name, values in columns.items():
+                table[name][start:start + len(values)] = values
+        if progress is not None:
+            progress(min(start + chunk_size, total), total)
+
+    starts = range(0, total, chunk_size)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if executor is None and (workers <= 1 or len(starts) <= 1):
+        for start in starts:
+            store(start, _sweep_chunk(ids[start:start + chunk_size], properties, seed))
+        return table if sink is None else total
+
+    # 进程池按需导入，导入包时不加载 multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    own_pool = executor is None
+    pool = ProcessPoolExecutor(max_workers=workers) if own_pool else executor
+    max_in_flight = 2 * (workers if own_pool else max(workers, 2))
+    try:
+        in_flight: List[Tuple[int, Future]] = []
+        for start in starts:
+            in_flight.append((start, pool.submit(_sweep_chunk, ids[start:start + chunk_size], properties, seed)))
+            if len(in_flight) >= max_in_flight:
+                done_start, future = in_flight.pop(0)
+                store(done_start, future.result())
+        for done_start, future in in_flight:
+            store(done_start, future.result())
+    finally:
+        if own_pool:
+            pool.shutdown()
+    return table if sink is None else total
+
+
+def sweep_row_to_dict(table: Dict[str, np.ndarray], row: int) -> Dict:
+    """把结果表中的一行转换为与 quantum_property_prediction 相同风格的字典"""
+    predictions = {}
+    for name in SWEEP_PROPERTIES:
+        if name not in table:
+            continue
+        value = float(table[name][row])
+        predictions[name] = f"{value:.2e} S/m" if name == "conductivity" else value
+    return {
+        "composition": table["composition"][row].decode("utf-8"),
+        "predictions": predictions,
+        "quantum_confidence": float(table["quantum_confidence"][row]),
+        "method": "Quantum-Enhanced DFT Simulation"
+    }
@@ -0,0 +1,230 @@
+"""
+量子线路 - 线路中间表示 + 门融合编译
+
+编译时把同一量子比特上相邻的单比特门融合为一个 2x2 矩阵，并把作用在同一对量子比特上的两比特门
+（连同其间的对角 / 置换类单比特门）合并为一个仍可走快速路径的块，从而减少对态矢量的遍历次数。
+融合方案只取决于线路结构（门名与量子比特），按结构缓存；参数扫描时只重新计算小矩阵。
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, NamedTuple, Sequence, Tuple, Union
+import numpy as np
+
+from .quantum_simulator import CNOT, CZ, H, S, SWAP, T, X, Y, Z, _is_monomial, rx, ry, rz
+
+FIXED_GATES: Dict[str, np.ndarray] = {
+    "h": H, "x": X, "y": Y, "z": Z, "s": S, "t": T,
+    "cx": CNOT, "cz": CZ, "swap": SWAP,
+}
+PARAMETRIC_GATES = {"rx": rx, "ry": ry, "rz": rz}
+# 置换乘相位类的门（与参数无关），并入两比特块后块仍在快速路径上
+_MONOMIAL_GATES = frozenset([name for name, matrix in FIXED_GATES.items() if _is_monomial(matrix)] + ["rz"])
+
+_I2 = np.eye(2, dtype=np.complex128)
+
+# 融合方案中每个成员的嵌入方式
+_ON_FIRST, _ON_SECOND, _PAIR, _PAIR_REVERSED = range(4)
+
+
+class Gate(NamedTuple):
+    name: str
+    qubits: Tuple[int, ...]
+    params: Tuple[float, ...] = ()
+
+
+def gate_matrix(gate: Gate) -> np.ndarray:
+    """门的矩阵表示（两比特门下标为 2 * b_first + b_second）"""
+    if gate.name in PARAMETRIC_GATES:
+        return PARAMETRIC_GATES[gate.name](*gate.params)
+    return FIXED_GATES[gate.name]
+
+
+class QuantumCircuit:
+    """量子线路构建器，方法可链式调用"""
+
+    def __init__(self, n_qubits: int):
+        if n_qubits < 1:
+            raise ValueError("量子比特数必须为正数")
+        self.n_qubits = n_qubits
+        self.gates: List[Gate] = []
+
+    def __len__(self) -> int:
+        return len(self.gates)
+
+    def append(self, name: str, qubits: Sequence[int], params: Sequence[float] = ()) -> "QuantumCircuit":
+        if name not in FIXED_GATES and name not in PARAMETRIC_GATES:
+            raise ValueError(f"未知量子门: {name}")
+        qubits = tuple(int(q) for q in qubits)
+        if any(not 0 <= q < self.n_qubits for q in qubits) or len(set(qubits)) != len(qubits):
+            raise ValueError(f"量子比特下标无效: {qubits}")
+        if gate_matrix(Gate(name, qubits, tuple(params))).shape[0] != 1 << len(qubits):
+            raise ValueError(f"{name} 门的量子比特数不符")
+        self.gates.append(Gate(name, qubits, tuple(float(p) for p in params)))
+        return self
+
+    def h(self, q: int) -> "QuantumCircuit":
+        return self.append("h", (q,))
+
+    def x(self, q: int) -> "QuantumCircuit":
+        return self.append("x", (q,))
+
+    def y(self, q: int) -> "QuantumCircuit":
+        return self.append("y", (q,))
+
+    def z(self, q: int) -> "QuantumCircuit":
+        return self.append("z", (q,))
+
+    def rx(self, q: int, theta: float) -> "QuantumCircuit":
+        return self.append("rx", (q,), (theta,))
+
+    def ry(self, q: int, theta: float) -> "QuantumCircuit":
+        return self.append("ry", (q,), (theta,))
+
+    def rz(self, q: int, theta: float) -> "QuantumCircuit":
+        return self.append("rz", (q,), (theta,))
+
+    def cx(self, control: int, target: int) -> "QuantumCircuit":
+        return self.append("cx", (control, target))
+
+    def cz(self, a: int, b: int) -> "QuantumCircuit":
+        return self.append("cz", (a, b))
+
+    def swap(self, a: int, b: int) -> "QuantumCircuit":
+        return self.append("swap", (a, b))
+
+    def structure(self) -> Tuple:
+        """线路结构（不含参数），用作编译缓存的键"""
+        return (self.n_qubits, tuple((g.name, g.qubits) for g in self.gates))
+
+    def compile(self, fuse: bool = True) -> "CompiledCircuit":
+        return compile_circuit(self, fuse=fuse)
+
+
+class CompiledCircuit(NamedTuple):
+    """编译结果：每个操作对应一次态矢量遍历"""
+    n_qubits: int
+    ops: List[Tuple[Tuple[int, ...], np.ndarray]]
+    n_source_gates: int
+
+
+# 因子：与参数无关的定值矩阵（相邻定值门的乘积，已嵌入块内），或待编译时填入参数的 (门序号, 嵌入方式)
+Factor = Union[np.ndarray, Tuple[int, int]]
+# 融合方案：[(量子比特, (因子, ...)), ...]，每个块的矩阵为各因子按顺序左乘的结果
+FusionPlan = Tuple[Tuple[Tuple[int, ...], Tuple[Factor, ...]], ...]
+
+
+@lru_cache(maxsize=256)
+def fusion_plan(structure: Tuple) -> FusionPlan:
+    """按线路结构贪心融合，返回按执行顺序排列的操作
+
+    同一量子比特上相邻的单比特门先挂起，在该量子比特上出现两比特门或线路结束时作为一个 2x2 操作输出；
+    作用在同一对量子比特上、中间没有其他操作的两比特门合并为一个块。
+    块内只并入置换乘相位类（对角门、X/Y 等）的单比特门，使块仍是置换类矩阵，
+    留在模拟器原地相乘 / 子块拷贝的快速路径上，不会变成需要稠密乘法的 4x4 块。
+    并入的门只与之后作用在其他量子比特上的操作交换次序，结果不变。
+    """
+    n_qubits, gates = structure
+    ops: List[Tuple[Tuple[int, ...], List[Tuple[int, int]]]] = []
+    pending: List[List[int]] = [[] for _ in range(n_qubits)]
+    last_block: List[Optional[int]] = [None] * n_qubits
+
+    def flush(q: int) -> None:
+        if pending[q]:
+            ops.append(((q,), [(i, _ON_FIRST) for i in pending[q]]))
+            pending[q] = []
+            last_block[q] = None
+
+    for index, (name, qubits) in enumerate(gates):
+        if len(qubits) == 1:
+            q = qubits[0]
+            k = last_block[q]
+            if k is not None and not pending[q] and name in _MONOMIAL_GATES:
+                pair = ops[k][0]
+                ops[k][1].append((index, _ON_FIRST if pair[0] == q else _ON_SECOND))
+            else:
+                pending[q].append(index)
+            continue
+
+        a, b = qubits
+        k = last_block[a]
+        if pending[a] or pending[b] or not (k is not None and k == last_block[b]):
+            flush(a)
+            flush(b)
+            ops.append(((a, b), []))
+            k = len(ops) - 1
+        pair, members = ops[k]
+        members.append((index, _PAIR if pair == (a, b) else _PAIR_REVERSED))
+        last_block[a] = last_block[b] = k
+
+    for q in range(n_qubits):
+        flush(q)
+    return tuple((qubits, _plan_factors(gates, len(qubits), members)) for qubits, members in ops)
+
+
+def _embed(gate: np.ndarray, role: int, width: int) -> np.ndarray:
+    """把门矩阵嵌入到 width 比特块的下标空间"""
+    if width == 1 or role == _PAIR:
+        return gate
+    if role == _ON_FIRST:
+        return np.kron(gate, _I2)
+    if role == _ON_SECOND:
+        return np.kron(_I2, gate)
+    return SWAP @ gate @ SWAP
+
+
+def _plan_factors(gates: Sequence[Tuple[str, Tuple[int, ...]]], width: int,
+                  members: Sequence[Tuple[int, int]]) -> Tuple[Factor, ...]:
+    """预先乘好相邻定值门的嵌入矩阵，只把参数化门留到编译时计算（定值矩阵只读，供各次编译共享）"""
+    factors: List[Factor] = []
+    fixed: Optional[np.ndarray] = None
+    for index, role in members:
+        name = gates[index][0]
+        if name in PARAMETRIC_GATES:
+            if fixed is not None:
+                factors.append(fixed)
+                fixed = None
+            factors.append((index, role))
+            continue
+        gate = _embed(FIXED_GATES[name], role, width)
+        fixed = gate if fixed is None else gate @ fixed
+    if fixed is not None:
+        factors.append(fixed)
+    for factor in factors:
+        if isinstance(factor, np.ndarray):
+            factor.flags.writeable = False
+    return tuple(factors)
+
+
+def _block_matrix(gates: Sequence[Gate], width: int, factors: Sequence[Factor]) -> np.ndarray:
+    """按顺序把块的各因子乘起来；只含定值门的块直接复用方案中的矩阵"""
+    matrix: Optional[np.ndarray] = None
+    for factor in factors:
+        if isinstance(factor, tuple):
+            index, role = factor
+            factor = _embed(gate_matrix(gates[index]), role, width)
+        matrix = factor if matrix is None else factor @ matrix
+    return matrix
+
+
+def compile_circuit(circuit: QuantumCircuit, fuse: bool = True) -> CompiledCircuit:
+    """编译线路；fuse=False 时每个门单独作为一次遍历（用于对照）"""
+    if not fuse:
+        ops = [(g.qubits, gate_matrix(g)) for g in circuit.gates]
+    else:
+        ops = [(qubits, _block_matrix(circuit.gates, len(qubits), factors))
+               for qubits, factors in fusion_plan(circuit.structure())]
+    return CompiledCircuit(circuit.n_qubits, ops, len(circuit.gates))
+
+
+def variational_ansatz(n_qubits: int, params: Sequence[float], layers: int = 1) -> QuantumCircuit:
+    """硬件高效变分线路：每层对各量子比特作用 Ry、Rz，再以 CNOT 链纠缠
+
+    params 长度须为 2 * n_qubits * layers。
+    """
+    params = np.asarray(params, dtype=float).reshape(layers, n_qubits, 2)
+    circuit = QuantumCircuit(n_qubits)
+    for layer in params:
+        for q, (theta, phi) in enumerate(layer):
+            circuit.ry(q, theta).rz(q, phi)
+        for q in range(n_qubits - 1):
+            circuit.cx(q, q + 1)
+    return circuit
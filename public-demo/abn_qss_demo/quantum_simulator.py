@@ -0,0 +1,214 @@
+"""
+本地量子模拟器 - 基于 NumPy 的态矢量引擎
+
+量子态存放在连续的 complex128 数组中，基态下标的第 q 位对应第 q 个量子比特（小端序）。
+门作用通过把态矢量 reshape 成张量视图后完成：对角门原地相乘，置换类门（CNOT、SWAP）按子块拷贝，
+一般门用 matmul 写入预先分配的同尺寸缓冲区后交换，整个模拟过程中不再分配新的态矢量。
+"""
+from typing import Dict, Any, Sequence, Union
+import numpy as np
+
+MAX_QUBITS = 30
+
+# 批量 matmul 的列数（低位跨度）低于此值时，小矩阵批量乘法很慢，改为换轴后做一次大矩阵乘法
+# （作用在最低位上时直接右乘转置矩阵）
+_MIN_BATCH_COLUMNS = 64
+
+# 常用门矩阵
+I2 = np.eye(2, dtype=np.complex128)
+H = np.array([[1, 1], [1, -1]], dtype=np.complex128) / np.sqrt(2)
+X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+Y = np.array([[0, -1j], [1j, 0]], dtype=np.complex128)
+Z = np.array([[1, 0], [0, -1]], dtype=np.complex128)
+S = np.array([[1, 0], [0, 1j]], dtype=np.complex128)
+T = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=np.complex128)
+# 两比特门的矩阵下标为 2 * b_first + b_second（第一个比特为高位）
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128)
+CZ = np.diag([1, 1, 1, -1]).astype(np.complex128)
+SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=np.complex128)
+
+
+def rx(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+
+
+def ry(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=np.complex128)
+
+
+def rz(theta: float) -> np.ndarray:
+    phase = np.exp(-0.5j * theta)
+    return np.array([[phase, 0], [0, phase.conjugate()]], dtype=np.complex128)
+
+
+def _is_diagonal(matrix: np.ndarray) -> bool:
+    return not np.any(matrix - np.diag(np.diagonal(matrix)))
+
+
+def _is_monomial(matrix: np.ndarray) -> bool:
+    """每行只有一个非零元素（置换乘相位，如 CNOT、SWAP）"""
+    return bool((np.count_nonzero(matrix, axis=1) == 1).all())
+
+
+class StateVectorSimulator:
+    """态矢量模拟器
+
+    内存占用为两个 2^n 的 complex128 缓冲区（26 个量子比特约 2 GiB）。
+    """
+
+    def __init__(self, n_qubits: int):
+        if not 1 <= n_qubits <= MAX_QUBITS:
+            raise ValueError(f"量子比特数须在 1 到 {MAX_QUBITS} 之间")
+        self.n_qubits = n_qubits
+        self._state = np.zeros(1 << n_qubits, dtype=np.complex128)
+        self._scratch = np.empty_like(self._state)
+        self.gates_applied = 0
+        self.reset()
+
+    @property
+    def state(self) -> np.ndarray:
+        """当前态矢量（内部缓冲区的视图，请勿修改）"""
+        return self._state
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._state.nbytes + self._scratch.nbytes
+
+    def reset(self) -> None:
+        """重置为 |0...0>"""
+        self._state[:] = 0
+        self._state[0] = 1
+        self.gates_applied = 0
+
+    def set_state(self, amplitudes: np.ndarray) -> None:
+        """载入给定的（已归一化的）态矢量"""
+        if amplitudes.shape != self._state.shape:
+            raise ValueError("态矢量长度与量子比特数不符")
+        self._state[:] = amplitudes
+
+    def _check_qubit(self, qubit: int) -> None:
+        if not 0 <= qubit < self.n_qubits:
+            raise ValueError(f"量子比特下标越界: {qubit}")
+
+    def apply_1q(self, gate: np.ndarray, qubit: int) -> None:
+        """作用单比特门"""
+        self._check_qubit(qubit)
+        shape = (1 << (self.n_qubits - qubit - 1), 2, 1 << qubit)
+        view = self._state.reshape(shape)
+        if _is_diagonal(gate):
+            view[:, 0, :] *= gate[0, 0]
+            view[:, 1, :] *= gate[1, 1]
+        elif shape[2] >= _MIN_BATCH_COLUMNS:
+            np.matmul(gate, view, out=self._scratch.reshape(shape))
+            self._swap()
+        elif shape[2] == 1:
+            # 最低位：态矢量视为 (2^(n-1), 2) 矩阵右乘 gate 的转置
+            np.matmul(view.reshape(shape[0], 2), gate.T, out=self._scratch.reshape(shape[0], 2))
+            self._swap()
+        else:
+            # 先把比特轴换到最前面，整个态矢量作为 (2, 2^n / 2) 做一次 matmul，再换回原布局
+            front = (2, shape[0], shape[2])
+            np.copyto(self._scratch.reshape(front), view.transpose(1, 0, 2))
+            np.matmul(gate, self._scratch.reshape(2, -1), out=self._state.reshape(2, -1))
+            np.copyto(self._scratch.reshape(shape), self._state.reshape(front).transpose(1, 0, 2))
+            self._swap()
+        self.gates_applied += 1
+
+    def apply_2q(self, gate: np.ndarray, first: int, second: int) -> None:
+        """作用两比特门，gate 的下标为 2 * b_first + b_second"""
+        self._check_qubit(first)
+        self._check_qubit(second)
+        if first == second:
+            raise ValueError("两比特门的两个量子比特不能相同")
+        high, low = max(first, second), min(first, second)
+        shape = (1 << (self.n_qubits - high - 1), 2, 1 << (high - low - 1), 2, 1 << low)
+        view = self._state.reshape(shape)
+        # 调整为 [b_high, b_low, b_high', b_low'] 的下标顺序
+        tensor = gate.reshape(2, 2, 2, 2)
+        if first != high:
+            tensor = tensor.transpose(1, 0, 3, 2)
+
+        if _is_diagonal(gate):
+            for bh in range(2):
+                for bl in range(2):
+                    view[:, bh, :, bl, :] *= tensor[bh, bl, bh, bl]
+        elif _is_monomial(gate):
+            # 置换类门：四个子块各做一次带相位的拷贝
+            out = self._scratch.reshape(shape)
+            for bh in range(2):
+                for bl in range(2):
+                    src_h, src_l = np.unravel_index(np.flatnonzero(tensor[bh, bl])[0], (2, 2))
+                    np.multiply(view[:, src_h, :, src_l, :], tensor[bh, bl, src_h, src_l],
+                                out=out[:, bh, :, bl, :])
+            self._swap()
+        elif high == low + 1 and shape[4] >= _MIN_BATCH_COLUMNS:
+            # 相邻比特且低位跨度足够大：两个比特轴合并为长度 4 的轴，直接批量 matmul
+            block = (shape[0], 4, shape[4])
+            np.matmul(tensor.reshape(4, 4), self._state.reshape(block), out=self._scratch.reshape(block))
+            self._swap()
+        elif high == 1:
+            # 最低两位：态矢量视为 (2^(n-2), 4) 矩阵右乘 gate 的转置
+            rows = (shape[0], 4)
+            np.matmul(self._state.reshape(rows), tensor.reshape(4, 4).T, out=self._scratch.reshape(rows))
+            self._swap()
+        else:
+            # 先把两个比特轴换到最前面，整个态矢量作为 (4, 2^n / 4) 做一次 matmul，再换回原布局
+            front = (2, 2, shape[0], shape[2], shape[4])
+            np.copyto(self._scratch.reshape(front), view.transpose(1, 3, 0, 2, 4))
+            np.matmul(tensor.reshape(4, 4), self._scratch.reshape(4, -1), out=self._state.reshape(4, -1))
+            np.copyto(self._scratch.reshape(shape), self._state.reshape(front).transpose(2, 0, 3, 1, 4))
+            self._swap()
+        self.gates_applied += 1
+
+    def apply_gate(self, gate: np.ndarray, qubits: Sequence[int]) -> None:
+        """按比特数分派到 apply_1q / apply_2q"""
+        if len(qubits) == 1:
+            self.apply_1q(gate, qubits[0])
+        elif len(qubits) == 2:
+            self.apply_2q(gate, qubits[0], qubits[1])
+        else:
+            raise ValueError("只支持 1 或 2 比特门")
+
+    def run(self, circuit: Any, fuse: bool = True) -> "StateVectorSimulator":
+        """执行线路（QuantumCircuit 会先按结构缓存编译）或已编译的 CompiledCircuit"""
+        from .quantum_circuit import QuantumCircuit
+
+        compiled = circuit.compile(fuse=fuse) if isinstance(circuit, QuantumCircuit) else circuit
+        if compiled.n_qubits != self.n_qubits:
+            raise ValueError("线路与模拟器的量子比特数不符")
+        for qubits, matrix in compiled.ops:
+            self.apply_gate(matrix, qubits)
+        return self
+
+    def _swap(self) -> None:
+        self._state, self._scratch = self._scratch, self._state
+
+    def probabilities(self) -> np.ndarray:
+        """各基态的测量概率"""
+        return np.abs(self._state) ** 2
+
+    def sample(self, shots: int, rng: Union[int, np.random.Generator, None] = None) -> np.ndarray:
+        """批量采样测量结果，返回基态下标数组"""
+        rng = np.random.default_rng(rng)
+        cdf = np.cumsum(self.probabilities())
+        cdf /= cdf[-1]
+        outcomes = np.searchsorted(cdf, rng.random(shots), side="right")
+        return np.minimum(outcomes, len(cdf) - 1)
+
+    def sample_bits(self, shots: int, rng: Union[int, np.random.Generator, None] = None) -> np.ndarray:
+        """批量采样，返回 (shots, n_qubits) 的比特矩阵，第 q 列为第 q 个量子比特"""
+        outcomes = self.sample(shots, rng)
+        return ((outcomes[:, None] >> np.arange(self.n_qubits)) & 1).astype(np.uint8)
+
+    def sample_counts(self, shots: int, rng: Union[int, np.random.Generator, None] = None) -> Dict[str, int]:
+        """批量采样并统计，键为高位在左的比特串"""
+        values, counts = np.unique(self.sample(shots, rng), return_counts=True)
+        return {format(int(v), f"0{self.n_qubits}b"): int(c) for v, c in zip(values, counts)}
+
+    def expectation_z(self, qubit: int) -> float:
+        """第 qubit 个量子比特的 <Z> 期望"""
+        self._check_qubit(qubit)
+        probs = self.probabilities().reshape(1 << (self.n_qubits - qubit - 1), 2, 1 << qubit)
+        return float(probs[:, 0, :].sum() - probs[:, 1, :].sum())
@@ -0,0 +1,142 @@
+"""
+无界面批量图表渲染 - Agg 后端，复用 Figure/Axes，直接输出 PNG/SVG
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
+
+from .font_utils import setup_chinese_font
+from .instrumentation import instrumented
+
+Output = Union[str, "os.PathLike[str]", io.IOBase, None]
+
+_worker_renderer: Optional["BatchChartRenderer"] = None
+
+
+def _candidate_columns(results: Dict) -> Tuple[List[str], List[float], List[float]]:
+    candidates = results.get("candidates", [])
+    return ([c["material_id"] for c in candidates],
+            [c["efficiency"] for c in candidates],
+            [c["stability"] for c in candidates])
+
+
+def draw_material_properties(ax_efficiency: Any, ax_stability: Any, results: Dict) -> None:
+    """在给定的两个坐标轴上绘制候选材料的效率与稳定性柱状图"""
+    materials, efficiencies, stabilities = _candidate_columns(results)
+
+    # 效率图表
+    ax_efficiency.bar(materials, efficiencies, color='skyblue')
+    ax_efficiency.set_title('效率 (%)')
+    ax_efficiency.tick_params(axis='x', rotation=45)
+
+    # 稳定性图表
+    ax_stability.bar(materials, stabilities, color='lightcoral')
+    ax_stability.set_title('稳定性')
+    ax_stability.tick_params(axis='x', rotation=45)
+
+    for ax in (ax_efficiency, ax_stability):
+        ax.set_xlabel('材料编号')
+        ax.grid(True, axis='y', alpha=0.3)
+
+
+class BatchChartRenderer:
+    """批量渲染器：整个生命周期只创建一个 Figure，逐个结果集重绘并输出
+
+    直接使用 Figure + FigureCanvasAgg，不经过 pyplot，不会打开窗口或初始化 GUI 后端。
+    候选数量不变时只更新柱高与刻度标签，不重建坐标轴。
+    """
+
+    def __init__(self, fmt: str = "png", dpi: int = 100, figsize: Tuple[float, float] = (12, 5)):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        setup_chinese_font()
+        self.fmt = fmt
+        self.dpi = dpi
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.ax_efficiency, self.ax_stability = self.figure.subplots(1, 2)
+        self.charts_rendered = 0
+        self._bars: Optional[Tuple[Any, Any]] = None
+
+    def _draw(self, results: Dict) -> None:
+        materials, efficiencies, stabilities = _candidate_columns(results)
+        if self._bars is not None and len(self._bars[0]) == len(materials):
+            # 复用已有柱形，只更新数据
+            for bars, ax, values in ((self._bars[0], self.ax_efficiency, efficiencies),
+                                     (self._bars[1], self.ax_stability, stabilities)):
+                for bar, value in zip(bars, values):
+                    bar.set_height(value)
+                ax.set_xticks(range(len(materials)))
+                ax.set_xticklabels(materials, rotation=45)
+                ax.relim()
+                ax.autoscale_view()
+            return
+
+        self.ax_efficiency.cla()
+        self.ax_stability.cla()
+        draw_material_properties(self.ax_efficiency, self.ax_stability, results)
+        self.figure.suptitle('材料性质分析')
+        self.figure.tight_layout()
+        self._bars = (self.ax_efficiency.containers[0], self.ax_stability.containers[0])
+
+    @instrumented()
+    def render(self, results: Dict, output: Output = None, fmt: Optional[str] = None) -> Optional[bytes]:
+        """渲染一个结果集；output 为文件路径或文件对象，省略时返回图像字节"""
+        self._draw(results)
+        fmt = fmt or self.fmt
+        self.charts_rendered += 1
+        if output is None:
+            buffer = io.BytesIO()
+            self.figure.savefig(buffer, format=fmt, dpi=self.dpi)
+            return buffer.getvalue()
+        self.figure.savefig(output, format=fmt, dpi=self.dpi)
+        return None
+
+    @instrumented(items=len)
+    def render_many(self, results_list: Sequence[Dict], output_dir: Optional[str] = None,
+                    prefix: str = "chart", start: int = 0) -> List[Union[str, bytes]]:
+        """依次渲染多个结果集，写入 output_dir 时返回文件路径，否则返回图像字节"""
+        outputs: List[Union[str, bytes]] = []
+        for offset, results in enumerate(results_list):
+            if output_dir is None:
+                outputs.append(self.render(results))
+                continue
+            path = os.path.join(output_dir, f"{prefix}_{start + offset:06d}.{self.fmt}")
+            self.render(results, path)
+            outputs.append(path)
+        return outputs
+
+
+def _init_worker(fmt: str, dpi: int) -> None:
+    """每个工作进程只创建一个渲染器"""
+    global _worker_renderer
+    _worker_renderer = BatchChartRenderer(fmt=fmt, dpi=dpi)
+
+
+def _render_batch(task: Tuple[int, Sequence[Dict], str, str]) -> List[str]:
+    start, results_list, output_dir, prefix = task
+    return _worker_renderer.render_many(results_list, output_dir, prefix=prefix, start=start)
+
+
+@instrumented(items=len)
+def render_charts_parallel(results_list: Sequence[Dict], output_dir: str, fmt: str = "png", dpi: int = 100,
+                           workers: Optional[int] = None, batch_size: int = 64,
+                           prefix: str = "chart") -> List[str]:
+    """在多个工作进程中并行渲染，返回按输入顺序排列的文件路径"""
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(start, list(results_list[start:start + batch_size]), output_dir, prefix)
+             for start in range(0, len(results_list), batch_size)]
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    if workers <= 1 or len(tasks) <= 1:
+        renderer = BatchChartRenderer(fmt=fmt, dpi=dpi)
+        return renderer.render_many(results_list, output_dir, prefix=prefix)
+
+    paths: List[str] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                             initializer=_init_worker, initargs=(fmt, dpi)) as pool:
+        for batch_paths in pool.map(_render_batch, tasks):
+            paths.extend(batch_paths)
+    return paths
@@ -0,0 +1,185 @@
+"""
+结果缓存 - 按内容哈希寻址的两级缓存（内存 LRU + 可选 sqlite 磁盘层）
+"""
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Callable, Tuple
+import numpy as np
+
+
+def _json_default(value: Any) -> Any:
+    """stable_key 的规范化：NumPy 标量与数组转为 Python 值，其余没有 JSON 形式的类型直接报错
+
+    不退回 repr，否则默认 repr 中的内存地址会让相同输入在不同进程得到不同的键。
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    if isinstance(value, bytes):
+        return {"__bytes__": value.hex()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=stable_key)
+    raise TypeError(f"stable_key 不支持的参数类型: {type(value).__name__}")
+
+
+def stable_key(*parts: Any) -> str:
+    """对参数做规范化 JSON 序列化后取 SHA-256，跨进程、跨运行保持稳定
+
+    参数须为 JSON 基本类型及其容器、NumPy 标量/数组、bytes 或集合，其他类型抛出 TypeError。
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                         default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def seed_from_key(key: str) -> int:
+    """由缓存键派生确定性的随机种子，保证命中结果与重新计算一致"""
+    return int(key[:16], 16)
+
+
+class ResultCache:
+    """两级结果缓存
+
+    内存层为容量 maxsize 的 LRU，超过 ttl 秒的条目视为过期；
+    指定 path 时启用 sqlite 磁盘层，多个进程可共享同一文件；设置 ttl 时，打开磁盘层会删除已过期的行，
+    get 读到的过期行也会随即删除，磁盘文件不会无限增长。
+    取出的结果为深拷贝，调用方修改不会污染缓存。
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, path: Optional[str] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize 必须为正数")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def stats(self) -> Dict[str, int]:
+        """命中/未命中计数"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "size": len(self._memory)
+        }
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """查找缓存，返回 (是否命中, 结果)"""
+        with self._lock:
+            now = time.time()
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return True, copy.deepcopy(entry[1])
+                del self._memory[key]
+
+            if self.path is not None:
+                row = self._db().execute("SELECT created, value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None and not self._expired(row[0], now):
+                    value = pickle.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return True, copy.deepcopy(value)
+                if row is not None:
+                    with self._db() as conn:
+                        conn.execute("DELETE FROM results WHERE key = ? AND created = ?", (key, row[0]))
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        """写入缓存（同时写入磁盘层）"""
+        with self._lock:
+            created = time.time()
+            value = copy.deepcopy(value)
+            self._remember(key, created, value)
+            if self.path is not None:
+                with self._db() as conn:
+                    conn.execute("INSERT OR REPLACE INTO results (key, created, value) VALUES (?, ?, ?)",
+                                 (key, created, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """命中则返回缓存结果，否则计算并写入"""
+        found, value = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """清空内存层与磁盘层"""
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                with self._db() as conn:
+                    conn.execute("DELETE FROM results")
+
+    def purge_expired(self) -> int:
+        """删除内存层与磁盘层中已过期的条目，返回删除的磁盘行数（未设置 ttl 时为 0）"""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            now = time.time()
+            for key in [key for key, (created, _) in self._memory.items() if self._expired(created, now)]:
+                del self._memory[key]
+            if self.path is None:
+                return 0
+            return self._purge_disk(self._db(), now)
+
+    def _purge_disk(self, conn: sqlite3.Connection, now: float) -> int:
+        with conn:
+            return conn.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,)).rowcount
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def _remember(self, key: str, created: float, value: Any) -> None:
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _db(self) -> sqlite3.Connection:
+        """按进程懒建立 sqlite 连接（fork 后的子进程会重新连接）"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, created REAL, value BLOB)")
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+            if self.ttl is not None:
+                self._purge_disk(self._conn, time.time())
+        return self._conn
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_conn"] = None
+        state["_conn_pid"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
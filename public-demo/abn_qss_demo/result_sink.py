@@ -0,0 +1,274 @@
+"""
+列式结果导出 - 按行组追加写入带 schema 的列式文件，可只读取所需列
+
+结果目录结构：
+    manifest.json        schema、后端、各分片文件及行数
+    part-00000.parquet   安装了 pyarrow 时：每次打开写入器生成一个分片，每次 append 为一个行组
+    rg-000000.npz        未安装 pyarrow 时：每次 append 写一个 .npz 行组，每列一个成员
+
+manifest 在每 manifest_every 个行组、flush() 与 close() 时以临时文件 + os.replace 原子更新，
+读取方只会看到完整的行组；两次更新之间写入的行组在下一次更新后才可见。
+进程在两次更新之间崩溃时，最多有 manifest_every - 1 个行组已在磁盘上但不在 manifest 中：
+以 mode="a" 重新打开会校验并收录其中连续、可读且 schema 一致的 npz 行组，删除其余未登记的分片文件；
+mode="w" 会先删除目录中已有的分片文件，旧结果不会混入新结果。
+"""
+import json
+import os
+import re
+import zipfile
+from typing import Any, Dict, List, Optional, Iterator, Mapping, Sequence, Union
+import numpy as np
+
+FORMAT_VERSION = "abn-qss-results/1"
+MANIFEST_NAME = "manifest.json"
+_PART_FILE = re.compile(r"^(part-\d{5}\.parquet|rg-\d{6}\.npz|manifest\.json\.tmp\.\d+)$")
+
+Batch = Union[np.ndarray, Mapping[str, Any], Sequence[Mapping[str, Any]]]
+
+
+def _load_pyarrow() -> Optional[Any]:
+    """pyarrow 为可选依赖，缺失时返回 None"""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def atomic_write_json(path: str, payload: Any) -> None:
+    """先写临时文件再 os.replace，保证读取方看到的文件总是完整的"""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _as_column(values: Any) -> np.ndarray:
+    column = np.asarray(values)
+    if column.dtype.kind == "U":
+        column = np.char.encode(column, "utf-8")
+    elif column.dtype.kind == "O":
+        column = np.asarray([str(v).encode("utf-8") for v in column.tolist()], dtype="S")
+    return column
+
+
+def to_columns(batch: Batch) -> Dict[str, np.ndarray]:
+    """把结构化数组、列字典或行字典序列统一转换为列字典（字符串列为 UTF-8 字节串）"""
+    if isinstance(batch, np.ndarray):
+        if batch.dtype.names is None:
+            raise ValueError("只接受结构化数组")
+        return {name: _as_column(batch[name]) for name in batch.dtype.names}
+    if isinstance(batch, Mapping):
+        return {name: _as_column(values) for name, values in batch.items()}
+    rows = [row.to_dict() if hasattr(row, "to_dict") else row for row in batch]
+    if not rows:
+        return {}
+    return {name: _as_column([row[name] for row in rows]) for name in rows[0]}
+
+
+class ResultSink:
+    """列式结果写入器
+
+    mode="w" 新建（删除已有的 manifest 与分片文件），mode="a" 在已有结果后追加（先与磁盘上的分片对账）。
+    backend 为 "auto"（有 pyarrow 时写 Parquet，否则写 npz）、"parquet" 或 "npz"；追加时沿用已有后端。
+    manifest_every 为两次重写 manifest 之间的行组数，0 表示只在 flush()/close() 时写入。
+    """
+
+    def __init__(self, path: str, mode: str = "w", backend: str = "auto", manifest_every: int = 8):
+        if mode not in ("w", "a"):
+            raise ValueError(f"未知模式: {mode}")
+        if backend not in ("auto", "parquet", "npz"):
+            raise ValueError(f"未知后端: {backend}")
+        if manifest_every < 0:
+            raise ValueError("manifest_every 不能为负数")
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+        self._manifest_path = os.path.join(self.path, MANIFEST_NAME)
+
+        resume = mode == "a" and os.path.exists(self._manifest_path)
+        if resume:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        else:
+            if backend == "auto":
+                backend = "parquet" if _load_pyarrow() is not None else "npz"
+            self.manifest = {"format": FORMAT_VERSION, "backend": backend, "schema": None,
+                             "parts": [], "rows": 0}
+        self.backend = self.manifest["backend"]
+        if self.backend == "parquet" and _load_pyarrow() is None:
+            raise ImportError("写入 Parquet 需要安装 pyarrow")
+        self._writer: Optional[Any] = None
+        self._part: Optional[Dict] = None
+        self.manifest_every = manifest_every
+        self._pending_groups = 0
+        self.closed = False
+        if resume:
+            self._reconcile()
+        else:
+            self._remove_unlisted()
+
+    def _remove_unlisted(self) -> None:
+        """删除不在 manifest 中的分片文件与残留的 manifest 临时文件"""
+        listed = {part["file"] for part in self.manifest["parts"]}
+        if not listed and os.path.exists(self._manifest_path):
+            os.remove(self._manifest_path)
+        for name in os.listdir(self.path):
+            if _PART_FILE.match(name) and name not in listed:
+                os.remove(os.path.join(self.path, name))
+
+    def _reconcile(self) -> None:
+        """追加前对账：收录上次崩溃前已写完但未登记的连续 npz 行组，删除其余未登记文件"""
+        if self.backend == "npz":
+            while True:
+                name = f"rg-{len(self.manifest['parts']):06d}.npz"
+                try:
+                    with np.load(os.path.join(self.path, name)) as npz:
+                        columns = {column: npz[column] for column in npz.files}
+                    lengths = {len(column) for column in columns.values()}
+                    if len(lengths) != 1:
+                        break
+                    self._check_schema(columns)
+                except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+                    break
+                n_rows = lengths.pop()
+                self.manifest["parts"].append({"file": name, "rows": n_rows})
+                self.manifest["rows"] += n_rows
+                self._pending_groups += 1
+        self._remove_unlisted()
+        if self._pending_groups:
+            self.flush()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def schema(self) -> Optional[List[List[str]]]:
+        """[[列名, NumPy dtype 字符串], ...]"""
+        return self.manifest["schema"]
+
+    @property
+    def rows(self) -> int:
+        return self.manifest["rows"]
+
+    def _check_schema(self, columns: Dict[str, np.ndarray]) -> None:
+        schema = [[name, column.dtype.str] for name, column in columns.items()]
+        if self.schema is None:
+            self.manifest["schema"] = schema
+            return
+        if [name for name, _ in schema] != [name for name, _ in self.schema]:
+            raise ValueError(f"列与 schema 不一致: {[name for name, _ in schema]}")
+        for (name, old), (_, new) in zip(self.schema, schema):
+            old_dtype, new_dtype = np.dtype(old), np.dtype(new)
+            if old_dtype.kind != new_dtype.kind:
+                raise ValueError(f"列 {name} 的类型与 schema 不一致: {new} != {old}")
+        # 字节串列的宽度可以随行组增长
+        self.manifest["schema"] = [
+            [name, max(np.dtype(old), np.dtype(new), key=lambda d: d.itemsize).str]
+            for (name, old), (_, new) in zip(self.schema, schema)
+        ]
+
+    def append(self, batch: Batch) -> int:
+        """写入一个行组，返回写入行数"""
+        if self.closed:
+            raise ValueError("ResultSink 已关闭")
+        columns = to_columns(batch)
+        if not columns:
+            return 0
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("各列长度不一致")
+        n_rows = lengths.pop()
+        if n_rows == 0:
+            return 0
+        self._check_schema(columns)
+
+        if self.backend == "npz":
+            name = f"rg-{len(self.manifest['parts']):06d}.npz"
+            np.savez(os.path.join(self.path, name), **columns)
+            self.manifest["parts"].append({"file": name, "rows": n_rows})
+        else:
+            self._write_parquet(columns, n_rows)
+        self.manifest["rows"] += n_rows
+        self._pending_groups += 1
+        if self.manifest_every and self._pending_groups >= self.manifest_every:
+            self.flush()
+        return n_rows
+
+    def flush(self) -> None:
+        """把 manifest 写入磁盘，使此前写入的 npz 行组对读取方可见"""
+        atomic_write_json(self._manifest_path, self.manifest)
+        self._pending_groups = 0
+
+    def _write_parquet(self, columns: Dict[str, np.ndarray], n_rows: int) -> None:
+        pa = _load_pyarrow()
+        arrays = [pa.array(column, type=pa.binary()) if column.dtype.kind == "S" else pa.array(column)
+                  for column in columns.values()]
+        table = pa.Table.from_arrays(arrays, names=list(columns))
+        if self._writer is None:
+            name = f"part-{len(self.manifest['parts']):05d}.parquet"
+            self._writer = pa.parquet.ParquetWriter(os.path.join(self.path, name), table.schema)
+            self._part = {"file": name, "rows": 0, "complete": False}
+            self.manifest["parts"].append(self._part)
+        self._writer.write_table(table)
+        self._part["rows"] += n_rows
+
+    def close(self) -> None:
+        """关闭写入器；Parquet 分片在关闭后才可读取"""
+        if self.closed:
+            return
+        if self._writer is not None:
+            self._writer.close()
+            self._part["complete"] = True
+            self._writer = None
+        self.flush()
+        self.closed = True
+
+
+def _read_manifest(path: str) -> Dict:
+    with open(os.path.join(path, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_result_groups(path: str, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """逐个行组读取，只加载 columns 指定的列"""
+    manifest = _read_manifest(path)
+    schema = dict((name, dtype) for name, dtype in manifest["schema"] or [])
+    columns = list(schema) if columns is None else list(columns)
+    missing = [name for name in columns if name not in schema]
+    if missing:
+        raise KeyError(f"结果中不存在的列: {missing}")
+
+    for part in manifest["parts"]:
+        file_path = os.path.join(path, part["file"])
+        if manifest["backend"] == "npz":
+            with np.load(file_path) as npz:
+                yield {name: npz[name] for name in columns}
+            continue
+        if not part.get("complete", True):
+            continue
+        parquet_file = _load_pyarrow().parquet.ParquetFile(file_path)
+        for group in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(group, columns=columns)
+            yield {name: _arrow_to_numpy(table.column(name), schema[name]) for name in columns}
+
+
+def _arrow_to_numpy(column: Any, dtype: str) -> np.ndarray:
+    if np.dtype(dtype).kind == "S":
+        return np.asarray(column.to_pylist(), dtype="S")
+    return column.to_numpy().astype(dtype, copy=False)
+
+
+def read_results(path: str, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """读取结果目录，返回列字典；只加载 columns 指定的列"""
+    schema = dict((name, dtype) for name, dtype in _read_manifest(path)["schema"] or [])
+    columns = list(schema) if columns is None else list(columns)
+    groups = list(iter_result_groups(path, columns))
+    if not groups:
+        return {name: np.empty(0, dtype=schema[name]) for name in columns}
+    return {name: np.concatenate([group[name] for group in groups]) for name in columns}
@@ -0,0 +1,83 @@
+"""
+紧凑结果类型 - 带 __slots__ 的数值型结果容器，单位作为类级元数据
+
+各类型的数值字段保持为 float，不再格式化为带单位的字符串；
+to_dict() 生成与旧接口相同风格的字典，供需要旧格式的调用方使用。
+"""
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional
+
+
+@dataclass
+class QuantumResult:
+    """量子计算结果容器"""
+    __slots__ = ("value", "confidence", "quantum_enhancement", "computation_time")
+
+    value: float
+    confidence: float
+    quantum_enhancement: float
+    computation_time: str
+
+
+@dataclass
+class MaterialCandidate:
+    """候选材料"""
+    __slots__ = ("material_id", "efficiency", "stability", "synthesis_complexity", "band_gap",
+                 "quantum_enhancement")
+    UNITS: ClassVar[Dict[str, str]] = {"efficiency": "%", "band_gap": "eV", "quantum_enhancement": "%"}
+
+    material_id: str
+    efficiency: float
+    stability: float
+    synthesis_complexity: str
+    band_gap: float
+    quantum_enhancement: float
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class DockedCompound:
+    """对接入选化合物"""
+    __slots__ = ("compound_id", "docking_score", "quantum_enhancement", "binding_affinity", "drug_likeness")
+    UNITS: ClassVar[Dict[str, str]] = {"binding_affinity": "nM"}
+
+    compound_id: str
+    docking_score: float
+    quantum_enhancement: float
+    binding_affinity: float
+    drug_likeness: float
+
+    def to_dict(self) -> Dict:
+        result = {name: getattr(self, name) for name in self.__slots__}
+        result["binding_affinity"] = f"{self.binding_affinity:.1f} nM"
+        return result
+
+
+@dataclass
+class PropertyPrediction:
+    """性质预测结果，未请求的性质为 None"""
+    __slots__ = ("composition", "band_gap", "conductivity", "stability", "quantum_confidence", "method")
+    UNITS: ClassVar[Dict[str, str]] = {"band_gap": "eV", "conductivity": "S/m"}
+    PROPERTIES: ClassVar[tuple] = ("band_gap", "conductivity", "stability")
+
+    composition: str
+    band_gap: Optional[float]
+    conductivity: Optional[float]
+    stability: Optional[float]
+    quantum_confidence: float
+    method: str
+
+    def to_dict(self) -> Dict:
+        predictions = {}
+        for name in self.PROPERTIES:
+            value = getattr(self, name)
+            if value is not None:
+                predictions[name] = f"{value:.2e} S/m" if name == "conductivity" else value
+        return {
+            "composition": self.composition,
+            "predictions": predictions,
+            "quantum_confidence": self.quantum_confidence,
+            "method": self.method
+        }
@@ -2,52 +2,99 @@
 ABN-QSS 安全核心模块 - 公开演示版本
 保护知识产权的同时展示技术潜力
 """
+import logging
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List, Optional, Any, Union  # 添加这行
-from dataclasses import dataclass
-from .font_utils import safe_plot_with_chinese, setup_chinese_font
-
-@dataclass
-class QuantumResult:
-    """量子计算结果容器"""
-    value: float
-    confidence: float
-    quantum_enhancement: float
-    computation_time: str
+from typing import Dict, List, Optional, Iterable, Union  # 添加这行
+from .screening import MaterialScreeningEngine
+from .docking import CompoundSource, resume_docking_screen, stream_docking_screen
+from .compound_library import CompoundLibrary
+from .admet import AdmetInput, batch_admet
+from .result_cache import ResultCache, seed_from_key, stable_key
+from .quantum_simulator import StateVectorSimulator
+from .quantum_circuit import QuantumCircuit
+from .property_sweep import ProgressCallback, property_sweep
+from .results import PropertyPrediction, QuantumResult
+from .result_sink import ResultSink
+from .instrumentation import instrumented
+from .log_utils import log_event
+
+logger = logging.getLogger(__name__)
+
+# 随机源：种子、Generator，或 None（使用平台的随机流，或由调用输入派生的确定性随机流）
+RandomSource = Union[int, np.random.Generator, None]
+
+
+def _resolve_rng(rng: RandomSource, default: Union[np.random.Generator, str]) -> np.random.Generator:
+    """把随机源解析为 Generator
+
+    rng 为 None 时：default 为 Generator（平台的随机流）则直接返回；为稳定键（见 stable_key）时
+    由该键派生确定性的生成器，同样的输入总是得到同样的结果，且不依赖全局或线程状态。
+    """
+    if rng is not None:
+        return np.random.default_rng(rng)
+    if isinstance(default, str):
+        return np.random.default_rng(seed_from_key(default))
+    return default
+
+
+def _n_screened(result: Dict) -> int:
+    """埋点条目数：结果中的已筛选数量，旧接口的结果没有该字段时按 1 计"""
+    return result.get("n_screened", 1)
+
 
 class QuantumResearchPlatform:
     """量子研究平台 - 公开演示版"""
     
-    def __init__(self, domain: str = "materials"):
+    def __init__(self, domain: str = "materials", seed: int = 42, cache: Optional[ResultCache] = None,
+                 rng: Optional[np.random.Generator] = None):
         self.domain = domain
+        self.seed = seed
+        self.cache = cache
         self.quantum_state = None
+        self.rng = rng
         self._initialize_quantum_simulator()
     
     def _initialize_quantum_simulator(self):
         """初始化量子模拟器（演示版本）"""
-        # 使用经典模拟量子行为，不涉及专利算法
-        np.random.seed(42)  # 固定种子保证可重复性
+        # 使用经典模拟量子行为，不涉及专利算法；每个平台持有独立的随机流，不修改全局 np.random 状态
+        if self.rng is None:
+            self.rng = np.random.default_rng(self.seed)  # 固定种子保证可重复性
+
+    def initialize_quantum_state(self, n_qubits: int) -> StateVectorSimulator:
+        """创建本地态矢量模拟器，作为平台的量子态"""
+        self.quantum_state = StateVectorSimulator(n_qubits)
+        return self.quantum_state
+
+    @instrumented()
+    def run_circuit(self, circuit: QuantumCircuit, fuse: bool = True) -> StateVectorSimulator:
+        """在平台的量子态上从 |0...0> 执行线路（默认融合编译，按结构复用编译方案）"""
+        if not isinstance(self.quantum_state, StateVectorSimulator) or \
+                self.quantum_state.n_qubits != circuit.n_qubits:
+            self.initialize_quantum_state(circuit.n_qubits)
+        self.quantum_state.reset()
+        return self.quantum_state.run(circuit, fuse=fuse)
         
-    def demo_material_screening(self, target_properties: Dict) -> Dict:
-        """材料筛选演示"""
-        print("🔬 启动量子增强材料筛选...")
+    @instrumented()
+    def demo_material_screening(self, target_properties: Dict, rng: RandomSource = None) -> Dict:
+        """材料筛选演示；rng（种子或 Generator）省略时使用平台的随机流"""
+        log_event(logger, logging.INFO, "material_screening.start", "启动量子增强材料筛选", domain=self.domain)
+        rng = _resolve_rng(rng, self.rng)
         
         # 模拟量子增强计算过程
-        base_efficiency = np.random.uniform(0.70, 0.75)
-        quantum_boost = np.random.uniform(0.08, 0.12)
+        base_efficiency = rng.uniform(0.70, 0.75)
+        quantum_boost = rng.uniform(0.08, 0.12)
         
         final_efficiency = min(0.95, base_efficiency + quantum_boost)
         
         # 生成候选材料
         candidates = []
         for i in range(5):
-            candidate_eff = final_efficiency * np.random.uniform(0.9, 1.1)
+            candidate_eff = final_efficiency * rng.uniform(0.9, 1.1)
             candidates.append({
                 "material_id": f"MAT_{i+1:03d}",
                 "efficiency": round(candidate_eff * 100, 1),
-                "stability": round(np.random.uniform(0.8, 0.95), 3),
-                "synthesis_complexity": np.random.choice(["Low", "Medium", "High"])
+                "stability": round(rng.uniform(0.8, 0.95), 3),
+                "synthesis_complexity": rng.choice(["Low", "Medium", "High"])
             })
         
         # 按效率排序
@@ -60,57 +107,139 @@ class QuantumResearchPlatform:
             "computation_time": "2-3 hours (simulated)",
             "notes": "Results based on quantum-inspired simulation"
         }
+
+    @instrumented(items=_n_screened)
+    def large_scale_screening(self, n_candidates: int, top_n: int = 10, seed: int = 42,
+                              chunk_size: int = 100_000, workers: Optional[int] = None,
+                              as_records: bool = False, sink: Optional[ResultSink] = None,
+                              checkpoint: Optional[str] = None, checkpoint_every: int = 10) -> Dict:
+        """大规模材料筛选：分块向量化生成，多进程并行，结果与进程数无关
+
+        as_records=True 时 candidates 为 MaterialCandidate 列表；传入 sink 时全部候选按块流式写入；
+        传入 checkpoint 时每完成 checkpoint_every 块保存一次进度，中断后用 resume_large_scale_screening 续算。
+        """
+        engine = MaterialScreeningEngine(seed=seed, chunk_size=chunk_size, workers=workers)
+        return engine.screen(n_candidates, top_n, as_records=as_records, sink=sink,
+                             checkpoint=checkpoint, checkpoint_every=checkpoint_every)
+
+    @instrumented(items=_n_screened)
+    def pareto_screening(self, n_candidates: int, target_properties: Optional[Dict] = None, seed: int = 42,
+                         chunk_size: int = 100_000, workers: Optional[int] = None,
+                         as_records: bool = False) -> Dict:
+        """多目标材料筛选：按 target_properties 过滤，返回效率、稳定性与合成难度的 Pareto 前沿
+
+        与 large_scale_screening 使用相同的候选流；各块在进程池中求出块内前沿后增量归并，不对全部候选排序。
+        """
+        engine = MaterialScreeningEngine(seed=seed, chunk_size=chunk_size, workers=workers)
+        return engine.pareto_screen(n_candidates, target_properties, as_records=as_records)
+
+    @staticmethod
+    @instrumented(items=_n_screened)
+    def resume_large_scale_screening(checkpoint: str, workers: Optional[int] = None,
+                                     as_records: bool = False) -> Dict:
+        """从检查点继续大规模筛选，结果与不中断运行逐位一致"""
+        return MaterialScreeningEngine.resume(checkpoint, workers=workers, as_records=as_records)
     
-    def quantum_property_prediction(self, composition: str, properties: List[str]) -> Dict:
-        """量子性质预测演示"""
-        predictions = {}
+    @instrumented()
+    def quantum_property_prediction(self, composition: str, properties: List[str],
+                                    as_records: bool = False, rng: RandomSource = None) -> Union[Dict, PropertyPrediction]:
+        """量子性质预测演示
+
+        未配置 cache 时使用 rng（种子或 Generator），省略时使用平台的随机流。
+        平台配置了 cache 时，每次调用使用由 (composition, properties, domain, seed) 派生的
+        确定性随机流（忽略 rng），并通过缓存复用结果；命中结果与重新计算完全一致。
+        as_records=True 时返回 PropertyPrediction（电导率为 S/m 数值）。
+        """
+        if self.cache is None:
+            record = self._predict_properties(composition, properties, _resolve_rng(rng, self.rng))
+        else:
+            key = stable_key("quantum_property_prediction", composition, list(properties), self.domain, self.seed)
+            rng = np.random.default_rng(seed_from_key(key))
+            record = self.cache.get_or_compute(key, lambda: self._predict_properties(composition, properties, rng))
+        return record if as_records else record.to_dict()
+
+    @instrumented(items=lambda result: result if isinstance(result, int) else len(result["composition"]))
+    def quantum_property_sweep(self, compositions: Iterable[str], properties: List[str],
+                               chunk_size: int = 100_000, workers: Optional[int] = 1,
+                               progress: Optional[ProgressCallback] = None,
+                               sink: Optional[ResultSink] = None) -> Union[Dict[str, np.ndarray], int]:
+        """批量性质扫描：对所有 组分 × 性质 组合向量化预测，返回列式结果表（使用平台 seed）
+
+        传入 sink 时结果按块流式写入，返回写入的行数。
+        """
+        return property_sweep(compositions, properties, seed=self.seed, chunk_size=chunk_size,
+                              workers=workers, progress=progress, sink=sink)
+
+    @staticmethod
+    def _predict_properties(composition: str, properties: List[str], rng: np.random.Generator) -> PropertyPrediction:
+        """性质预测核心"""
+        predictions: Dict[str, float] = {}
         
         for prop in properties:
             if prop == "band_gap":
-                base_gap = np.random.uniform(0.5, 3.0)
-                quantum_correction = np.random.uniform(-0.2, 0.2)
+                base_gap = rng.uniform(0.5, 3.0)
+                quantum_correction = rng.uniform(-0.2, 0.2)
                 predictions["band_gap"] = round(max(0.1, base_gap + quantum_correction), 3)
             
             elif prop == "conductivity":
-                base_cond = np.random.uniform(1e-6, 1e3)
-                quantum_enhance = np.random.uniform(1.5, 3.0)
-                predictions["conductivity"] = f"{base_cond * quantum_enhance:.2e} S/m"
+                base_cond = rng.uniform(1e-6, 1e3)
+                quantum_enhance = rng.uniform(1.5, 3.0)
+                predictions["conductivity"] = float(base_cond * quantum_enhance)
             
             elif prop == "stability":
-                predictions["stability"] = round(np.random.uniform(0.7, 0.95), 3)
+                predictions["stability"] = round(rng.uniform(0.7, 0.95), 3)
         
-        return {
-            "composition": composition,
-            "predictions": predictions,
-            "quantum_confidence": round(np.random.uniform(0.85, 0.95), 3),
-            "method": "Quantum-Enhanced DFT Simulation"
-        }
+        return PropertyPrediction(
+            composition=composition,
+            band_gap=predictions.get("band_gap"),
+            conductivity=predictions.get("conductivity"),
+            stability=predictions.get("stability"),
+            quantum_confidence=round(rng.uniform(0.85, 0.95), 3),
+            method="Quantum-Enhanced DFT Simulation"
+        )
 
 class MaterialScienceTools:
     """材料科学工具集"""
     
     @staticmethod
-    def quantum_crystal_analysis(composition: str, target_properties: Dict) -> Dict:
-        """量子晶体结构分析"""
-        print(f"🎯 分析 {composition} 的晶体结构...")
+    @instrumented()
+    def quantum_crystal_analysis(composition: str, target_properties: Dict,
+                                 cache: Optional[ResultCache] = None, seed: int = 42,
+                                 rng: RandomSource = None) -> Dict:
+        """量子晶体结构分析；传入 cache 时按 (composition, target_properties, seed) 确定性计算并缓存
+
+        未传入 cache 时使用 rng（种子或 Generator），省略时与缓存路径一样使用由输入派生的确定性随机流。
+        """
+        key = stable_key("quantum_crystal_analysis", composition, target_properties, "materials", seed)
+        if cache is None:
+            return MaterialScienceTools._crystal_analysis(composition, _resolve_rng(rng, key))
+
+        rng = np.random.default_rng(seed_from_key(key))
+        return cache.get_or_compute(key, lambda: MaterialScienceTools._crystal_analysis(composition, rng))
+
+    @staticmethod
+    def _crystal_analysis(composition: str, rng: np.random.Generator) -> Dict:
+        """晶体结构分析核心"""
+        log_event(logger, logging.INFO, "crystal_analysis.start", "分析 %s 的晶体结构", composition,
+                  composition=composition)
         
         # 模拟量子增强分析
         possible_phases = ["Cubic", "Tetragonal", "Orthorhombic", "Hexagonal"]
         stable_phases = []
         
         for phase in possible_phases:
-            stability_score = np.random.uniform(0.6, 0.98)
+            stability_score = rng.uniform(0.6, 0.98)
             if stability_score > 0.75:  # 稳定性阈值
                 stable_phases.append({
                     "phase": phase,
                     "stability": round(stability_score, 3),
-                    "formation_energy": round(np.random.uniform(-2.5, -0.5), 3)
+                    "formation_energy": round(rng.uniform(-2.5, -0.5), 3)
                 })
         
         return {
             "composition": composition,
             "stable_phases": stable_phases,
-            "recommended_phase": max(stable_phases, key=lambda x: x["stability"]),
+            "recommended_phase": max(stable_phases, key=lambda x: x["stability"], default=None),
             "quantum_insights": [
                 "High symmetry phases show better stability",
                 "Predicted novel polymorph with unique properties"
@@ -118,55 +247,54 @@ class MaterialScienceTools:
         }
     
     @staticmethod
+    @instrumented()
     def plot_material_properties(results: Dict):
         """绘制材料性质图表 - 修复中文显示"""
-        def _plot_function():
-            if "candidates" in results:
-                materials = [c["material_id"] for c in results["candidates"]]
-                efficiencies = [c["efficiency"] for c in results["candidates"]]
-                stabilities = [c["stability"] for c in results["candidates"]]
-                
-                fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-                
-                # 效率图表
-                ax1.bar(materials, efficiencies, color='skyblue')
-                ax1.tick_params(axis='x', rotation=45)
-                
-                # 稳定性图表
-                ax2.bar(materials, stabilities, color='lightcoral')
-                ax2.tick_params(axis='x', rotation=45)
-        
-            # 使用安全绘图函数
-            safe_plot_with_chinese(
-                title='材料性质分析',
-                xlabel='材料编号',
-                ylabel='数值',
-                plot_function=_plot_function,
-                grid=True
-            )
-            plt.tight_layout()
-            plt.show()
+        # 绘图依赖在首次调用时才导入，避免包导入时加载 matplotlib
+        import matplotlib.pyplot as plt
+        from .font_utils import setup_chinese_font
+        from .rendering import draw_material_properties
+        
+        if "candidates" not in results:
+            return
+        
+        setup_chinese_font()
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        draw_material_properties(ax1, ax2, results)
+        fig.suptitle('材料性质分析')
+        fig.tight_layout()
+        plt.show()
 
 class PharmaResearchTools:
     """药物研发工具集"""
     
     @staticmethod
-    def quantum_docking_screen(target_pdb: str, compound_library: str, top_k: int = 5) -> Dict:
-        """量子分子对接筛选"""
-        print(f"💊 对靶点 {target_pdb} 进行量子增强分子对接...")
+    @instrumented(items=_n_screened)
+    def quantum_docking_screen(target_pdb: str, compound_library: Union[str, CompoundLibrary], top_k: int = 5,
+                               rng: RandomSource = None) -> Dict:
+        """量子分子对接筛选；传入 CompoundLibrary 时直接流式筛选整个库文件
+
+        演示库的打分使用 rng（种子或 Generator），省略时使用由 (target_pdb, compound_library) 派生的确定性随机流。
+        """
+        if isinstance(compound_library, CompoundLibrary):
+            return PharmaResearchTools.library_docking_screen(target_pdb, compound_library, top_k=top_k)
+
+        log_event(logger, logging.INFO, "docking.start", "对靶点 %s 进行量子增强分子对接", target_pdb,
+                  target=target_pdb, library=compound_library)
         
         # 模拟量子对接结果
+        rng = _resolve_rng(rng, stable_key("quantum_docking_screen", target_pdb, compound_library))
         compounds = []
         for i in range(20):
-            base_score = np.random.uniform(0.1, 0.8)
-            quantum_boost = np.random.uniform(0.05, 0.15)
+            base_score = rng.uniform(0.1, 0.8)
+            quantum_boost = rng.uniform(0.05, 0.15)
             
             compounds.append({
                 "compound_id": f"CPD_{i+1:04d}",
                 "docking_score": round(base_score + quantum_boost, 3),
                 "quantum_enhancement": round(quantum_boost, 3),
-                "binding_affinity": f"{np.random.uniform(1, 100):.1f} nM",
-                "drug_likeness": round(np.random.uniform(0.6, 0.95), 3)
+                "binding_affinity": f"{rng.uniform(1, 100):.1f} nM",
+                "drug_likeness": round(rng.uniform(0.6, 0.95), 3)
             })
         
         # 按对接分数排序
@@ -179,16 +307,50 @@ class PharmaResearchTools:
             "quantum_improvement": "15-25% accuracy enhancement",
             "screening_time": "4-6 hours (simulated)"
         }
+
+    @staticmethod
+    @instrumented(items=_n_screened)
+    def library_docking_screen(target_pdb: str, compounds: CompoundSource, top_k: int = 5,
+                               chunk_size: int = 100_000, seed: int = 0, as_records: bool = False,
+                               sink: Optional[ResultSink] = None, checkpoint: Optional[str] = None,
+                               checkpoint_every: int = 10) -> Dict:
+        """化合物库级对接筛选：从文件或迭代器分块流式读取，只保留 top-k
+
+        as_records=True 时 top_compounds 为 DockedCompound 列表；传入 sink 时全部打分结果按块流式写入；
+        传入 checkpoint 时定期保存进度，中断后用 resume_docking_screen 续算。
+        """
+        log_event(logger, logging.INFO, "library_docking.start", "对靶点 %s 进行库级流式分子对接", target_pdb,
+                  target=target_pdb, chunk_size=chunk_size)
+        return stream_docking_screen(target_pdb, compounds, top_k=top_k, chunk_size=chunk_size, seed=seed,
+                                     as_records=as_records, sink=sink, checkpoint=checkpoint,
+                                     checkpoint_every=checkpoint_every)
+
+    @staticmethod
+    @instrumented(items=_n_screened)
+    def resume_docking_screen(checkpoint: str, compounds: Optional[CompoundSource] = None,
+                              as_records: bool = False) -> Dict:
+        """从检查点继续库级对接筛选；来源为文件时自动重新打开"""
+        log_event(logger, logging.INFO, "library_docking.resume", "从检查点继续库级流式分子对接",
+                  checkpoint=checkpoint)
+        return resume_docking_screen(checkpoint, compounds, as_records=as_records)
     
     @staticmethod
-    def admet_prediction(compound_data: Dict) -> Dict:
-        """ADMET性质预测"""
+    @instrumented()
+    def admet_prediction(compound_data: Dict, rng: RandomSource = None) -> Dict:
+        """ADMET性质预测；rng（种子或 Generator）省略时使用由 compound_data 派生的确定性随机流"""
+        rng = _resolve_rng(rng, stable_key("admet_prediction", compound_data))
         return {
             "compound_id": compound_data.get("compound_id", "Unknown"),
-            "absorption": round(np.random.uniform(0.7, 0.95), 3),
-            "distribution": round(np.random.uniform(0.6, 0.9), 3),
-            "metabolism": np.random.choice(["Fast", "Medium", "Slow"]),
-            "excretion": round(np.random.uniform(0.5, 0.85), 3),
-            "toxicity": round(np.random.uniform(0.1, 0.4), 3),
-            "overall_score": round(np.random.uniform(0.6, 0.9), 3)
+            "absorption": round(rng.uniform(0.7, 0.95), 3),
+            "distribution": round(rng.uniform(0.6, 0.9), 3),
+            "metabolism": rng.choice(["Fast", "Medium", "Slow"]),
+            "excretion": round(rng.uniform(0.5, 0.85), 3),
+            "toxicity": round(rng.uniform(0.1, 0.4), 3),
+            "overall_score": round(rng.uniform(0.6, 0.9), 3)
         }
+
+    @staticmethod
+    @instrumented(items=len)
+    def batch_admet_prediction(compounds: AdmetInput, seed: int = 0) -> np.ndarray:
+        """批量ADMET预测：一次向量化计算，返回结构化数组（metabolism 为 METABOLISM_LEVELS 下标）"""
+        return batch_admet(compounds, seed=seed)
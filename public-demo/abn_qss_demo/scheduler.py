@@ -0,0 +1,195 @@
+"""
+混合任务调度 - 可插拔计算后端 + 按任务代价自动选择后端
+
+对应架构文档中计算层的"混合任务调度"：小任务在调用线程内直接执行，
+中等任务交给线程池，大任务交给进程池；所有任务都以 Future 的形式返回。
+"""
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Sequence
+
+from .docking import CompoundSource, stream_docking_screen
+from .property_sweep import ProgressCallback, property_sweep
+from .screening import MaterialScreeningEngine
+
+
+class ComputeBackend:
+    """计算后端基类"""
+
+    name = "base"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ComputeBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @property
+    def executor(self) -> Executor:
+        """底层执行器（首次使用时才创建）"""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        raise NotImplementedError
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """提交任务，返回 Future"""
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭底层执行器"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+class SerialBackend(ComputeBackend):
+    """串行后端：在调用线程内立即执行，返回已完成的 Future"""
+
+    name = "serial"
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ThreadPoolBackend(ComputeBackend):
+    """线程池后端：适合 I/O 或释放 GIL 的向量化计算"""
+
+    name = "thread"
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+class ProcessPoolBackend(ComputeBackend):
+    """进程池后端：适合 CPU 密集型大任务，任务函数与参数须可序列化"""
+
+    name = "process"
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+
+def _run_screening(n_candidates: int, top_n: int, seed: int, chunk_size: int) -> Dict:
+    return MaterialScreeningEngine(seed=seed, chunk_size=chunk_size, workers=1).screen(n_candidates, top_n)
+
+
+def _run_property_prediction(domain: str, seed: int, composition: str, properties: List[str]) -> Dict:
+    from .safe_core import QuantumResearchPlatform
+    return QuantumResearchPlatform(domain=domain, seed=seed).quantum_property_prediction(composition, properties)
+
+
+class HybridScheduler:
+    """混合任务调度器：估算任务代价（约等于要处理的记录数），自动选择后端
+
+    代价 < serial_threshold 时串行执行；< process_threshold 时使用线程池；否则使用进程池。
+    大规模筛选任务会由线程池中的协调线程把各块分发到进程池，占满所有核心。
+    """
+
+    def __init__(self, serial_threshold: float = 10_000, process_threshold: float = 1_000_000,
+                 max_workers: Optional[int] = None):
+        if serial_threshold > process_threshold:
+            raise ValueError("serial_threshold 不能大于 process_threshold")
+        self.serial_threshold = serial_threshold
+        self.process_threshold = process_threshold
+        self.backends: Dict[str, ComputeBackend] = {
+            "serial": SerialBackend(),
+            "thread": ThreadPoolBackend(max_workers),
+            "process": ProcessPoolBackend(max_workers),
+        }
+        self.dispatch_counts = {name: 0 for name in self.backends}
+
+    def __enter__(self) -> "HybridScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        for backend in self.backends.values():
+            backend.shutdown(wait=wait)
+
+    @staticmethod
+    def estimate_cost(kind: str, **params: Any) -> float:
+        """估算任务代价（记录数量级）"""
+        if kind == "screening":
+            return float(params["n_candidates"])
+        if kind == "property_prediction":
+            compositions = params.get("compositions", [params.get("composition")])
+            return float(len(compositions) * max(1, len(params.get("properties", []))))
+        if kind == "docking":
+            compounds = params["compounds"]
+            return float(len(compounds)) if hasattr(compounds, "__len__") and not isinstance(compounds, str) \
+                else float("inf")
+        raise ValueError(f"未知任务类型: {kind}")
+
+    def select_backend(self, cost: float) -> ComputeBackend:
+        """按代价选择后端"""
+        if cost < self.serial_threshold:
+            return self.backends["serial"]
+        if cost < self.process_threshold:
+            return self.backends["thread"]
+        return self.backends["process"]
+
+    def submit(self, fn: Callable, *args: Any, cost: float = 0, **kwargs: Any) -> Future:
+        """按给定代价提交任意任务"""
+        backend = self.select_backend(cost)
+        self.dispatch_counts[backend.name] += 1
+        return backend.submit(fn, *args, **kwargs)
+
+    def submit_screening(self, n_candidates: int, top_n: int = 10, seed: int = 42,
+                         chunk_size: int = 100_000) -> Future:
+        """提交材料筛选任务；结果与 MaterialScreeningEngine 直接计算一致"""
+        cost = self.estimate_cost("screening", n_candidates=n_candidates)
+        backend = self.select_backend(cost)
+        self.dispatch_counts[backend.name] += 1
+        if backend.name != "process":
+            return backend.submit(_run_screening, n_candidates, top_n, seed, chunk_size)
+
+        engine = MaterialScreeningEngine(seed=seed, chunk_size=chunk_size)
+        process_pool = backend.executor
+        return self.backends["thread"].submit(engine.screen, n_candidates, top_n, executor=process_pool)
+
+    def submit_property_prediction(self, composition: str, properties: Sequence[str],
+                                   domain: str = "materials", seed: int = 42) -> Future:
+        """提交性质预测任务"""
+        cost = self.estimate_cost("property_prediction", composition=composition, properties=properties)
+        return self.submit(_run_property_prediction, domain, seed, composition, list(properties), cost=cost)
+
+    def submit_property_sweep(self, compositions: Sequence[str], properties: Sequence[str], seed: int = 42,
+                              chunk_size: int = 100_000,
+                              progress: Optional[ProgressCallback] = None) -> Future:
+        """提交批量性质扫描；大任务由协调线程把各块分发到进程池"""
+        cost = self.estimate_cost("property_prediction", compositions=compositions, properties=properties)
+        backend = self.select_backend(cost)
+        self.dispatch_counts[backend.name] += 1
+        if backend.name != "process":
+            return backend.submit(property_sweep, compositions, list(properties), seed=seed,
+                                  chunk_size=chunk_size, progress=progress)
+        return self.backends["thread"].submit(property_sweep, compositions, list(properties), seed=seed,
+                                              chunk_size=chunk_size, workers=backend.max_workers,
+                                              executor=backend.executor, progress=progress)
+
+    def submit_docking(self, target_pdb: str, compounds: CompoundSource, top_k: int = 5,
+                       chunk_size: int = 100_000, seed: int = 0) -> Future:
+        """提交分子对接筛选任务；流式来源（迭代器）无法估算大小时使用进程池"""
+        cost = self.estimate_cost("docking", compounds=compounds)
+        if cost == float("inf") and not isinstance(compounds, (str, os.PathLike)):
+            # 迭代器无法跨进程传递，退回线程池
+            cost = self.serial_threshold
+        return self.submit(stream_docking_screen, target_pdb, compounds, top_k=top_k,
+                           chunk_size=chunk_size, seed=seed, cost=cost)
@@ -0,0 +1,320 @@
+"""
+大规模材料筛选引擎 - 向量化分块生成 + 进程池并行
+"""
+import os
+import re
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Iterator, Tuple, Union
+import numpy as np
+
+from .checkpoint import load_checkpoint, save_checkpoint
+from .pareto import ParetoFront, pareto_front
+from .result_sink import ResultSink
+from .results import MaterialCandidate
+from .selection import select_top_k
+
+# 合成难度等级，候选记录中以下标存储
+COMPLEXITY_LEVELS = ("Low", "Medium", "High")
+
+# 候选材料记录的列式结构
+CANDIDATE_DTYPE = np.dtype([
+    ("index", "<i8"),
+    ("efficiency", "<f8"),
+    ("quantum_enhancement", "<f8"),
+    ("stability", "<f8"),
+    ("synthesis_complexity", "i1"),
+    ("band_gap", "<f8"),
+])
+
+# Pareto 筛选的目标：(字段名, 是否越大越好)
+MATERIAL_OBJECTIVES = (("efficiency", True), ("stability", True), ("synthesis_complexity", False))
+
+# 定性稳定性目标对应的下限
+STABILITY_LEVELS = {"low": 0.0, "medium": 0.85, "high": 0.9}
+
+_COMPARISON = re.compile(r"^\s*(>=|<=|>|<)\s*([-+]?\d+(?:\.\d*)?)\s*(%?)\s*$")
+
+# (块号, 起始序号, 块大小, 该块的种子序列)
+ChunkSpec = Tuple[int, int, int, np.random.SeedSequence]
+
+
+def generate_candidate_chunk(spec: ChunkSpec) -> np.ndarray:
+    """用该块独立的随机流一次性生成整块候选材料"""
+    _, start, size, seed_seq = spec
+    rng = np.random.default_rng(seed_seq)
+
+    base_efficiency = rng.uniform(0.70, 0.75, size)
+    quantum_boost = rng.uniform(0.08, 0.12, size)
+    spread = rng.uniform(0.9, 1.1, size)
+
+    chunk = np.empty(size, dtype=CANDIDATE_DTYPE)
+    chunk["index"] = np.arange(start, start + size)
+    chunk["efficiency"] = np.minimum(0.95, base_efficiency + quantum_boost) * spread
+    chunk["quantum_enhancement"] = quantum_boost
+    chunk["stability"] = rng.uniform(0.8, 0.95, size)
+    chunk["synthesis_complexity"] = rng.integers(0, len(COMPLEXITY_LEVELS), size)
+    chunk["band_gap"] = rng.uniform(0.5, 3.0, size)
+    return chunk
+
+
+def top_candidates(records: np.ndarray, top_n: int) -> np.ndarray:
+    """按效率降序（平分时序号小者优先）选出前 top_n 条记录"""
+    return records[select_top_k(records["efficiency"], records["index"], top_n)]
+
+
+def _screen_chunk(spec: ChunkSpec, top_n: int) -> np.ndarray:
+    """进程池任务：生成一块候选并只返回块内前 top_n"""
+    return top_candidates(generate_candidate_chunk(spec), top_n)
+
+
+def _parse_range(name: str, target: Any) -> Tuple[float, float]:
+    if isinstance(target, (tuple, list)):
+        if len(target) != 2:
+            raise ValueError(f"{name} 的区间必须是 (下限, 上限)")
+        low, high = target
+        return (-np.inf if low is None else float(low), np.inf if high is None else float(high))
+    if isinstance(target, str):
+        label = target.strip().lower()
+        if name == "stability" and label in STABILITY_LEVELS:
+            return STABILITY_LEVELS[label], np.inf
+        levels = [level.lower() for level in COMPLEXITY_LEVELS]
+        if name == "synthesis_complexity" and label in levels:
+            return 0.0, float(levels.index(label))
+        match = _COMPARISON.match(target)
+        if match is None:
+            raise ValueError(f"无法解析 {name} 的目标: {target!r}，请使用 (下限, 上限) 或 \">80%\" 这样的比较字符串")
+        op, number, percent = match.groups()
+        value = float(number) / (100 if percent else 1)
+        return {
+            ">": (np.nextafter(value, np.inf), np.inf),
+            ">=": (value, np.inf),
+            "<": (-np.inf, np.nextafter(value, -np.inf)),
+            "<=": (-np.inf, value),
+        }[op]
+    # 单个数值在连续字段上等价于几乎不可能满足的等值过滤，要求调用方写明区间或方向
+    raise ValueError(f"无法解析 {name} 的目标: {target!r}，请使用 (下限, 上限) 或 \">=1.5\" 这样的比较字符串")
+
+
+def parse_target_properties(target_properties: Optional[Dict]) -> Dict[str, Tuple[float, float]]:
+    """把目标性质解析为各字段的闭区间 {字段: (下限, 上限)}
+
+    支持 (下限, 上限) 元组（None 表示不限）、">80%"、"<=2.5" 等比较字符串（百分数按比例换算，
+    与记录中的效率一致）、stability 的 "low" / "medium" / "high"（见 STABILITY_LEVELS）
+    以及 synthesis_complexity 的 "Low" / "Medium" / "High"（不高于该等级）。
+    单个数值（如 1.5 或 "1.5"）在连续字段上没有明确含义，引发 ValueError。
+    """
+    fields = [name for name in CANDIDATE_DTYPE.names if name != "index"]
+    ranges = {}
+    for name, target in (target_properties or {}).items():
+        if name not in fields:
+            raise KeyError(f"未知的目标性质: {name}，可选: {fields}")
+        ranges[name] = _parse_range(name, target)
+    return ranges
+
+
+def filter_candidates(records: np.ndarray, ranges: Dict[str, Tuple[float, float]]) -> np.ndarray:
+    """只保留各字段都落在 ranges 闭区间内的记录"""
+    mask = np.ones(len(records), dtype=bool)
+    for name, (low, high) in ranges.items():
+        values = records[name]
+        mask &= (values >= low) & (values <= high)
+    return records[mask]
+
+
+def _pareto_chunk(spec: ChunkSpec, ranges: Dict[str, Tuple[float, float]]) -> Tuple[np.ndarray, int]:
+    """进程池任务：生成一块候选、按目标过滤，只返回 (块内前沿, 满足目标的条数)"""
+    matched = filter_candidates(generate_candidate_chunk(spec), ranges)
+    return pareto_front(matched, MATERIAL_OBJECTIVES), len(matched)
+
+
+def candidate_from_record(record: np.void, width: int = 3) -> MaterialCandidate:
+    """把一条候选记录转换为 MaterialCandidate（效率与量子增强以百分比表示）"""
+    return MaterialCandidate(
+        material_id=f"MAT_{int(record['index']) + 1:0{width}d}",
+        efficiency=round(float(record["efficiency"]) * 100, 1),
+        stability=round(float(record["stability"]), 3),
+        synthesis_complexity=COMPLEXITY_LEVELS[int(record["synthesis_complexity"])],
+        band_gap=round(float(record["band_gap"]), 3),
+        quantum_enhancement=round(float(record["quantum_enhancement"]) * 100, 1)
+    )
+
+
+def candidate_to_dict(record: np.void, width: int = 3) -> Dict:
+    """把一条候选记录转换为与 demo_material_screening 相同风格的字典"""
+    return candidate_from_record(record, width).to_dict()
+
+
+class MaterialScreeningEngine:
+    """材料筛选引擎：按块向量化生成候选，分发到进程池，归并得到 top-N
+
+    每块使用由 SeedSequence(seed).spawn 派生的独立随机流，不依赖全局种子。
+    结果只取决于 (seed, n_candidates, chunk_size)，与 workers 数量逐位无关。
+    """
+
+    CHECKPOINT_KIND = "material_screening"
+
+    def __init__(self, seed: Optional[int] = 42, chunk_size: int = 100_000, workers: Optional[int] = None):
+        if chunk_size < 1:
+            raise ValueError("chunk_size 必须为正数")
+        # seed=None 时立即取定熵值，保证 chunk_specs 多次调用与检查点续算得到同样的随机流
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy)
+        self.chunk_size = chunk_size
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    def chunk_specs(self, n_candidates: int) -> List[ChunkSpec]:
+        """划分候选序号区间，并为每块派生独立的种子序列"""
+        n_chunks = -(-n_candidates // self.chunk_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(n_chunks)
+        return [
+            (chunk_id, chunk_id * self.chunk_size,
+             min(self.chunk_size, n_candidates - chunk_id * self.chunk_size), seeds[chunk_id])
+            for chunk_id in range(n_chunks)
+        ]
+
+    def iter_chunks(self, n_candidates: int) -> Iterator[np.ndarray]:
+        """在当前进程中按顺序逐块生成全部候选"""
+        for spec in self.chunk_specs(n_candidates):
+            yield generate_candidate_chunk(spec)
+
+    def _map_chunks(self, fn: Callable[[ChunkSpec], Any], specs: List[ChunkSpec],
+                    executor: Optional[Executor] = None) -> Iterator[Any]:
+        """按块号顺序产出 fn(spec)；同时在途的块不超过 2 × workers，内存占用有界"""
+        if executor is None and (self.workers <= 1 or len(specs) <= 1):
+            yield from map(fn, specs)
+            return
+
+        # 进程池按需导入，导入包时不加载 multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        own_pool = executor is None
+        pool = ProcessPoolExecutor(max_workers=min(self.workers, len(specs))) if own_pool else executor
+        in_flight: Deque[Future] = deque()
+        try:
+            for spec in specs:
+                in_flight.append(pool.submit(fn, spec))
+                if len(in_flight) >= 2 * self.workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if own_pool:
+                pool.shutdown()
+
+    def screen_records(self, n_candidates: int, top_n: int = 10,
+                       executor: Optional[Executor] = None, sink: Optional[ResultSink] = None,
+                       checkpoint: Optional[str] = None, checkpoint_every: int = 10) -> np.ndarray:
+        """筛选 n_candidates 个候选，返回前 top_n 条记录（CANDIDATE_DTYPE）
+
+        传入 executor 时把各块分发到该执行器（如调度器的进程池），否则按 workers 自建进程池。
+        传入 sink 时每块的全部候选都按块号顺序写入 sink（一块一个行组），全量结果无需驻留内存。
+        传入 checkpoint 时每完成 checkpoint_every 块原子写入一次检查点，可用 resume 续算。
+        """
+        if sink is not None and checkpoint is not None:
+            raise ValueError("sink 与 checkpoint 不能同时使用")
+        best = np.empty(0, dtype=CANDIDATE_DTYPE)
+        return self._screen_from(n_candidates, top_n, 0, best, executor, sink, checkpoint, checkpoint_every)
+
+    def _screen_from(self, n_candidates: int, top_n: int, start_chunk: int, best: np.ndarray,
+                     executor: Optional[Executor], sink: Optional[ResultSink],
+                     checkpoint: Optional[str], checkpoint_every: int) -> np.ndarray:
+        """从第 start_chunk 块开始筛选，best 为此前各块的 top-N
+
+        select_top_k 的排序是全序，因此逐块归并的结果与归并顺序、分组方式无关。
+        """
+        specs = self.chunk_specs(n_candidates)
+        fn = partial(_screen_chunk, top_n=top_n) if sink is None else generate_candidate_chunk
+        done = start_chunk
+        for result in self._map_chunks(fn, specs[start_chunk:], executor):
+            if sink is not None:
+                sink.append(result)
+                result = top_candidates(result, top_n)
+            best = top_candidates(np.concatenate([best, result]), top_n)
+            done += 1
+            if checkpoint is not None and (done % checkpoint_every == 0 or done == len(specs)):
+                self._save_checkpoint(checkpoint, n_candidates, top_n, done, len(specs), checkpoint_every, best)
+        return best
+
+    def _save_checkpoint(self, path: str, n_candidates: int, top_n: int, done: int, n_chunks: int,
+                         checkpoint_every: int, best: np.ndarray) -> None:
+        meta = {
+            "kind": self.CHECKPOINT_KIND,
+            "seed_sequence": {"entropy": self.seed, "spawn_key": []},
+            "chunk_size": self.chunk_size,
+            "n_candidates": n_candidates,
+            "top_n": top_n,
+            # 块按块号顺序归并，已完成的块号为 range(completed_chunks)
+            "completed_chunks": done,
+            "n_chunks": n_chunks,
+            "checkpoint_every": checkpoint_every,
+            "complete": done == n_chunks,
+        }
+        save_checkpoint(path, meta, {"best": best})
+
+    @classmethod
+    def resume(cls, checkpoint: str, workers: Optional[int] = None, executor: Optional[Executor] = None,
+               as_records: bool = False) -> Dict:
+        """从检查点继续筛选，结果与不中断运行逐位一致；已完成的任务直接返回结果"""
+        meta, arrays = load_checkpoint(checkpoint, cls.CHECKPOINT_KIND)
+        engine = cls(seed=meta["seed_sequence"]["entropy"], chunk_size=meta["chunk_size"], workers=workers)
+        best = engine._screen_from(meta["n_candidates"], meta["top_n"], meta["completed_chunks"], arrays["best"],
+                                   executor, None, checkpoint, meta["checkpoint_every"])
+        return engine._summarize(best, meta["n_candidates"], as_records)
+
+    def screen(self, n_candidates: int, top_n: int = 10, executor: Optional[Executor] = None,
+               as_records: bool = False, sink: Optional[ResultSink] = None,
+               checkpoint: Optional[str] = None, checkpoint_every: int = 10) -> Dict:
+        """筛选并返回与 demo_material_screening 相同风格的结果字典
+
+        as_records=True 时 candidates 为 MaterialCandidate 列表而非字典列表；
+        sink 用于流式导出全部候选，checkpoint 用于断点续算，见 screen_records。
+        """
+        best = self.screen_records(n_candidates, top_n, executor=executor, sink=sink,
+                                   checkpoint=checkpoint, checkpoint_every=checkpoint_every)
+        return self._summarize(best, n_candidates, as_records)
+
+    def pareto_screen(self, n_candidates: int, target_properties: Optional[Dict] = None,
+                      executor: Optional[Executor] = None, as_records: bool = False) -> Dict:
+        """多目标筛选：按 target_properties 过滤，返回效率、稳定性（越大越好）与合成难度（越小越好）的 Pareto 前沿
+
+        各块在进程池中生成、过滤并求出块内前沿，主进程只把块内前沿并入 ParetoFront，
+        全部候选既不同时驻留内存也不参与排序。前沿按效率、稳定性降序、合成难度升序排列，平分时序号小者优先；
+        结果与 screen 一样只取决于 (seed, n_candidates, chunk_size)，与 workers 无关。
+        """
+        ranges = parse_target_properties(target_properties)
+        front = ParetoFront(MATERIAL_OBJECTIVES, CANDIDATE_DTYPE, order="index")
+        n_matched = 0
+        fn = partial(_pareto_chunk, ranges=ranges)
+        for chunk_front, matched in self._map_chunks(fn, self.chunk_specs(n_candidates), executor):
+            front.update(chunk_front)
+            n_matched += matched
+
+        width = max(3, len(str(n_candidates)))
+        records = [candidate_from_record(record, width) for record in front.records]
+        candidates: List[Union[MaterialCandidate, Dict]] = \
+            records if as_records else [record.to_dict() for record in records]
+        return {
+            "candidates": candidates,
+            "front_size": len(records),
+            "n_matched": n_matched,
+            "n_screened": n_candidates,
+            "objectives": [name for name, _ in MATERIAL_OBJECTIVES],
+            "seed": self.seed,
+            "notes": "Results based on quantum-inspired simulation"
+        }
+
+    def _summarize(self, best: np.ndarray, n_candidates: int, as_records: bool) -> Dict:
+        width = max(3, len(str(n_candidates)))
+        records = [candidate_from_record(record, width) for record in best]
+        candidates: List[Union[MaterialCandidate, Dict]] = \
+            records if as_records else [record.to_dict() for record in records]
+        return {
+            "candidates": candidates,
+            "best_efficiency": records[0].efficiency if records else None,
+            "n_screened": n_candidates,
+            "seed": self.seed,
+            "notes": "Results based on quantum-inspired simulation"
+        }
@@ -0,0 +1,27 @@
+"""
+排名选择工具 - 不做全量排序的确定性 top-k
+"""
+import numpy as np
+
+
+def select_top_k(scores: np.ndarray, order: np.ndarray, k: int) -> np.ndarray:
+    """返回分数最高的 k 个元素的下标，按 (分数降序, order 升序) 排列
+
+    order 为全局先后次序（如样本序号），用于打破平分，
+    因此结果与 sorted(..., reverse=True)[:k] 的稳定排序语义一致，且与分块方式无关。
+    只对候选集合做 O(n) 的 partition，再对至多 k 个元素排序。
+    """
+    scores = np.asarray(scores)
+    order = np.asarray(order)
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if n > k:
+        threshold = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)
+        tied = tied[np.argsort(order[tied], kind="stable")[:k - len(above)]]
+        picked = np.concatenate([above, tied])
+    else:
+        picked = np.arange(n)
+    return picked[np.lexsort((order[picked], -scores[picked]))]
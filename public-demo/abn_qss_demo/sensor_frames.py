@@ -0,0 +1,65 @@
+"""
+传感器帧 - 可穿戴设备读数的定长二进制线格式与零拷贝解码
+
+每帧 40 字节，小端序，字段依次为：
+    device_id     <u4   设备 id
+    sequence      <u4   设备内的帧序号
+    timestamp_ms  <u8   采样时间（Unix 毫秒）
+    heart_rate … impedance  6 × <f4，顺序与 SENSOR_CHANNELS 相同，NaN 表示该帧缺少此通道
+
+decode_frames 用 np.frombuffer 把收到的缓冲区直接映射为结构化数组，不复制、不为字段创建 Python 对象；
+结构化数组可直接传给 batch_monitoring / batch_analyze_metabolic_state / CohortMonitor.monitor_tick。
+"""
+from typing import Any, Dict, Optional, Sequence, Union
+import numpy as np
+
+from .health_monitoring import SENSOR_CHANNELS
+
+FRAME_DTYPE = np.dtype(
+    [("device_id", "<u4"), ("sequence", "<u4"), ("timestamp_ms", "<u8")]
+    + [(name, "<f4") for name in SENSOR_CHANNELS]
+)
+FRAME_SIZE = FRAME_DTYPE.itemsize
+
+Buffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+
+def decode_frames(buffer: Buffer) -> np.ndarray:
+    """把缓冲区零拷贝映射为帧数组（与缓冲区共享内存；bytes 输入时数组只读）"""
+    view = memoryview(buffer)
+    if view.nbytes % FRAME_SIZE:
+        raise ValueError(f"缓冲区长度 {view.nbytes} 不是帧长 {FRAME_SIZE} 的整数倍")
+    return np.frombuffer(view, dtype=FRAME_DTYPE)
+
+
+def encode_frames(readings: Union[Sequence[Dict[str, Any]], Dict[str, Any], np.ndarray],
+                  device_id: Union[int, Sequence[int], np.ndarray] = 0,
+                  sequence: Optional[Union[Sequence[int], np.ndarray]] = None,
+                  timestamp_ms: Union[int, Sequence[int], np.ndarray] = 0) -> bytes:
+    """把读数编码为帧字节串
+
+    readings 可以是读数字典序列、{通道: 数组} 字典或 (样本数, 通道数) 二维数组；缺失的通道编码为 NaN。
+    sequence 省略时为 0..n-1。
+    """
+    if isinstance(readings, np.ndarray) and readings.dtype.names is None:
+        block = np.asarray(readings, dtype=np.float64)
+        if block.ndim != 2 or block.shape[1] != len(SENSOR_CHANNELS):
+            raise ValueError(f"数据块必须是 (样本数, {len(SENSOR_CHANNELS)}) 的二维数组")
+        columns = {name: block[:, i] for i, name in enumerate(SENSOR_CHANNELS)}
+        n = len(block)
+    elif isinstance(readings, (dict, np.ndarray)):
+        names = readings.dtype.names if isinstance(readings, np.ndarray) else list(readings)
+        columns = {name: np.asarray(readings[name], dtype=np.float64) for name in names if name in SENSOR_CHANNELS}
+        n = len(readings) if isinstance(readings, np.ndarray) else len(next(iter(columns.values()), ()))
+    else:
+        n = len(readings)
+        columns = {name: np.array([reading.get(name, np.nan) for reading in readings], dtype=np.float64)
+                   for name in SENSOR_CHANNELS}
+
+    frames = np.zeros(n, dtype=FRAME_DTYPE)
+    frames["device_id"] = device_id
+    frames["sequence"] = np.arange(n) if sequence is None else sequence
+    frames["timestamp_ms"] = timestamp_ms
+    for name in SENSOR_CHANNELS:
+        frames[name] = columns.get(name, np.nan)
+    return frames.tobytes()
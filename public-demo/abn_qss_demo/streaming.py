@@ -0,0 +1,128 @@
+"""
+流式监测模块 - 以滑动窗口基线处理连续传感器数据流
+"""
+from collections import deque
+from typing import Dict, List, Optional, AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+import math
+
+from .health_monitoring import SENSOR_CHANNELS, HealthMonitoringSystem
+from .instrumentation import instrumented
+
+
+class RunningStats:
+    """单通道的增量均值/方差（Welford 算法），每次更新 O(1)
+
+    指定 window 时只统计最近 window 个样本：新样本加入、最旧样本移出都是 O(1) 更新，
+    内存占用固定为 window 个浮点数；window 为 None 时统计全部历史且不保存样本。
+    """
+
+    __slots__ = ("window", "count", "mean", "_m2", "_values")
+
+    def __init__(self, window: Optional[int] = None):
+        if window is not None and window < 2:
+            raise ValueError("滑动窗口至少需要 2 个样本")
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._values = deque() if window is not None else None
+
+    def push(self, value: float) -> None:
+        """加入一个样本，窗口已满时先移出最旧的样本"""
+        if self._values is not None:
+            if len(self._values) == self.window:
+                self._remove(self._values.popleft())
+            self._values.append(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        """Welford 的逆向更新"""
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 = max(0.0, self._m2 - delta * (value - self.mean))
+
+    @property
+    def variance(self) -> float:
+        """样本方差"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """样本标准差"""
+        return math.sqrt(self.variance)
+
+
+class StreamingMonitor:
+    """流式健康监测：惰性地逐个产出结果，基线随数据流滚动更新
+
+    每个读数先与当前滚动基线比较（结果与以该基线调用 real_time_monitoring 一致），
+    再并入基线。前 warmup 个读数只用于建立基线，不产出结果。
+    某通道偏离滚动均值超过 drift_threshold 个标准差时记为漂移。
+    """
+
+    def __init__(self, window: Optional[int] = 500, warmup: int = 30, drift_threshold: float = 3.0,
+                 channels: Sequence[str] = SENSOR_CHANNELS):
+        self.channels = tuple(channels)
+        self.warmup = warmup
+        self.drift_threshold = drift_threshold
+        self.stats = {name: RunningStats(window) for name in self.channels}
+        self.samples_seen = 0
+        self._system = HealthMonitoringSystem()
+
+    def current_baseline(self) -> Dict[str, float]:
+        """当前滚动基线（各通道的窗口均值）"""
+        return {name: stats.mean for name, stats in self.stats.items() if stats.count > 0}
+
+    @instrumented()
+    def update(self, reading: Dict) -> Optional[Dict]:
+        """处理一个读数；预热阶段返回 None"""
+        result = None
+        if self.samples_seen >= self.warmup:
+            baseline = self.current_baseline()
+            self._system.baseline = baseline
+            self._system.metabolic_mirror.set_baseline(baseline)
+
+            result = self._system.real_time_monitoring(reading)
+            result["drift_channels"] = self._detect_drift(reading)
+            result["samples_seen"] = self.samples_seen
+
+        for name, stats in self.stats.items():
+            value = reading.get(name)
+            if value is not None:
+                stats.push(value)
+        self.samples_seen += 1
+        return result
+
+    def process(self, readings: Iterable[Dict]) -> Iterator[Dict]:
+        """消费读数迭代器，惰性产出监测结果"""
+        for reading in readings:
+            result = self.update(reading)
+            if result is not None:
+                yield result
+
+    async def aprocess(self, readings: AsyncIterable[Dict]) -> AsyncIterator[Dict]:
+        """消费异步读数迭代器，惰性产出监测结果"""
+        async for reading in readings:
+            result = self.update(reading)
+            if result is not None:
+                yield result
+
+    def _detect_drift(self, reading: Dict) -> List[str]:
+        """找出偏离滚动均值超过阈值的通道"""
+        drifted = []
+        for name, stats in self.stats.items():
+            value = reading.get(name)
+            if value is None or stats.count < 2:
+                continue
+            std = stats.std
+            if std > 0 and abs(value - stats.mean) / std > self.drift_threshold:
+                drifted.append(name)
+        return drifted
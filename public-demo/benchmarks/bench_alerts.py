@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+告警输出基准测试：逐样本提醒字符串列表 (_generate_insights) vs 增量告警引擎（只输出状态切换）
+
+用法: python benchmarks/bench_alerts.py --patients 10000 --ticks 100
+"""
+import argparse
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.alerts import AlertEngine
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem
+
+
+def _signals(patients, ticks, seed):
+    """慢变的偏离分数与代谢率（随机游走），模拟连续监测数据"""
+    rng = np.random.default_rng(seed)
+    deviation = np.abs(0.1 + np.cumsum(rng.normal(0, 0.01, (ticks, patients)), axis=0))
+    rate = 1.0 + np.cumsum(rng.normal(0, 0.01, (ticks, patients)), axis=0)
+    return deviation, rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--patients", type=int, default=10_000, help="患者数")
+    parser.add_argument("--ticks", type=int, default=100, help="时刻数")
+    parser.add_argument("--debounce", type=int, default=3, help="去抖窗口（样本数）")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    deviation, rate = _signals(args.patients, args.ticks, args.seed)
+    system = HealthMonitoringSystem()
+
+    start = perf_counter()
+    legacy_lists = 0
+    legacy_strings = 0
+    for t in range(args.ticks):
+        for d, r in zip(deviation[t].tolist(), rate[t].tolist()):
+            alerts = system._generate_insights(d, {"state": "normal" if 0.9 < r < 1.1 else "abnormal"})
+            legacy_lists += 1
+            legacy_strings += len(alerts)
+    legacy_seconds = perf_counter() - start
+
+    results = {}
+    for label, engine in (("无迟滞", AlertEngine(deviation_exit=0.15, metabolic_margin=0.0)),
+                          (f"迟滞 + 去抖 {args.debounce}", AlertEngine(debounce=args.debounce))):
+        start = perf_counter()
+        n_events = sum(len(engine.update(deviation[t], rate[t])) for t in range(args.ticks))
+        results[label] = (n_events, perf_counter() - start)
+
+    samples = args.patients * args.ticks
+    print(f"🚨 {args.patients} 名患者 × {args.ticks} 个时刻 = {samples} 个样本")
+    print(f"   _generate_insights       {legacy_strings:10d} 条提醒（{legacy_lists} 个列表）  {legacy_seconds:8.3f} s")
+    for label, (n_events, seconds) in results.items():
+        print(f"   AlertEngine {label:<12} {n_events:10d} 个切换事件          "
+              f"{seconds:8.3f} s  输出量 {n_events / legacy_strings:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+门融合基准测试：变分线路逐门执行 vs 融合编译执行，以及参数扫描时的编译缓存收益
+
+用法: python benchmarks/bench_circuit_fusion.py --qubits 20 --layers 4 --sweep 10
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo import StateVectorSimulator, compile_circuit
+from abn_qss_demo.quantum_circuit import fusion_plan, variational_ansatz
+
+
+def _sweep(sim, circuits, fuse):
+    start = time.perf_counter()
+    for circuit in circuits:
+        sim.reset()
+        sim.run(circuit, fuse=fuse)
+    return (time.perf_counter() - start) / len(circuits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=18, help="量子比特数")
+    parser.add_argument("--layers", type=int, default=4, help="变分线路层数")
+    parser.add_argument("--sweep", type=int, default=5, help="参数扫描点数")
+    parser.add_argument("--repeat", type=int, default=5, help="交替重复的轮数")
+    args = parser.parse_args()
+
+    circuit = variational_ansatz(args.qubits, np.zeros(2 * args.qubits * args.layers), args.layers)
+    fusion_plan.cache_clear()
+    start = time.perf_counter()
+    compiled = compile_circuit(circuit)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    compile_circuit(circuit)
+    warm = time.perf_counter() - start
+
+    print(f"⚛️  变分线路: {args.qubits} 量子比特 × {args.layers} 层")
+    print(f"   态矢量遍历次数  逐门 {compiled.n_source_gates}  →  融合 {len(compiled.ops)}")
+    print(f"   编译耗时        首次 {cold * 1e3:.2f} ms  缓存 {warm * 1e3:.2f} ms")
+
+    sim = StateVectorSimulator(args.qubits)
+    rng = np.random.default_rng(0)
+    # 每个扫描点都重新构建线路并编译（命中结构缓存）；两种方式交替运行，各取最快的一轮以减少噪声
+    circuits = [variational_ansatz(args.qubits, rng.uniform(0, np.pi, 2 * args.qubits * args.layers), args.layers)
+                for _ in range(args.sweep)]
+    unfused = fused = float("inf")
+    for _ in range(args.repeat):
+        unfused = min(unfused, _sweep(sim, circuits, fuse=False))
+        fused = min(fused, _sweep(sim, circuits, fuse=True))
+    print(f"   每个扫描点      逐门 {unfused * 1e3:.1f} ms  融合 {fused * 1e3:.1f} ms  ({unfused / fused:.1f}x)")
+    assert fused <= unfused, f"融合执行 ({fused * 1e3:.1f} ms) 比逐门执行 ({unfused * 1e3:.1f} ms) 慢"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+化合物库基准测试：解析 CSV 文本 vs 打开 memmap 库文件
+
+用法: python benchmarks/bench_compound_library.py --n 1000000
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.compound_library import CompoundLibrary, convert_text_library
+
+
+def _write_csv(path: str, n: int) -> None:
+    rng = np.random.default_rng(0)
+    mw = rng.uniform(150, 500, n)
+    logp = rng.uniform(-2, 5, n)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("compound_id,smiles,mw,logp\n")
+        for i in range(n):
+            f.write(f"ZINC{i:09d},CC(=O)OC1=CC=CC=C1C(=O)O,{mw[i]:.6f},{logp[i]:.6f}\n")
+
+
+def _parse_text(path: str) -> float:
+    """基线：逐行解析文本，得到 id 与描述符数组"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        ids, mw, logp = [], [], []
+        for row in reader:
+            ids.append(row[0])
+            mw.append(float(row[2]))
+            logp.append(float(row[3]))
+    return float(np.asarray(mw).sum() + np.asarray(logp).sum())
+
+
+def _read_library(path: str) -> float:
+    library = CompoundLibrary(path)
+    return float(library.column("mw").sum() + library.column("logp").sum())
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="化合物数量")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "library.csv")
+        lib_path = os.path.join(tmp, "library.cpl")
+        _write_csv(csv_path, args.n)
+
+        convert_time, _ = _timed(convert_text_library, csv_path, lib_path)
+        parse_time, parse_sum = _timed(_parse_text, csv_path)
+        open_time, _ = _timed(CompoundLibrary, lib_path)
+        read_time, read_sum = _timed(_read_library, lib_path)
+        assert np.isclose(parse_sum, read_sum, rtol=1e-9)
+
+        print(f"📚 化合物数量: {args.n:,}")
+        print(f"   一次性转换:        {convert_time:8.3f} s")
+        print(f"   解析文本:          {parse_time:8.3f} s")
+        print(f"   打开库文件:        {open_time * 1000:8.3f} ms")
+        print(f"   打开并读取描述符:  {read_time:8.3f} s  (加速 {parse_time / read_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
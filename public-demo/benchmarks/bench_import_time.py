@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+包导入耗时基准测试：基于 python -X importtime 统计 import abn_qss_demo 的累计耗时
+
+用法: python benchmarks/bench_import_time.py --repeat 5 --max-ms 500
+超过 --max-ms，或导入过程加载了绘图模块（matplotlib）时以非零状态退出。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PACKAGE = "abn_qss_demo"
+FORBIDDEN_MODULES = ("matplotlib",)
+DEMO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def measure_import() -> Tuple[float, Dict[str, float]]:
+    """在全新解释器中导入一次，返回 (包累计耗时 ms, {模块: 累计耗时 ms})"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        cwd=DEMO_ROOT, capture_output=True, text=True, check=True
+    )
+    modules: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        modules[name] = int(cumulative) / 1000
+    return modules[PACKAGE], modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="重复测量次数（取中位数）")
+    parser.add_argument("--max-ms", type=float, default=None, help="导入耗时上限（毫秒）")
+    parser.add_argument("--top", type=int, default=10, help="显示最慢的模块数")
+    args = parser.parse_args()
+
+    totals: List[float] = []
+    modules: Dict[str, float] = {}
+    for _ in range(args.repeat):
+        total, modules = measure_import()
+        totals.append(total)
+    median = statistics.median(totals)
+
+    print(f"📦 import {PACKAGE}: 中位数 {median:.1f} ms（{args.repeat} 次，最小 {min(totals):.1f} ms）")
+    for name, cost in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"   {cost:8.1f} ms  {name}")
+
+    failed = False
+    loaded = [name for name in modules if name.split(".")[0] in FORBIDDEN_MODULES]
+    if loaded:
+        print(f"❌ 导入时加载了绘图模块: {', '.join(sorted(loaded)[:5])}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"❌ 导入耗时 {median:.1f} ms 超过上限 {args.max_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
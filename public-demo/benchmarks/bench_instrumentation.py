@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+埋点开销基准测试（纳秒/次调用）：未装饰 vs 埋点关闭（类上为原始方法）vs 埋点开启
+
+用法: python benchmarks/bench_instrumentation.py --calls 200000
+"""
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo import instrumentation
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem
+from abn_qss_demo.instrumentation import instrumented
+
+READING = {"heart_rate": 72.0, "hrv": 45.0, "blood_oxygen": 98.0,
+           "skin_conductance": 2.5, "temperature": 36.6, "impedance": 500.0}
+
+
+class _Bench:
+    def bare(self, x):
+        return x
+
+    @instrumented(name="bench.noop")
+    def noop(self, x):
+        return x
+
+
+def _per_call_ns(fn, calls):
+    start = perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (perf_counter() - start) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="每种情形的调用次数")
+    args = parser.parse_args()
+
+    bench = _Bench()
+    system = HealthMonitoringSystem()
+    system.initialize_baseline(READING)
+    # 未装饰的对照：直接调用原始函数
+    raw_monitoring = HealthMonitoringSystem.real_time_monitoring
+    monitoring_calls = args.calls // 10
+
+    instrumentation.disable()
+    bare = _per_call_ns(bench.bare, args.calls)
+    off = _per_call_ns(bench.noop, args.calls)
+    monitoring_bare = _per_call_ns(lambda _: raw_monitoring(system, READING), monitoring_calls)
+    monitoring_off = _per_call_ns(lambda _: system.real_time_monitoring(READING), monitoring_calls)
+    instrumentation.enable()
+    on = _per_call_ns(bench.noop, args.calls)
+    monitoring_on = _per_call_ns(lambda _: system.real_time_monitoring(READING), monitoring_calls)
+    instrumentation.disable()
+
+    print("⏱️ 单次调用耗时（纳秒）")
+    print(f"   空方法                  未装饰 {bare:8.0f}   关闭 {off:8.0f}   开启 {on:8.0f}")
+    print(f"   real_time_monitoring    未装饰 {monitoring_bare:8.0f}   关闭 {monitoring_off:8.0f}   开启 {monitoring_on:8.0f}")
+    print(f"   埋点关闭时的额外开销  {off - bare:.0f} ns/次")
+    stats = instrumentation.snapshot()["bench.noop"]
+    print(f"   开启时记录: {stats['calls']} 次调用, p50 ≤ {stats['p50_seconds'] * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
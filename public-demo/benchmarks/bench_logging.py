@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+日志开销基准测试（微秒/次调用）：print vs 日志关闭 vs 队列日志（限流）vs 同步 StreamHandler
+
+用法: python benchmarks/bench_logging.py --calls 20000
+"""
+import argparse
+import contextlib
+import logging
+import os
+import sys
+from time import perf_counter
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.log_utils import LOGGER_NAME, StructuredFormatter, configure_logging, log_event, shutdown_logging
+from abn_qss_demo.safe_core import QuantumResearchPlatform
+
+logger = logging.getLogger("abn_qss_demo.bench")
+
+
+def _per_call_us(fn, calls):
+    start = perf_counter()
+    for _ in range(calls):
+        fn()
+    return (perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000, help="每种情形的调用次数")
+    args = parser.parse_args()
+
+    package_logger = logging.getLogger(LOGGER_NAME)
+    platform = QuantumResearchPlatform()
+    analysis = lambda: platform.demo_material_screening({})
+    message = lambda: log_event(logger, logging.INFO, "bench.tick", "分析 %s 的晶体结构", "Li2O", composition="Li2O")
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            printed = _per_call_us(lambda: print("🎯 分析 Li2O 的晶体结构..."), args.calls)
+
+        package_logger.setLevel(logging.WARNING)
+        off = _per_call_us(message, args.calls)
+        analysis_off = _per_call_us(analysis, args.calls // 10)
+
+        handler = configure_logging(stream=devnull)
+        queued = _per_call_us(message, args.calls)
+        analysis_queued = _per_call_us(analysis, args.calls // 10)
+        shutdown_logging()
+
+        handler_unlimited = configure_logging(stream=devnull, rate=None, queue_size=args.calls)
+        unlimited = _per_call_us(message, args.calls)
+        shutdown_logging()
+
+        direct = logging.StreamHandler(devnull)
+        direct.setFormatter(StructuredFormatter())
+        package_logger.addHandler(direct)
+        package_logger.setLevel(logging.INFO)
+        synchronous = _per_call_us(message, args.calls)
+        package_logger.removeHandler(direct)
+        package_logger.setLevel(logging.NOTSET)
+
+    print("⏱️ 单条消息耗时（微秒/次，调用方线程）")
+    print(f"   print 到 stdout              {printed:8.2f}")
+    print(f"   日志关闭                     {off:8.2f}")
+    print(f"   队列日志（限流 10 条/秒）    {queued:8.2f}")
+    print(f"   队列日志（不限流）           {unlimited:8.2f}   丢弃 {handler_unlimited.dropped}")
+    print(f"   同步 StreamHandler           {synchronous:8.2f}")
+    print(f"🎯 demo_material_screening      日志关闭 {analysis_off:8.2f}   队列日志 {analysis_queued:8.2f}"
+          f"   丢弃 {handler.dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+性质扫描基准测试：逐个调用 quantum_property_prediction vs 向量化批量扫描
+
+用法: python benchmarks/bench_property_sweep.py --n 1000000 --workers 4
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo import QuantumResearchPlatform
+
+PROPERTIES = ["band_gap", "conductivity", "stability"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="组分数量")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="每块组分数")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="并行进程数")
+    parser.add_argument("--baseline-n", type=int, default=20_000, help="逐个调用基线的组分数")
+    args = parser.parse_args()
+
+    platform = QuantumResearchPlatform()
+    compositions = [f"Composition_{i:07d}" for i in range(args.n)]
+
+    start = time.perf_counter()
+    for composition in compositions[:args.baseline_n]:
+        platform.quantum_property_prediction(composition, PROPERTIES)
+    per_call = (time.perf_counter() - start) / args.baseline_n
+
+    def report(done, total):
+        print(f"\r   进度 {done / total:6.1%}", end="", flush=True)
+
+    start = time.perf_counter()
+    platform.quantum_property_sweep(compositions, PROPERTIES, chunk_size=args.chunk_size,
+                                    workers=args.workers, progress=report)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"\n🔬 {args.n} 个组分 × {len(PROPERTIES)} 个性质")
+    print(f"   逐个调用（外推）  {per_call * args.n:8.2f} s")
+    print(f"   批量扫描          {elapsed:8.2f} s  ({per_call * args.n / elapsed:.0f}x)")
+    print(f"   峰值内存          {peak_mb:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
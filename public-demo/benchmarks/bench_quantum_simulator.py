@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+态矢量模拟器门作用吞吐基准测试（门/秒、等效内存带宽）
+
+用法: python benchmarks/bench_quantum_simulator.py --qubits 16 20 24 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.quantum_simulator import CNOT, CZ, H, StateVectorSimulator, rz
+
+
+def _gates_per_second(sim, apply, repeat):
+    start = time.perf_counter()
+    count = 0
+    for _ in range(repeat):
+        for q in range(sim.n_qubits):
+            apply(sim, q)
+            count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--qubits", type=int, nargs="+", default=[16, 20, 22], help="量子比特数")
+    parser.add_argument("--repeat", type=int, default=2, help="每个量子比特重复次数")
+    parser.add_argument("--shots", type=int, default=100_000, help="批量采样次数")
+    args = parser.parse_args()
+
+    kernels = [
+        ("H (单比特)", lambda sim, q: sim.apply_1q(H, q)),
+        ("Rz (对角)", lambda sim, q: sim.apply_1q(rz(0.3), q)),
+        ("CNOT (两比特)", lambda sim, q: sim.apply_2q(CNOT, q, (q + 1) % sim.n_qubits)),
+        ("CZ (对角两比特)", lambda sim, q: sim.apply_2q(CZ, q, (q + 1) % sim.n_qubits)),
+    ]
+    for n in args.qubits:
+        sim = StateVectorSimulator(n)
+        state_bytes = sim.state.nbytes
+        print(f"⚛️  {n} 量子比特（态矢量 {state_bytes / 2**20:.1f} MiB，总内存 {sim.memory_bytes / 2**20:.1f} MiB）")
+        for label, apply in kernels:
+            rate = _gates_per_second(sim, apply, args.repeat)
+            # 每次门作用至少读写一遍态矢量
+            bandwidth = rate * 2 * state_bytes / 1e9
+            print(f"   {label:<14} {rate:10.1f} 门/秒  {bandwidth:6.2f} GB/s")
+        start = time.perf_counter()
+        sim.sample(args.shots, rng=0)
+        print(f"   采样 {args.shots} 次      {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
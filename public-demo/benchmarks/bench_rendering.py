@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+图表渲染吞吐基准测试（张/秒）：每张新建 Figure vs 复用 Figure vs 多进程并行
+
+用法: python benchmarks/bench_rendering.py --charts 200 --workers 4
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import matplotlib
+matplotlib.use("Agg")
+
+from abn_qss_demo import QuantumResearchPlatform
+from abn_qss_demo.rendering import BatchChartRenderer, draw_material_properties, render_charts_parallel
+
+
+def _fresh_figure_per_chart(results_list):
+    """基线：每张图都新建 pyplot Figure 再关闭"""
+    import matplotlib.pyplot as plt
+    for results in results_list:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        draw_material_properties(ax1, ax2, results)
+        fig.suptitle('材料性质分析')
+        fig.tight_layout()
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+
+
+def _reused_renderer(results_list):
+    BatchChartRenderer().render_many(results_list)
+
+
+def _throughput(label, fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    print(f"   {label:<22} {len(args[0]) / elapsed:8.1f} 张/秒  ({elapsed:.2f} s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--charts", type=int, default=200, help="图表数量")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="并行进程数")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    platform = QuantumResearchPlatform()
+    results_list = [platform.demo_material_screening({}) for _ in range(args.charts)]
+
+    print(f"📊 渲染 {args.charts} 张 PNG 图表")
+    _throughput("每张新建 Figure", _fresh_figure_per_chart, results_list)
+    _throughput("复用 Figure", _reused_renderer, results_list)
+    with tempfile.TemporaryDirectory() as tmp:
+        _throughput(f"并行 ({args.workers} 进程)", render_charts_parallel, results_list, tmp, "png", 100, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+结果记录内存占用基准测试（字节/条）：旧式字典 vs __slots__ 结果类型 vs 结构化数组
+
+用法: python benchmarks/bench_result_memory.py --n 100000
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.screening import MaterialScreeningEngine, candidate_from_record, candidate_to_dict
+from abn_qss_demo.docking import docked_compounds, _compound_dicts
+
+
+def _bytes_per_record(build, n):
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000, help="记录数量")
+    args = parser.parse_args()
+
+    records = next(MaterialScreeningEngine(chunk_size=args.n).iter_chunks(args.n))
+    ids = np.char.encode(np.asarray([f"CPD_{i:07d}" for i in range(args.n)]), "utf-8")
+
+    print(f"📦 {args.n} 条记录的内存占用（字节/条）")
+    print("   候选材料")
+    print(f"     字典               {_bytes_per_record(lambda: [candidate_to_dict(r) for r in records], args.n):8.1f}")
+    print(f"     MaterialCandidate  {_bytes_per_record(lambda: [candidate_from_record(r) for r in records], args.n):8.1f}")
+    print(f"     结构化数组         {_bytes_per_record(lambda: records.copy(), args.n):8.1f}")
+    print("   对接化合物")
+    print(f"     字典               {_bytes_per_record(lambda: _compound_dicts(ids, 0), args.n):8.1f}")
+    print(f"     DockedCompound     {_bytes_per_record(lambda: docked_compounds(ids, 0), args.n):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
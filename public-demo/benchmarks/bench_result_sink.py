@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+结果导出基准测试：JSON 导出字典列表 vs 列式行组（Parquet / npz），含按列读取
+
+用法: python benchmarks/bench_result_sink.py --n 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo import MaterialScreeningEngine, ResultSink, read_results
+from abn_qss_demo.result_sink import _load_pyarrow
+from abn_qss_demo.screening import candidate_to_dict
+
+
+def _dir_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="候选数量")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="每个行组的行数")
+    args = parser.parse_args()
+
+    engine = MaterialScreeningEngine(chunk_size=args.chunk_size, workers=1)
+    print(f"💾 导出 {args.n} 条候选材料")
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "results.json")
+        start = time.perf_counter()
+        rows = [candidate_to_dict(r) for chunk in engine.iter_chunks(args.n) for r in chunk]
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+        elapsed = time.perf_counter() - start
+        del rows
+        print(f"   {'JSON':<8} 写入 {elapsed:7.2f} s  {_dir_size(json_path) / 2**20:8.1f} MiB")
+
+        backends = ["npz"] + (["parquet"] if _load_pyarrow() is not None else [])
+        for backend in backends:
+            path = os.path.join(tmp, backend)
+            start = time.perf_counter()
+            with ResultSink(path, backend=backend) as sink:
+                engine.screen_records(args.n, top_n=10, sink=sink)
+            write = time.perf_counter() - start
+            start = time.perf_counter()
+            read_results(path, ["efficiency"])
+            read = time.perf_counter() - start
+            print(f"   {backend:<8} 写入 {write:7.2f} s  {_dir_size(path) / 2**20:8.1f} MiB  "
+                  f"读取单列 {read * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
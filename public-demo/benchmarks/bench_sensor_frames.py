@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+传感器数据解码基准测试：JSON → 字典 → real_time_monitoring / batch_monitoring vs 二进制帧零拷贝 → batch_monitoring
+
+用法: python benchmarks/bench_sensor_frames.py --n 100000
+"""
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem, SENSOR_CHANNELS
+from abn_qss_demo.sensor_frames import decode_frames, encode_frames
+
+BASELINE = {"heart_rate": 72, "hrv": 45, "blood_oxygen": 98, "skin_conductance": 2.5,
+            "temperature": 36.8, "impedance": 480}
+
+
+def _timed(fn):
+    start = perf_counter()
+    result = fn()
+    return result, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000, help="读数数量")
+    parser.add_argument("--scalar-limit", type=int, default=20_000, help="逐条字典路径最多处理的读数数")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    block = rng.uniform(0.8, 1.2, (args.n, len(SENSOR_CHANNELS))) * [BASELINE[c] for c in SENSOR_CHANNELS]
+    # 与帧相同的 float32 取值，使两条路径输入一致
+    block = block.astype(np.float32).astype(np.float64)
+    payload_json = json.dumps([dict(zip(SENSOR_CHANNELS, row)) for row in block.tolist()]).encode("utf-8")
+    payload_frames = encode_frames(block)
+
+    system = HealthMonitoringSystem()
+    system.initialize_baseline(BASELINE)
+
+    readings, t_json = _timed(lambda: json.loads(payload_json))
+    m = min(args.n, args.scalar_limit)
+    _, t_scalar = _timed(lambda: [system.real_time_monitoring(r) for r in readings[:m]])
+    columns, t_columns = _timed(lambda: {c: np.array([r[c] for r in readings]) for c in SENSOR_CHANNELS})
+    dict_result, t_dict_batch = _timed(lambda: system.batch_monitoring(columns))
+
+    frames, t_decode = _timed(lambda: decode_frames(payload_frames))
+    frame_result, t_frame_batch = _timed(lambda: system.batch_monitoring(frames))
+    assert np.array_equal(dict_result["deviation_score"], frame_result["deviation_score"])
+
+    dict_total = t_json + t_columns + t_dict_batch
+    frame_total = t_decode + t_frame_batch
+    print(f"📡 {args.n} 条读数：JSON {len(payload_json) / args.n:.0f} 字节/条，二进制帧 {len(payload_frames) / args.n:.0f} 字节/条")
+    print(f"   JSON → 字典 → real_time_monitoring  {(t_json * m / args.n + t_scalar) / m * 1e6:10.2f} µs/条（前 {m} 条）")
+    print(f"   JSON → 字典 → 列 → batch_monitoring {dict_total / args.n * 1e6:10.2f} µs/条"
+          f"（解析 {t_json:.3f} s，组列 {t_columns:.3f} s，监测 {t_dict_batch:.3f} s）")
+    print(f"   帧 → decode_frames → batch_monitoring {frame_total / args.n * 1e6:8.2f} µs/条"
+          f"（解码 {t_decode * 1e6:.0f} µs，监测 {t_frame_batch:.3f} s）")
+    print(f"🚀 相对字典批量路径加速 {dict_total / frame_total:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
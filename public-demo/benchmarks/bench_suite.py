@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+基准测试套件：各公共入口在不同输入规模下的吞吐、p50/p99 延迟与峰值内存，支持 JSON 基线与回归比较
+
+用法:
+    python benchmarks/bench_suite.py --sizes 10,1000,100000 --output baseline.json
+    python benchmarks/bench_suite.py --sizes 10,1000,100000 --compare baseline.json --threshold 0.2
+每个 (用例, 规模) 在独立子进程中运行，峰值 RSS 互不影响。逐条接口按规模调用相应次数（超过 --budget 秒
+提前停止并标记 truncated），批量接口以规模为批大小调用 --repeat 次。--compare 时任一指标劣化超过
+阈值（吞吐下降、p99 或峰值 RSS 上升）即以非零状态退出。
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BENCH_DIR, '..'))
+
+SUITE_VERSION = 1
+# 指标名 -> 数值越大越好
+METRICS = {"ops_per_second": True, "p99_ms": False, "peak_rss_mb": False}
+
+Op = Callable[[int], Any]
+
+
+class Case(NamedTuple):
+    """setup(size) 返回 (op, 调用次数, 每次调用处理的条目数)；batch 为 True 时调用次数为 --repeat"""
+    setup: Callable[[int, int], Tuple[Op, int, int]]
+    batch: bool
+
+
+def _peak_rss_mb(children: bool = False) -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    scale = 1 if sys.platform == "darwin" else 1024  # macOS 以字节计，Linux 以 KB 计
+    return usage.ru_maxrss * scale / 2**20
+
+
+def _readings(n: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    from abn_qss_demo.health_monitoring import SENSOR_CHANNELS
+    rng = np.random.default_rng(seed)
+    centers = {"heart_rate": 72, "hrv": 45, "blood_oxygen": 98, "skin_conductance": 2.5,
+               "temperature": 36.8, "impedance": 480}
+    return {name: centers[name] * rng.normal(1.0, 0.05, n) for name in SENSOR_CHANNELS}
+
+
+def _monitoring_system():
+    from abn_qss_demo import HealthMonitoringSystem
+    system = HealthMonitoringSystem()
+    system.initialize_baseline({name: float(values[0]) for name, values in _readings(1, seed=1).items()})
+    return system
+
+
+def _setup_real_time_monitoring(size: int, repeat: int) -> Tuple[Op, int, int]:
+    system = _monitoring_system()
+    columns = _readings(1024)
+    pool = [{name: float(values[i]) for name, values in columns.items()} for i in range(1024)]
+    return (lambda i: system.real_time_monitoring(pool[i & 1023])), size, 1
+
+
+def _setup_batch_monitoring(size: int, repeat: int) -> Tuple[Op, int, int]:
+    system = _monitoring_system()
+    columns = _readings(size)
+    return (lambda i: system.batch_monitoring(columns)), repeat, size
+
+
+def _setup_demo_material_screening(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import QuantumResearchPlatform
+    platform_ = QuantumResearchPlatform()
+    targets = {"band_gap": (1.0, 2.0), "stability": "high", "efficiency": ">80%"}
+    return (lambda i: platform_.demo_material_screening(targets)), size, 1
+
+
+def _setup_large_scale_screening(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import QuantumResearchPlatform
+    platform_ = QuantumResearchPlatform()
+    return (lambda i: platform_.large_scale_screening(size, top_n=10, workers=1)), repeat, size
+
+
+def _setup_pareto_screening(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import QuantumResearchPlatform
+    platform_ = QuantumResearchPlatform()
+    targets = {"band_gap": (1.0, 2.0), "stability": "high", "efficiency": ">80%"}
+    return (lambda i: platform_.pareto_screening(size, targets, workers=1)), repeat, size
+
+
+def _setup_quantum_docking_screen(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import PharmaResearchTools
+    return (lambda i: PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC20_Fragment", top_k=5)), size, 1
+
+
+def _setup_library_docking_screen(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import PharmaResearchTools
+    ids = np.char.encode(np.char.add("CPD_", np.arange(size).astype(str)), "utf-8")
+    return (lambda i: PharmaResearchTools.library_docking_screen("7T9L", ids, top_k=10)), repeat, size
+
+
+def _setup_admet_prediction(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import PharmaResearchTools
+    compounds = [{"compound_id": f"CPD_{i:04d}"} for i in range(1024)]
+    return (lambda i: PharmaResearchTools.admet_prediction(compounds[i & 1023])), size, 1
+
+
+def _setup_batch_admet_prediction(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from abn_qss_demo import PharmaResearchTools
+    ids = [f"CPD_{i}" for i in range(size)]
+    return (lambda i: PharmaResearchTools.batch_admet_prediction(ids)), repeat, size
+
+
+def _setup_import(size: int, repeat: int) -> Tuple[Op, int, int]:
+    from bench_import_time import measure_import
+    return (lambda i: measure_import()), repeat, 1
+
+
+CASES: Dict[str, Case] = {
+    "import": Case(_setup_import, True),
+    "real_time_monitoring": Case(_setup_real_time_monitoring, False),
+    "batch_monitoring": Case(_setup_batch_monitoring, True),
+    "demo_material_screening": Case(_setup_demo_material_screening, False),
+    "large_scale_screening": Case(_setup_large_scale_screening, True),
+    "pareto_screening": Case(_setup_pareto_screening, True),
+    "quantum_docking_screen": Case(_setup_quantum_docking_screen, False),
+    "library_docking_screen": Case(_setup_library_docking_screen, True),
+    "admet_prediction": Case(_setup_admet_prediction, False),
+    "batch_admet_prediction": Case(_setup_batch_admet_prediction, True),
+}
+
+
+def run_case(name: str, size: int, repeat: int, budget: float) -> Dict[str, Any]:
+    """在当前进程中运行一个 (用例, 规模)，返回结果行"""
+    op, n_ops, items_per_op = CASES[name].setup(size, repeat)
+    op(0)  # 预热：首次调用的导入与缓存不计入
+    latencies = np.empty(n_ops, dtype=np.float64)
+    done = 0
+    started = perf_counter()
+    for i in range(n_ops):
+        start = perf_counter()
+        op(i)
+        end = perf_counter()
+        latencies[i] = end - start
+        done += 1
+        if end - started > budget and not CASES[name].batch:
+            break
+    elapsed = float(latencies[:done].sum())
+    return {
+        "case": name,
+        "size": size,
+        "ops": done,
+        "items": done * items_per_op,
+        "truncated": done < n_ops,
+        "seconds": elapsed,
+        "ops_per_second": done / elapsed,
+        "items_per_second": done * items_per_op / elapsed,
+        "p50_ms": float(np.percentile(latencies[:done], 50)) * 1e3,
+        "p99_ms": float(np.percentile(latencies[:done], 99)) * 1e3,
+        "peak_rss_mb": _peak_rss_mb(children=name == "import"),
+    }
+
+
+def run_isolated(name: str, size: int, repeat: int, budget: float) -> Dict[str, Any]:
+    """在新的子进程中运行一个 (用例, 规模)，峰值 RSS 只反映该用例"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", name, str(size),
+         "--repeat", str(repeat), "--budget", str(budget)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(current: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[str]:
+    """返回劣化超过阈值的指标说明；基线中不存在的 (用例, 规模) 不参与比较"""
+    base = {(row["case"], row["size"]): row for row in baseline}
+    regressions = []
+    for row in current:
+        old = base.get((row["case"], row["size"]))
+        if old is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if row.get(metric) is None or not old.get(metric):
+                continue
+            change = row[metric] / old[metric] - 1.0
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{row['case']}[{row['size']}] {metric}: "
+                                   f"{old[metric]:.4g} -> {row[metric]:.4g} ({change:+.1%})")
+    return regressions
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    rss = f"{row['peak_rss_mb']:8.1f}" if row["peak_rss_mb"] is not None else "       -"
+    mark = "*" if row["truncated"] else " "
+    print(f"   {row['case']:<26}{row['size']:>9}{mark}{row['ops_per_second']:>12.1f}{row['items_per_second']:>14.1f}"
+          f"{row['p50_ms']:>11.3f}{row['p99_ms']:>11.3f}{rss}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,1000,100000",
+                        help="逗号分隔的输入规模（可到 1000000）")
+    parser.add_argument("--cases", default=",".join(CASES), help="逗号分隔的用例名")
+    parser.add_argument("--repeat", type=int, default=5, help="批量接口与导入的调用次数")
+    parser.add_argument("--budget", type=float, default=10.0, help="逐条接口每个规模的时间上限（秒）")
+    parser.add_argument("--output", default=None, help="把结果写入 JSON 文件（可作为基线）")
+    parser.add_argument("--compare", default=None, help="与基线 JSON 比较")
+    parser.add_argument("--threshold", type=float, default=0.2, help="允许的相对劣化比例")
+    parser.add_argument("--worker", nargs=2, metavar=("CASE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(args.worker[0], int(args.worker[1]), args.repeat, args.budget)))
+        return 0
+
+    names = [name for name in args.cases.split(",") if name]
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"未知用例: {unknown}，可选: {list(CASES)}")
+    sizes = [int(float(size)) for size in args.sizes.split(",") if size]
+
+    print(f"{'':3}{'用例':<24}{'规模':>8}{'ops/s':>13}{'条目/s':>12}{'p50 ms':>11}{'p99 ms':>11}{'RSS MB':>8}")
+    results = []
+    for name in names:
+        for size in ([1] if name == "import" else sizes):
+            row = run_isolated(name, size, args.repeat, args.budget)
+            _print_row(row)
+            results.append(row)
+    if any(row["truncated"] for row in results):
+        print(f"   * 超过 {args.budget:g} 秒时间上限，提前停止")
+
+    if args.output:
+        report = {"version": SUITE_VERSION, "python": platform.python_version(),
+                  "platform": platform.platform(), "numpy": np.__version__, "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 结果已写入 {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != SUITE_VERSION:
+            print(f"❌ 基线版本 {baseline.get('version')} 与当前套件版本 {SUITE_VERSION} 不符")
+            return 1
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} 项指标劣化超过 {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"✅ 与基线 {args.compare} 相比无超过 {args.threshold:.0%} 的劣化")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from abn_qss_demo.health_monitoring import HealthMonitoringSystem, MetabolicMirror
 from abn_qss_demo.safe_core import QuantumResearchPlatform, MaterialScienceTools, PharmaResearchTools
+from abn_qss_demo.log_utils import configure_logging
 
 def demo_material_science():
     """材料科学演示"""
@@ -79,16 +80,16 @@ def demo_pharma_research():
     print(f"📚 化合物库: {docking_results['library']}")
     print(f"⚡ {docking_results['quantum_improvement']}")
     
+    # 批量ADMET预测（一次向量化计算所有候选）
+    admet = tools.batch_admet_prediction(docking_results["top_compounds"])
+    
     print("\n🏆 最佳候选化合物:")
-    for compound in docking_results["top_compounds"]:
+    for compound, admet_record in zip(docking_results["top_compounds"], admet):
         print(f"   {compound['compound_id']}:")
         print(f"     对接分数: {compound['docking_score']}")
         print(f"     量子增强: +{compound['quantum_enhancement']}")
         print(f"     结合亲和力: {compound['binding_affinity']}")
-        
-        # ADMET预测
-        admet = tools.admet_prediction(compound)
-        print(f"     ADMET综合评分: {admet['overall_score']}")
+        print(f"     ADMET综合评分: {admet_record['overall_score']}")
     
     return docking_results
 
@@ -135,4 +136,5 @@ def main():
         print("💡 请确保已安装所有依赖: pip install -r requirements.txt")
 
 if __name__ == "__main__":
+    configure_logging(stream=sys.stdout)
     main()
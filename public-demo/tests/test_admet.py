@@ -0,0 +1,53 @@
+"""
+批量 ADMET 预测测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import PharmaResearchTools
+from abn_qss_demo.admet import METABOLISM_LEVELS, admet_record_to_dict
+from abn_qss_demo.compound_library import write_compound_library
+
+class TestBatchAdmet(unittest.TestCase):
+    """批量 ADMET 测试"""
+
+    def setUp(self):
+        self.ids = [f"CPD_{i:06d}" for i in range(5_000)]
+
+    def test_structured_output_in_range(self):
+        """测试结构化输出字段与取值范围"""
+        results = PharmaResearchTools.batch_admet_prediction(self.ids)
+
+        self.assertEqual(len(results), 5_000)
+        self.assertEqual(results["compound_id"][3], b"CPD_000003")
+        self.assertTrue(((results["absorption"] >= 0.7) & (results["absorption"] <= 0.95)).all())
+        self.assertTrue(((results["toxicity"] >= 0.1) & (results["toxicity"] <= 0.4)).all())
+        self.assertEqual(set(np.unique(results["metabolism"])), {0, 1, 2})
+
+    def test_reproducible_per_compound(self):
+        """测试每个化合物的结果与批次组成无关"""
+        full = PharmaResearchTools.batch_admet_prediction(self.ids, seed=3)
+        subset = PharmaResearchTools.batch_admet_prediction([{"compound_id": self.ids[10]}, self.ids[4_000]], seed=3)
+
+        self.assertEqual(subset[0].tobytes(), full[10].tobytes())
+        self.assertEqual(subset[1].tobytes(), full[4_000].tobytes())
+        record = admet_record_to_dict(subset[0])
+        self.assertEqual(record["compound_id"], self.ids[10])
+        self.assertIn(record["metabolism"], METABOLISM_LEVELS)
+
+    def test_reads_compound_library(self):
+        """测试直接读取化合物库文件"""
+        with tempfile.TemporaryDirectory() as tmp:
+            library = write_compound_library(os.path.join(tmp, "lib.cpl"), self.ids)
+            from_library = PharmaResearchTools.batch_admet_prediction(library)
+
+        from_ids = PharmaResearchTools.batch_admet_prediction(self.ids)
+        self.assertEqual(from_library.tobytes(), from_ids.tobytes())
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
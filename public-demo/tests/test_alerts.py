@@ -0,0 +1,107 @@
+"""
+告警引擎测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo.alerts import ALERT_MESSAGES, AlertCode, AlertEngine, AlertEvent, events_to_list
+from abn_qss_demo.cohort import CohortMonitor
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem, SENSOR_CHANNELS
+
+BASELINE = {"heart_rate": 72, "hrv": 45, "blood_oxygen": 98, "skin_conductance": 2.5,
+            "temperature": 36.8, "impedance": 480}
+
+class TestAlertEngine(unittest.TestCase):
+    """增量告警引擎测试"""
+
+    def test_hysteresis_and_debounce(self):
+        """测试迟滞阈值与去抖窗口"""
+        engine = AlertEngine(deviation_enter=0.15, deviation_exit=0.12, debounce=2)
+        deviations = [0.1, 0.2, 0.1, 0.2, 0.2, 0.14, 0.13, 0.1, 0.2, 0.1, 0.1]
+        events = [engine.update_one(0, d, 1.0) for d in deviations]
+        # 单个超阈值样本被去抖吸收；0.12-0.15 之间保持告警
+        self.assertEqual([i for i, e in enumerate(events) if e], [4, 10])
+        self.assertEqual(events[4], [AlertEvent(0, AlertCode.DEVIATION, True)])
+        self.assertEqual(events[10], [AlertEvent(0, AlertCode.DEVIATION, False)])
+        self.assertEqual(events[4][0].message, ALERT_MESSAGES[AlertCode.DEVIATION][0])
+
+    def test_nan_holds_state(self):
+        """测试 NaN 输入保持当前状态"""
+        engine = AlertEngine()
+        engine.update_one(0, 0.3, 0.5)
+        self.assertEqual(engine.update_one(0, float("nan"), float("nan")), [])
+        self.assertEqual(len(engine.update([np.nan], [np.nan])), 0)
+        self.assertEqual(engine.active_alerts(0), [AlertCode.DEVIATION, AlertCode.METABOLIC])
+        self.assertEqual(engine.active_codes([0])[0], 0b11)
+
+    def test_vectorized_matches_scalar(self):
+        """测试批量更新与逐个样本的标量路径一致"""
+        rng = np.random.default_rng(4)
+        vector, scalar = AlertEngine(debounce=3, initial_capacity=4), AlertEngine(debounce=3, initial_capacity=4)
+        slots = np.array([7, 2, 11, 0, 5])
+        for _ in range(200):
+            deviation = rng.uniform(0.0, 0.3, len(slots))
+            rate = rng.uniform(0.8, 1.2, len(slots))
+            expected = [e for slot, d, r in zip(slots, deviation, rate)
+                        for e in scalar.update_one(int(slot), float(d), float(r))]
+            self.assertEqual(sorted(events_to_list(vector.update(deviation, rate, slots))), sorted(expected))
+        np.testing.assert_array_equal(vector.active_codes(slots), scalar.active_codes(slots))
+
+    def test_matches_legacy_insights_without_hysteresis(self):
+        """测试不设迟滞与去抖时告警状态与 _generate_insights 一致，且只在切换时输出"""
+        system = HealthMonitoringSystem(alert_engine=AlertEngine(deviation_exit=0.15, metabolic_margin=0.0))
+        system.initialize_baseline(BASELINE)
+        rng = np.random.default_rng(0)
+        legacy_changes = n_events = 0
+        previous = None
+        for _ in range(500):
+            reading = {k: v * rng.uniform(0.8, 1.2) for k, v in BASELINE.items()}
+            result = system.real_time_monitoring(reading)
+            active = {ALERT_MESSAGES[code][0] for code in system.alert_engine.active_alerts(0)}
+            legacy = set(result["metastable_alerts"]) - {"✅ 系统运行在和谐状态"}
+            self.assertEqual(active, legacy)
+            legacy_changes += len(legacy ^ previous) if previous is not None else len(legacy)
+            n_events += len(result["alert_events"])
+            previous = legacy
+        self.assertEqual(n_events, legacy_changes)
+
+    def test_invalid_configuration(self):
+        """测试非法参数"""
+        with self.assertRaises(ValueError):
+            AlertEngine(deviation_enter=0.1, deviation_exit=0.2)
+        with self.assertRaises(ValueError):
+            AlertEngine(debounce=0)
+        with self.assertRaises(ValueError):
+            AlertEngine(metabolic_margin=0.5)
+        with self.assertRaises(ValueError):
+            AlertEngine().update([0.1, 0.2], [1.0])
+
+class TestCohortAlerts(unittest.TestCase):
+    """群体监测告警测试"""
+
+    def test_cohort_events_and_slot_reuse(self):
+        """测试群体告警事件对应患者，且复用槽位时状态被清除"""
+        cohort = CohortMonitor(initial_capacity=2, alert_engine=AlertEngine())
+        for pid in ("A", "B", "C"):
+            cohort.add_patient(pid, BASELINE)
+        normal = np.tile([BASELINE[name] for name in SENSOR_CHANNELS], (3, 1))
+        deviated = normal.copy()
+        deviated[1] *= 1.5
+
+        self.assertEqual(len(cohort.monitor_tick(normal)["alert_events"]), 0)
+        events = cohort.monitor_tick(deviated)["alert_events"]
+        self.assertEqual({(cohort.patient_at(e["slot"]), AlertCode(e["code"])) for e in events},
+                         {("B", AlertCode.DEVIATION), ("B", AlertCode.METABOLIC)})
+        self.assertEqual(len(cohort.monitor_tick(deviated)["alert_events"]), 0)
+
+        slot = cohort.slots(["B"])[0]
+        cohort.remove_patient("B")
+        self.assertEqual(cohort.add_patient("D", BASELINE), slot)
+        self.assertEqual(cohort.alert_engine.active_alerts(int(slot)), [])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
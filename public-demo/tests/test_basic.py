@@ -3,13 +3,16 @@ ABN-QSS 基础测试用例
 验证核心功能的基本正确性
 """
 import unittest
+import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 # 添加父目录到路径
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from abn_qss_demo import QuantumResearchPlatform, MaterialScienceTools, PharmaResearchTools
+from abn_qss_demo import QuantumResearchPlatform, MaterialScienceTools, PharmaResearchTools, ResultCache
 
 class TestQuantumPlatform(unittest.TestCase):
     """量子平台基础测试"""
@@ -81,6 +84,79 @@ class TestPharmaTools(unittest.TestCase):
         self.assertIn("toxicity", results)
         self.assertIn("overall_score", results)
 
+class TestRandomStreams(unittest.TestCase):
+    """独立随机流测试"""
+
+    def test_platform_does_not_touch_global_state(self):
+        """测试创建平台不重置全局 np.random，且各平台的随机流互不影响"""
+        state = np.random.get_state()[1].copy()
+        first = QuantumResearchPlatform(seed=7)
+        np.testing.assert_array_equal(np.random.get_state()[1], state)
+
+        expected = QuantumResearchPlatform(seed=7).demo_material_screening({})
+        QuantumResearchPlatform(seed=7).demo_material_screening({})
+        self.assertEqual(first.demo_material_screening({}), expected)
+
+    def test_seed_and_generator_arguments(self):
+        """测试逐次调用的 rng 参数（种子或 Generator）"""
+        platform = QuantumResearchPlatform()
+        self.assertEqual(platform.demo_material_screening({}, rng=3), platform.demo_material_screening({}, rng=3))
+        self.assertEqual(platform.quantum_property_prediction("Li2O", ["band_gap"], rng=np.random.default_rng(3)),
+                         platform.quantum_property_prediction("Li2O", ["band_gap"], rng=np.random.default_rng(3)))
+        self.assertEqual(PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC", rng=5),
+                         PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC", rng=5))
+        self.assertEqual(PharmaResearchTools.admet_prediction({}, rng=5), PharmaResearchTools.admet_prediction({}, rng=5))
+        self.assertEqual(MaterialScienceTools.quantum_crystal_analysis("Li2O", {}, rng=5),
+                         MaterialScienceTools.quantum_crystal_analysis("Li2O", {}, rng=5))
+
+    def test_tool_defaults_deterministic(self):
+        """测试工具类方法省略 rng 时结果可重复，且与输入相关"""
+        self.assertEqual(PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC"),
+                         PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC"))
+        self.assertNotEqual(PharmaResearchTools.quantum_docking_screen("7T9L", "ZINC"),
+                            PharmaResearchTools.quantum_docking_screen("6LU7", "ZINC"))
+        compound = {"compound_id": "CPD_0001"}
+        self.assertEqual(PharmaResearchTools.admet_prediction(compound), PharmaResearchTools.admet_prediction(compound))
+        self.assertEqual(MaterialScienceTools.quantum_crystal_analysis("Li2O", {}),
+                         MaterialScienceTools.quantum_crystal_analysis("Li2O", {}))
+        # 未传入 cache 时与缓存路径的结果一致
+        self.assertEqual(MaterialScienceTools.quantum_crystal_analysis("Li2O", {}),
+                         MaterialScienceTools.quantum_crystal_analysis("Li2O", {}, cache=ResultCache()))
+
+    def test_threads_reproducible(self):
+        """测试多线程并发时各平台结果与串行一致"""
+        seeds = list(range(16))
+
+        def run(seed):
+            platform = QuantumResearchPlatform(seed=seed)
+            return [platform.demo_material_screening({}) for _ in range(20)]
+
+        serial = [run(seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertEqual(list(pool.map(run, seeds)), serial)
+
+class TestPackageImport(unittest.TestCase):
+    """包导入测试"""
+    
+    def test_import_does_not_load_matplotlib(self):
+        """测试导入包时不加载 matplotlib，也不输出字体信息"""
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, abn_qss_demo; print('matplotlib' in sys.modules)"],
+            cwd=os.path.join(os.path.dirname(__file__), '..'), capture_output=True, text=True, check=True
+        )
+        self.assertEqual(completed.stdout.strip(), "False")
+
+    def test_import_is_lazy_for_async_ingest(self):
+        """测试导入包时不加载 asyncio，接入服务与调度器在首次访问时再导入"""
+        code = ("import sys, abn_qss_demo; "
+                "print('asyncio' in sys.modules); "
+                "print(abn_qss_demo.HybridScheduler.__name__, abn_qss_demo.MetabolicIngestService.__name__)")
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.join(os.path.dirname(__file__), '..'), capture_output=True, text=True, check=True
+        )
+        self.assertEqual(completed.stdout.split(), ["False", "HybridScheduler", "MetabolicIngestService"])
+
 def run_tests():
     """运行所有测试"""
     print("🧪 运行 ABN-QSS 测试套件...")
@@ -0,0 +1,86 @@
+"""
+断点续算测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import MaterialScreeningEngine, PharmaResearchTools, QuantumResearchPlatform
+from abn_qss_demo.checkpoint import load_checkpoint, save_checkpoint
+from abn_qss_demo.docking import stream_docking_screen
+from abn_qss_demo.compound_library import write_compound_library
+
+class _Crash(Exception):
+    pass
+
+def _crash_after(n, items):
+    """产出 n 个元素后模拟进程崩溃"""
+    for i, item in enumerate(items):
+        if i == n:
+            raise _Crash()
+        yield item
+
+class TestCheckpointResume(unittest.TestCase):
+    """断点续算测试"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "job.ckpt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_screening_resume_identical(self):
+        """测试筛选中断后续算与不中断运行逐位一致"""
+        engine = MaterialScreeningEngine(seed=5, chunk_size=1_000, workers=1)
+        expected = engine.screen(9_500, top_n=8)
+
+        original = engine._map_chunks
+        engine._map_chunks = lambda fn, specs, executor=None: _crash_after(6, original(fn, specs, executor))
+        with self.assertRaises(_Crash):
+            engine.screen(9_500, top_n=8, checkpoint=self.path, checkpoint_every=2)
+
+        meta, arrays = load_checkpoint(self.path, MaterialScreeningEngine.CHECKPOINT_KIND)
+        self.assertEqual(meta["completed_chunks"], 6)
+        self.assertFalse(meta["complete"])
+        self.assertEqual(len(arrays["best"]), 8)
+
+        resumed = QuantumResearchPlatform.resume_large_scale_screening(self.path, workers=2)
+        self.assertEqual(resumed, expected)
+        meta, _ = load_checkpoint(self.path, MaterialScreeningEngine.CHECKPOINT_KIND)
+        self.assertTrue(meta["complete"])
+        self.assertEqual(MaterialScreeningEngine.resume(self.path), expected)
+
+    def test_docking_resume_from_library(self):
+        """测试对接中断后从库文件续算"""
+        ids = [f"CPD_{i:05d}" for i in range(5_000)]
+        library = write_compound_library(os.path.join(self.tmp.name, "lib.cpl"), ids)
+        expected = stream_docking_screen("7T9L", library, top_k=6, chunk_size=400)
+
+        with self.assertRaises(_Crash):
+            stream_docking_screen("7T9L", _crash_after(2_100, iter(ids)), top_k=6, chunk_size=400,
+                                  checkpoint=self.path, checkpoint_every=2)
+        with self.assertRaises(ValueError):
+            PharmaResearchTools.resume_docking_screen(self.path)
+        resumed = PharmaResearchTools.resume_docking_screen(self.path, ids)
+        self.assertEqual(resumed["top_compounds"], expected["top_compounds"])
+        self.assertEqual(resumed["n_screened"], 5_000)
+
+        stream_docking_screen("7T9L", library, top_k=6, chunk_size=400, checkpoint=self.path)
+        self.assertEqual(PharmaResearchTools.resume_docking_screen(self.path), expected)
+
+    def test_checkpoint_validation(self):
+        """测试检查点类型与原子写入"""
+        save_checkpoint(self.path, {"kind": "other"}, {"x": np.arange(3)})
+        self.assertEqual(os.listdir(self.tmp.name), ["job.ckpt"])
+        with self.assertRaises(ValueError):
+            MaterialScreeningEngine.resume(self.path)
+        with self.assertRaises(ValueError):
+            MaterialScreeningEngine().screen(10, sink=object(), checkpoint=self.path)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
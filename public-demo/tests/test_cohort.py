@@ -0,0 +1,93 @@
+"""
+群体监测模块测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo.cohort import CohortMonitor
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem, SENSOR_CHANNELS
+
+class TestCohortMonitor(unittest.TestCase):
+    """群体监测器测试"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.baselines = {}
+        for i in range(40):
+            values = [rng.uniform(60, 80), rng.uniform(30, 60), rng.uniform(95, 99),
+                      rng.uniform(2, 3), rng.uniform(36.5, 37.0), rng.uniform(450, 500)]
+            self.baselines[f"P{i:03d}"] = dict(zip(SENSOR_CHANNELS, values))
+        # 一个基线缺少部分通道的患者
+        self.baselines["P_partial"] = {"heart_rate": 70.0, "impedance": 490.0}
+
+        self.cohort = CohortMonitor(initial_capacity=8)
+        for pid, baseline in self.baselines.items():
+            self.cohort.add_patient(pid, baseline)
+        self.readings = rng.uniform(0.8, 1.2, (len(self.cohort), len(SENSOR_CHANNELS))) * [72, 45, 97, 2.5, 36.8, 480]
+
+    def _expected(self, pid, row):
+        system = HealthMonitoringSystem()
+        system.initialize_baseline(self.baselines[pid])
+        return system.real_time_monitoring(dict(zip(SENSOR_CHANNELS, row.tolist())))
+
+    def test_tick_matches_individual_monitoring(self):
+        """测试群体结果与逐个患者监测一致"""
+        ids = self.cohort.patient_ids
+        result = self.cohort.monitor_tick(self.readings)
+
+        self.assertGreaterEqual(self.cohort.capacity, len(ids))
+        for i, pid in enumerate(ids):
+            single = self._expected(pid, self.readings[i])
+            self.assertEqual(result["deviation_score"][i], single["deviation_score"])
+            self.assertEqual(result["system_harmony"][i], single["system_harmony"])
+            self.assertEqual(result["metabolic_rate"][i], single["metabolic_analysis"]["metabolic_rate"])
+            self.assertEqual(result["health_status"][i], single["health_status"])
+
+    def test_shuffled_baseline_key_order(self):
+        """测试基线字典键顺序与通道顺序不同时仍与逐个患者监测逐位一致"""
+        rng = np.random.default_rng(7)
+        cohort = CohortMonitor(initial_capacity=4)
+        baselines = {}
+        for i in range(200):
+            keys = list(rng.permutation(SENSOR_CHANNELS)[:4])
+            baselines[f"S{i:03d}"] = {key: float(rng.uniform(0.5, 100)) for key in keys}
+            cohort.add_patient(f"S{i:03d}", baselines[f"S{i:03d}"])
+        self.assertEqual(list(cohort.baseline("S010")), list(baselines["S010"]))
+
+        for _ in range(5):
+            readings = rng.uniform(0.5, 100, (len(cohort), len(SENSOR_CHANNELS)))
+            result = cohort.monitor_tick(readings)
+            for i, pid in enumerate(cohort.patient_ids):
+                system = HealthMonitoringSystem()
+                system.initialize_baseline(baselines[pid])
+                single = system.real_time_monitoring(dict(zip(SENSOR_CHANNELS, readings[i].tolist())))
+                self.assertEqual(result["deviation_score"][i], single["deviation_score"])
+
+    def test_add_and_remove_reuses_slots(self):
+        """测试增删患者复用槽位"""
+        capacity = self.cohort.capacity
+        slot = self.cohort.slots(["P005"])[0]
+        self.cohort.remove_patient("P005")
+        self.assertNotIn("P005", self.cohort)
+
+        new_slot = self.cohort.add_patient("P_new", self.baselines["P006"])
+        self.assertEqual(new_slot, slot)
+        self.assertEqual(self.cohort.capacity, capacity)
+
+        ids = ["P_new", "P006"]
+        result = self.cohort.monitor_tick(self.readings[:2], patient_ids=ids)
+        self.assertEqual(result["deviation_score"][0], self._expected("P006", self.readings[0])["deviation_score"])
+
+    def test_unknown_patient_and_channel(self):
+        """测试未知患者与未知通道"""
+        with self.assertRaises(KeyError):
+            self.cohort.remove_patient("missing")
+        with self.assertRaises(ValueError):
+            self.cohort.add_patient("P_bad", {"unknown_channel": 1.0})
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
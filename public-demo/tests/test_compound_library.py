@@ -0,0 +1,68 @@
+"""
+化合物库文件格式测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import PharmaResearchTools
+from abn_qss_demo.compound_library import CompoundLibrary, convert_text_library, write_compound_library
+from abn_qss_demo.docking import stream_docking_screen
+
+class TestCompoundLibrary(unittest.TestCase):
+    """化合物库测试"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        rng = np.random.default_rng(5)
+        self.ids = [f"ZINC{i:06d}" for i in rng.permutation(2_000)]
+        self.mw = rng.uniform(150, 500, 2_000)
+        self.logp = rng.uniform(-2, 5, 2_000)
+
+        self.csv_path = os.path.join(self.tmp, "library.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("compound_id,smiles,mw,logp\n")
+            for cid, mw, logp in zip(self.ids, self.mw, self.logp):
+                f.write(f"{cid},CCO,{float(mw)!r},{float(logp)!r}\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_convert_and_read_zero_copy(self):
+        """测试 CSV 转换后以 memmap 读取"""
+        library = convert_text_library(self.csv_path, os.path.join(self.tmp, "library.cpl"), chunk_size=300)
+
+        self.assertEqual(len(library), 2_000)
+        self.assertEqual(library.descriptor_names, ["mw", "logp"])
+        self.assertIsInstance(library.column("mw"), np.memmap)
+        np.testing.assert_array_equal(library.column("mw"), self.mw)
+        self.assertEqual(library.ids[10].decode(), self.ids[10])
+        self.assertEqual(library.column("smiles")[0], b"CCO")
+
+    def test_lookup(self):
+        """测试按 id 查找行号"""
+        library = write_compound_library(os.path.join(self.tmp, "lib.cpl"), self.ids, {"mw": self.mw})
+
+        self.assertEqual(library.lookup(self.ids[42]), 42)
+        np.testing.assert_array_equal(library.lookup([self.ids[7], self.ids[3]]), [7, 3])
+        with self.assertRaises(KeyError):
+            library.lookup("ZINC999999")
+        with self.assertRaises(ValueError):
+            CompoundLibrary(self.csv_path)
+
+    def test_docking_reads_library(self):
+        """测试对接筛选直接读取库文件，结果与 id 流一致"""
+        library = write_compound_library(os.path.join(self.tmp, "lib.cpl"), self.ids)
+
+        results = PharmaResearchTools.quantum_docking_screen("7T9L", library, top_k=5)
+        expected = stream_docking_screen("7T9L", self.ids, top_k=5)
+        self.assertEqual(results["top_compounds"], expected["top_compounds"])
+        self.assertEqual(results["library"], "lib")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+"""
+库级分子对接筛选测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import PharmaResearchTools
+from abn_qss_demo.docking import score_compounds, stream_docking_screen
+from abn_qss_demo.keyed_random import hash_ids
+
+class TestStreamingDocking(unittest.TestCase):
+    """流式对接筛选测试"""
+
+    def setUp(self):
+        self.ids = [f"ZINC{i:08d}" for i in range(20_000)]
+
+    def _sort_and_slice(self, top_k):
+        """原有的全量排序再切片语义"""
+        scores = score_compounds(hash_ids(self.ids))["docking_score"]
+        compounds = [{"compound_id": cid, "docking_score": float(s)} for cid, s in zip(self.ids, scores)]
+        compounds.sort(key=lambda x: x["docking_score"], reverse=True)
+        return [c["compound_id"] for c in compounds[:top_k]]
+
+    def test_matches_sort_and_slice_with_ties(self):
+        """测试与全量排序切片一致（含大量平分）"""
+        scores = score_compounds(hash_ids(self.ids))["docking_score"]
+        self.assertLess(len(np.unique(scores)), len(self.ids))
+
+        results = stream_docking_screen("7T9L", iter(self.ids), top_k=50, chunk_size=3_000)
+        self.assertEqual([c["compound_id"] for c in results["top_compounds"]], self._sort_and_slice(50))
+        self.assertEqual(results["n_screened"], len(self.ids))
+
+    def test_independent_of_chunk_size(self):
+        """测试结果与分块大小无关"""
+        small = stream_docking_screen("7T9L", self.ids, top_k=10, chunk_size=7)
+        large = stream_docking_screen("7T9L", self.ids, top_k=10, chunk_size=50_000)
+        self.assertEqual(small["top_compounds"], large["top_compounds"])
+
+    def test_reads_text_library(self):
+        """测试从文本文件读取化合物库"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "library.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(f"{cid},C1=CC=CC=C1\n" for cid in self.ids[:500])
+
+            results = PharmaResearchTools.library_docking_screen("7T9L", path, top_k=3, chunk_size=64)
+
+        expected = stream_docking_screen("7T9L", self.ids[:500], top_k=3)
+        self.assertEqual(results["top_compounds"], expected["top_compounds"])
+        self.assertEqual(len(results["top_compounds"]), 3)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
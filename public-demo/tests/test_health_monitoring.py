@@ -4,10 +4,11 @@
 import unittest
 import sys
 import os
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from abn_qss_demo.health_monitoring import HealthMonitoringSystem, MetabolicMirror
+from abn_qss_demo.health_monitoring import HealthMonitoringSystem, MetabolicMirror, SENSOR_CHANNELS
 
 class TestHealthMonitoring(unittest.TestCase):
     """健康监测系统测试"""
@@ -74,6 +75,59 @@ class TestMetabolicMirror(unittest.TestCase):
         self.assertIn("lactate_level", result)
         self.assertIn("metabolic_flexibility", result)
 
+class TestBatchMonitoring(unittest.TestCase):
+    """批量监测测试"""
+
+    def setUp(self):
+        self.health_system = HealthMonitoringSystem()
+        self.health_system.initialize_baseline({
+            "heart_rate": 72,
+            "hrv": 45,
+            "blood_oxygen": 98,
+            "skin_conductance": 2.5,
+            "temperature": 36.8,
+            "impedance": 480
+        })
+        rng = np.random.default_rng(0)
+        self.block = np.column_stack([
+            rng.uniform(50, 120, 200),
+            rng.uniform(20, 80, 200),
+            rng.uniform(90, 100, 200),
+            rng.uniform(1, 5, 200),
+            rng.uniform(35.5, 38.5, 200),
+            rng.uniform(400, 560, 200),
+        ])
+
+    def test_matches_per_sample_results(self):
+        """测试批量结果与逐样本结果逐位一致"""
+        batch = self.health_system.batch_monitoring(self.block)
+
+        for i, row in enumerate(self.block):
+            single = self.health_system.real_time_monitoring(dict(zip(SENSOR_CHANNELS, row.tolist())))
+            self.assertEqual(batch["deviation_score"][i], single["deviation_score"])
+            self.assertEqual(batch["system_harmony"][i], single["system_harmony"])
+            self.assertEqual(batch["metabolic_rate"][i], single["metabolic_analysis"]["metabolic_rate"])
+            self.assertEqual(batch["metabolic_state"][i], single["metabolic_analysis"]["state"])
+            self.assertEqual(batch["health_status"][i], single["health_status"])
+
+    def test_column_dict_with_missing_values(self):
+        """测试字典输入与 NaN 缺失通道"""
+        columns = {"heart_rate": [80.0, np.nan], "impedance": [470.0, 500.0]}
+        batch = self.health_system.batch_monitoring(columns)
+
+        expected = [
+            self.health_system.real_time_monitoring({"heart_rate": 80.0, "impedance": 470.0}),
+            self.health_system.real_time_monitoring({"impedance": 500.0}),
+        ]
+        for i, single in enumerate(expected):
+            self.assertEqual(batch["deviation_score"][i], single["deviation_score"])
+            self.assertEqual(batch["metabolic_rate"][i], single["metabolic_analysis"]["metabolic_rate"])
+
+    def test_rejects_mismatched_block(self):
+        """测试列数不匹配时报错"""
+        with self.assertRaises(ValueError):
+            self.health_system.batch_monitoring(self.block[:, :3])
+
 def run_health_tests():
     """运行健康监测测试"""
     print("🧪 运行健康监测测试套件...")
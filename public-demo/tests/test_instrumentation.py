@@ -0,0 +1,113 @@
+"""
+运行时埋点测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import (HealthMonitoringSystem, MetabolicIngestService, PharmaResearchTools,
+                          QuantumResearchPlatform, instrumentation)
+from abn_qss_demo.rendering import render_charts_parallel
+
+class TestInstrumentation(unittest.TestCase):
+    """埋点统计与导出测试"""
+
+    def setUp(self):
+        instrumentation.reset()
+        instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_counts_calls_and_items(self):
+        """测试调用次数与条目数"""
+        platform = QuantumResearchPlatform()
+        for _ in range(3):
+            platform.quantum_property_prediction("Li2O", ["band_gap"])
+        platform.large_scale_screening(500, top_n=5, workers=1)
+        PharmaResearchTools.batch_admet_prediction([{"compound_id": f"C{i}"} for i in range(7)])
+
+        stats = instrumentation.snapshot()
+        prediction = stats["QuantumResearchPlatform.quantum_property_prediction"]
+        self.assertEqual(prediction["calls"], 3)
+        self.assertEqual(prediction["items"], 3)
+        self.assertEqual(sum(prediction["histogram"].values()), 3)
+        self.assertEqual(stats["QuantumResearchPlatform.large_scale_screening"]["items"], 500)
+        self.assertEqual(stats["PharmaResearchTools.batch_admet_prediction"]["items"], 7)
+        self.assertGreater(stats["QuantumResearchPlatform.large_scale_screening"]["items_per_second"], 0)
+
+    def test_errors_counted(self):
+        """测试异常调用计入 errors"""
+        system = HealthMonitoringSystem()
+        with self.assertRaises(ValueError):
+            system.real_time_monitoring({"heart_rate": 70})
+        stats = instrumentation.snapshot()["HealthMonitoringSystem.real_time_monitoring"]
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["errors"], 1)
+
+    def test_disabled_records_nothing(self):
+        """测试关闭时不记录"""
+        instrumentation.disable()
+        QuantumResearchPlatform().quantum_property_prediction("Li2O", ["band_gap"])
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_disabled_binds_original(self):
+        """测试关闭时类上绑定的就是原始函数，开启后才换绑为计时包装（含静态方法）"""
+        instrumentation.disable()
+        for method in (HealthMonitoringSystem.real_time_monitoring, PharmaResearchTools.batch_admet_prediction):
+            self.assertFalse(hasattr(method, "__wrapped__"))
+        instrumentation.enable()
+        for method in (HealthMonitoringSystem.real_time_monitoring, PharmaResearchTools.batch_admet_prediction):
+            self.assertTrue(hasattr(method, "__wrapped__"))
+        self.assertEqual(len(PharmaResearchTools.batch_admet_prediction(["C1", "C2"])), 2)
+
+    def test_hot_path_stages_counted(self):
+        """测试逐条代谢分析、接入服务批量分析与并行绘图均有计数"""
+        system = HealthMonitoringSystem()
+        system.initialize_baseline({"heart_rate": 72, "impedance": 480, "skin_conductance": 2.5})
+        for _ in range(4):
+            system.real_time_monitoring({"heart_rate": 75, "impedance": 470, "skin_conductance": 2.6})
+        MetabolicIngestService().analyze_batch([{"heart_rate": 72}] * 5)
+        with tempfile.TemporaryDirectory() as tmp:
+            render_charts_parallel([QuantumResearchPlatform().demo_material_screening({})], tmp, workers=1)
+
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats["MetabolicMirror.analyze_metabolic_state"]["calls"], 4)
+        self.assertEqual(stats["MetabolicIngestService.analyze_batch"]["items"], 5)
+        self.assertEqual(stats["render_charts_parallel"]["items"], 1)
+
+    def test_prometheus_format(self):
+        """测试 Prometheus 文本导出"""
+        QuantumResearchPlatform().quantum_property_prediction("Li2O", ["band_gap"])
+        text = instrumentation.to_prometheus()
+        method = 'method="QuantumResearchPlatform.quantum_property_prediction"'
+        self.assertIn("# TYPE abn_qss_calls_total counter", text)
+        self.assertIn(f"abn_qss_calls_total{{{method}}} 1", text)
+        self.assertIn("# TYPE abn_qss_call_duration_seconds histogram", text)
+        self.assertIn(f'abn_qss_call_duration_seconds_bucket{{{method},le="+Inf"}} 1', text)
+        self.assertIn(f"abn_qss_call_duration_seconds_count{{{method}}} 1", text)
+
+    def test_profiling_reports(self):
+        """测试 cProfile 与 tracemalloc 报告"""
+        platform = QuantumResearchPlatform()
+        with tempfile.TemporaryDirectory() as tmp:
+            reports = {}
+            for mode in ("cprofile", "tracemalloc"):
+                output = os.path.join(tmp, f"{mode}.txt")
+                with instrumentation.profiling(mode, output=output) as report:
+                    platform.large_scale_screening(2000, top_n=5, workers=1)
+                with open(output, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), report.text)
+                reports[mode] = report.text
+        self.assertIn("large_scale_screening", reports["cprofile"])
+        self.assertIn("peak=", reports["tracemalloc"])
+        with self.assertRaises(ValueError):
+            with instrumentation.profiling("perf"):
+                pass
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+"""
+日志工具测试用例
+"""
+import unittest
+import contextlib
+import io
+import json
+import logging
+import sys
+import os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import MaterialScienceTools, QuantumResearchPlatform, configure_logging, shutdown_logging
+from abn_qss_demo.log_utils import RateLimitFilter, log_event
+
+class TestLogUtils(unittest.TestCase):
+    """结构化限流日志测试"""
+
+    def tearDown(self):
+        shutdown_logging()
+        logging.getLogger("abn_qss_demo").setLevel(logging.NOTSET)
+
+    def test_silent_without_configuration(self):
+        """测试未配置日志时不向 stdout/stderr 输出"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            QuantumResearchPlatform().demo_material_screening({"stability": "high"})
+            MaterialScienceTools.quantum_crystal_analysis("Li2O", {})
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(stderr.getvalue(), "")
+
+    def test_structured_text_output(self):
+        """测试文本格式包含事件名与字段"""
+        stream = io.StringIO()
+        configure_logging(stream=stream)
+        MaterialScienceTools.quantum_crystal_analysis("Li2O", {})
+        shutdown_logging()
+        line = stream.getvalue().strip()
+        self.assertIn("INFO abn_qss_demo.safe_core [crystal_analysis.start] 分析 Li2O 的晶体结构", line)
+        self.assertTrue(line.endswith("composition=Li2O"))
+
+    def test_json_output(self):
+        """测试 JSON 行格式"""
+        stream = io.StringIO()
+        configure_logging(stream=stream, json_lines=True)
+        QuantumResearchPlatform(domain="materials").demo_material_screening({})
+        shutdown_logging()
+        record = json.loads(stream.getvalue().splitlines()[0])
+        self.assertEqual(record["event"], "material_screening.start")
+        self.assertEqual(record["level"], "INFO")
+        self.assertEqual(record["domain"], "materials")
+
+    def test_rate_limit(self):
+        """测试每个事件的限流与被丢弃条数的汇报"""
+        stream = io.StringIO()
+        configure_logging(stream=stream, json_lines=True, rate=3, per=60.0)
+        logger = logging.getLogger("abn_qss_demo.test")
+        for i in range(10):
+            log_event(logger, logging.INFO, "tick", "tick %d", i)
+        log_event(logger, logging.INFO, "other", "other")
+        shutdown_logging()
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["message"] for r in records], ["tick 0", "tick 1", "tick 2", "other"])
+
+        limiter = RateLimitFilter(rate=1, per=0.05)
+        records = [logging.LogRecord("x", logging.INFO, __file__, 0, "m", None, None) for _ in range(4)]
+        self.assertEqual([limiter.filter(r) for r in records[:3]], [True, False, False])
+        time.sleep(0.06)
+        self.assertTrue(limiter.filter(records[3]))
+        self.assertEqual(records[3].fields["suppressed"], 2)
+
+    def test_full_queue_never_blocks(self):
+        """测试队列满时丢弃而不阻塞"""
+        handler = configure_logging(stream=io.StringIO(), rate=None, queue_size=1)
+        shutdown_logging()  # 停止输出线程后队列不再被消费
+        logger = logging.getLogger("abn_qss_demo")
+        logger.addHandler(handler)
+        try:
+            for _ in range(5):
+                log_event(logger, logging.INFO, "flood", "flood")
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(handler.dropped, 4)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
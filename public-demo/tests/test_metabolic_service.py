@@ -0,0 +1,95 @@
+"""
+代谢分析接入服务测试用例
+"""
+import unittest
+import asyncio
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo.health_monitoring import MetabolicMirror
+from abn_qss_demo.metabolic_service import MetabolicIngestService
+
+BASELINE = {"heart_rate": 72, "impedance": 480, "skin_conductance": 2.5}
+
+async def _fake_producer(service, producer_id, count):
+    """进程内模拟的可穿戴设备网关"""
+    rng = np.random.default_rng(producer_id)
+    results = []
+    for _ in range(count):
+        reading = {
+            "heart_rate": float(rng.uniform(60, 100)),
+            "impedance": float(rng.uniform(440, 520)),
+            "skin_conductance": float(rng.uniform(2, 3))
+        }
+        results.append((reading, await service.submit(reading)))
+    return results
+
+class TestMetabolicIngestService(unittest.TestCase):
+    """代谢分析接入服务测试"""
+
+    def _run(self, **kwargs):
+        async def scenario():
+            mirror = MetabolicMirror()
+            mirror.set_baseline(BASELINE)
+            service = MetabolicIngestService(mirror, **kwargs)
+            async with service:
+                produced = await asyncio.gather(*[_fake_producer(service, i, 50) for i in range(8)])
+            return mirror, service, [pair for pairs in produced for pair in pairs]
+        return asyncio.run(scenario())
+
+    def test_results_match_synchronous_analysis(self):
+        """测试微批结果与同步逐条分析一致"""
+        mirror, service, pairs = self._run(max_batch_size=16, max_delay=0.005)
+
+        self.assertEqual(service.readings_processed, 400)
+        self.assertLess(service.batches_processed, 400)
+        for reading, result in pairs:
+            expected_state = mirror.analyze_metabolic_state(reading)
+            expected_ni = MetabolicMirror.non_invasive_metabolic_analysis(reading)
+            self.assertEqual(result["metabolic_state"], expected_state)
+            self.assertEqual(result["non_invasive_analysis"], expected_ni)
+
+    def test_backpressure_and_latency_report(self):
+        """测试有界队列与延迟分位数报告"""
+        _, service, pairs = self._run(max_batch_size=4, max_delay=0.001, max_queue=2)
+
+        self.assertEqual(len(pairs), 400)
+        percentiles = service.latency_percentiles()
+        self.assertEqual(set(percentiles), {"p50", "p90", "p99"})
+        self.assertLessEqual(percentiles["p50"], percentiles["p99"])
+
+    def test_submit_blocks_when_queue_full(self):
+        """测试队列已满时 submit 等待，直到批处理协程取走读数"""
+        class GatedService(MetabolicIngestService):
+            async def _batch_loop(self):
+                await self.gate.wait()
+                await super()._batch_loop()
+
+        async def scenario():
+            service = GatedService(max_batch_size=1, max_queue=2)
+            service.gate = asyncio.Event()
+            async with service:
+                tasks = [asyncio.ensure_future(service.submit({"heart_rate": 72})) for _ in range(3)]
+                await asyncio.sleep(0.01)
+                queued = service._queue.qsize()
+                pending = sum(not task.done() for task in tasks)
+                service.gate.set()
+                results = await asyncio.gather(*tasks)
+            return queued, pending, results
+
+        queued, pending, results = asyncio.run(scenario())
+        self.assertEqual(queued, 2)
+        self.assertEqual(pending, 3)
+        self.assertEqual(len(results), 3)
+
+    def test_submit_requires_start(self):
+        """测试未启动时提交报错"""
+        service = MetabolicIngestService()
+        with self.assertRaises(RuntimeError):
+            asyncio.run(service.submit({"heart_rate": 72}))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+"""
+批量性质扫描测试用例
+"""
+import unittest
+import subprocess
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import HybridScheduler, QuantumResearchPlatform, ResultSink, property_sweep, read_results
+from abn_qss_demo.property_sweep import sweep_row_to_dict
+
+class TestPropertySweep(unittest.TestCase):
+    """批量性质扫描测试"""
+
+    def setUp(self):
+        self.compositions = [f"Perovskite_{i}" for i in range(20_000)]
+        self.properties = ["band_gap", "conductivity", "stability"]
+
+    def test_columnar_table(self):
+        """测试列式结果表的字段与取值范围"""
+        table = QuantumResearchPlatform().quantum_property_sweep(self.compositions, self.properties)
+
+        self.assertEqual(set(table), {"composition", "band_gap", "conductivity", "stability", "quantum_confidence"})
+        self.assertEqual(table["composition"][5], b"Perovskite_5")
+        self.assertTrue(((table["band_gap"] >= 0.1) & (table["band_gap"] <= 3.2)).all())
+        self.assertTrue(((table["stability"] >= 0.7) & (table["stability"] <= 0.95)).all())
+        self.assertTrue(((table["quantum_confidence"] >= 0.85) & (table["quantum_confidence"] <= 0.95)).all())
+        row = sweep_row_to_dict(table, 5)
+        self.assertEqual(row["composition"], "Perovskite_5")
+        self.assertTrue(row["predictions"]["conductivity"].endswith(" S/m"))
+
+    def test_chunked_and_pooled_results_identical(self):
+        """测试分块、进程池与单次计算结果逐位一致，进度回调单调到达总数"""
+        whole = property_sweep(self.compositions, self.properties, chunk_size=len(self.compositions))
+        calls = []
+        pooled = property_sweep(self.compositions, self.properties, chunk_size=3_000, workers=2,
+                                progress=lambda done, total: calls.append((done, total)))
+
+        for name in whole:
+            self.assertEqual(whole[name].tobytes(), pooled[name].tobytes())
+        self.assertEqual(calls[-1], (20_000, 20_000))
+        self.assertEqual([done for done, _ in calls], sorted(done for done, _ in calls))
+
+    def test_value_depends_only_on_composition(self):
+        """测试每个组分的结果与批次组成无关"""
+        full = property_sweep(self.compositions, ["band_gap"], seed=7)
+        subset = property_sweep([self.compositions[123]], ["band_gap"], seed=7)
+        self.assertEqual(subset["band_gap"][0], full["band_gap"][123])
+
+    def test_sink_streaming(self):
+        """测试传入 sink 时按块写出且与结果表一致"""
+        expected = property_sweep(self.compositions, self.properties)
+        with tempfile.TemporaryDirectory() as tmp:
+            for workers in (1, 2):
+                with self.subTest(workers=workers):
+                    path = os.path.join(tmp, f"sweep_{workers}")
+                    with ResultSink(path, backend="npz") as sink:
+                        written = property_sweep(self.compositions, self.properties, chunk_size=3_000,
+                                                 workers=workers, sink=sink)
+                    self.assertEqual(written, 20_000)
+                    self.assertEqual(sink.rows, 20_000)
+                    self.assertEqual(len(sink.manifest["parts"]), 7)
+                    columns = read_results(path)
+                    for name in expected:
+                        self.assertEqual(columns[name].tobytes(), expected[name].tobytes())
+
+    def test_import_does_not_load_multiprocessing(self):
+        """测试导入包时不加载 multiprocessing，进程池在需要时才导入"""
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, abn_qss_demo; print('multiprocessing' in sys.modules)"],
+            cwd=os.path.join(os.path.dirname(__file__), '..'), capture_output=True, text=True, check=True
+        )
+        self.assertEqual(completed.stdout.strip(), "False")
+
+    def test_unknown_property(self):
+        """测试未知性质"""
+        with self.assertRaises(ValueError):
+            property_sweep(self.compositions[:2], ["color"])
+
+    def test_scheduler_submission(self):
+        """测试通过混合调度器提交"""
+        with HybridScheduler(serial_threshold=10, process_threshold=20, max_workers=2) as scheduler:
+            table = scheduler.submit_property_sweep(self.compositions[:1_000], ["stability"],
+                                                    chunk_size=300).result()
+        expected = property_sweep(self.compositions[:1_000], ["stability"])
+        self.assertEqual(table["stability"].tobytes(), expected["stability"].tobytes())
+        self.assertEqual(scheduler.dispatch_counts["process"], 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
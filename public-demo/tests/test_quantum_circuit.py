@@ -0,0 +1,104 @@
+"""
+量子线路编译与门融合测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import QuantumCircuit, QuantumResearchPlatform, StateVectorSimulator, compile_circuit
+from abn_qss_demo.quantum_circuit import fusion_plan, variational_ansatz
+from abn_qss_demo.quantum_simulator import _is_monomial
+
+def _random_circuit(n_qubits, n_gates, seed):
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(n_qubits)
+    for _ in range(n_gates):
+        kind = rng.integers(0, 6)
+        a, b = (int(q) for q in rng.choice(n_qubits, 2, replace=False))
+        if kind == 0:
+            circuit.h(a)
+        elif kind == 1:
+            circuit.rx(a, rng.uniform(0, np.pi))
+        elif kind == 2:
+            circuit.rz(a, rng.uniform(0, np.pi))
+        elif kind == 3:
+            circuit.cx(a, b)
+        elif kind == 4:
+            circuit.cz(a, b)
+        else:
+            circuit.swap(a, b)
+    return circuit
+
+class TestCircuitCompilation(unittest.TestCase):
+    """线路编译测试"""
+
+    def test_fused_matches_unfused(self):
+        """测试融合后的态矢量与逐门执行一致"""
+        for seed in range(5):
+            circuit = _random_circuit(5, 60, seed)
+            fused = StateVectorSimulator(5).run(circuit)
+            unfused = StateVectorSimulator(5).run(circuit, fuse=False)
+            np.testing.assert_allclose(fused.state, unfused.state, atol=1e-10)
+            self.assertLess(fused.gates_applied, unfused.gates_applied)
+
+    def test_ansatz_pass_reduction(self):
+        """测试变分线路的遍历次数减少，且 CNOT 不被并入稠密块"""
+        n, layers = 8, 4
+        circuit = variational_ansatz(n, np.linspace(0, 1, 2 * n * layers), layers)
+        compiled = compile_circuit(circuit)
+        self.assertEqual(compiled.n_source_gates, layers * (3 * n - 1))
+        # 每层：每个量子比特的 Ry·Rz 融合为一个 2x2，CNOT 链各自保留在置换类快速路径上
+        self.assertEqual(len(compiled.ops), layers * (2 * n - 1))
+        self.assertTrue(all(_is_monomial(matrix) for qubits, matrix in compiled.ops if len(qubits) == 2))
+
+    def test_monomial_gates_fold_into_blocks(self):
+        """测试对角 / 置换类单比特门并入两比特块，稠密单比特门单独融合"""
+        circuit = QuantumCircuit(2).h(0).cx(0, 1).rz(1, 0.3).z(0).cz(1, 0).h(1).rx(1, 0.2)
+        compiled = compile_circuit(circuit)
+        self.assertEqual([qubits for qubits, _ in compiled.ops], [(0,), (0, 1), (1,)])
+        self.assertTrue(_is_monomial(compiled.ops[1][1]))
+
+    def test_plan_cached_by_structure(self):
+        """测试参数扫描复用编译方案"""
+        fusion_plan.cache_clear()
+        platform = QuantumResearchPlatform()
+        energies = []
+        for theta in np.linspace(0, np.pi, 5):
+            sim = platform.run_circuit(variational_ansatz(3, np.full(6, theta)))
+            energies.append(sim.expectation_z(0))
+
+        info = fusion_plan.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 4))
+        self.assertAlmostEqual(energies[0], 1.0)
+        self.assertAlmostEqual(energies[-1], -1.0)
+
+    def test_fixed_factors_precomputed(self):
+        """测试定值门的乘积在方案中预先计算，重新编译时只计算参数化门"""
+        def build(theta):
+            return QuantumCircuit(2).cx(0, 1).z(1).cz(0, 1).h(0).ry(0, theta).cx(0, 1).rz(1, theta).z(1)
+
+        first, second = compile_circuit(build(0.3)), compile_circuit(build(1.2))
+        (_, fixed_only), (_, parametric) = fusion_plan(build(0.0).structure())[:2]
+        self.assertIs(first.ops[0][1], second.ops[0][1])  # 只含定值门的块直接复用
+        self.assertEqual(sum(isinstance(f, np.ndarray) for f in parametric), 1)
+        self.assertEqual(len(fixed_only), 1)
+        self.assertFalse(first.ops[0][1].flags.writeable)
+        for theta, compiled in ((0.3, first), (1.2, second)):
+            expected = StateVectorSimulator(2).run(build(theta), fuse=False).state
+            np.testing.assert_allclose(StateVectorSimulator(2).run(compiled).state, expected, atol=1e-12)
+
+    def test_invalid_gates(self):
+        """测试非法门与下标"""
+        circuit = QuantumCircuit(2)
+        with self.assertRaises(ValueError):
+            circuit.append("toffoli", (0, 1))
+        with self.assertRaises(ValueError):
+            circuit.cx(0, 0)
+        with self.assertRaises(ValueError):
+            circuit.h(2)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,94 @@
+"""
+态矢量模拟器测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import QuantumResearchPlatform
+from abn_qss_demo.quantum_simulator import CNOT, CZ, H, SWAP, StateVectorSimulator, rx, ry, rz
+
+def _dense(gate, qubits, n):
+    """构造作用在整个寄存器上的稠密矩阵（第一个比特为 gate 的高位）"""
+    dim = 1 << n
+    full = np.zeros((dim, dim), dtype=complex)
+    k = len(qubits)
+    for col in range(dim):
+        sub_col = 0
+        for q in qubits:
+            sub_col = (sub_col << 1) | ((col >> q) & 1)
+        for sub_row in range(1 << k):
+            row = col
+            for pos, q in enumerate(qubits):
+                bit = (sub_row >> (k - 1 - pos)) & 1
+                row = (row & ~(1 << q)) | (bit << q)
+            full[row, col] += gate[sub_row, sub_col]
+    return full
+
+def _zero_state(n):
+    state = np.zeros(1 << n, dtype=complex)
+    state[0] = 1
+    return state
+
+class TestStateVectorSimulator(unittest.TestCase):
+    """态矢量模拟器测试"""
+
+    def test_matches_dense_reference(self):
+        """测试与稠密矩阵参考实现一致"""
+        n = 4
+        circuit = [(H, [0]), (rx(0.3), [2]), (CNOT, [0, 3]), (ry(1.1), [1]), (CNOT, [3, 1]),
+                   (rz(0.7), [2]), (CZ, [2, 0]), (SWAP, [1, 2]), (CNOT, [2, 1]),
+                   (np.kron(ry(0.4), rx(0.9)), [3, 1]), (np.kron(rx(0.2), H), [0, 2])]
+        sim = StateVectorSimulator(n)
+        sim.apply_1q(H, 3)
+        reference = _dense(H, [3], n) @ _zero_state(n)
+        for gate, qubits in circuit:
+            sim.apply_gate(gate, qubits)
+            reference = _dense(gate, qubits, n) @ reference
+
+        np.testing.assert_allclose(sim.state, reference, atol=1e-12)
+        self.assertAlmostEqual(np.linalg.norm(sim.state), 1.0)
+        self.assertEqual(sim.gates_applied, len(circuit) + 1)
+
+    def test_dense_two_qubit_layouts(self):
+        """测试稠密门在相邻/不相邻、低位跨度大/小的各种布局下都与参考实现一致"""
+        n = 8
+        gate = np.kron(ry(0.4), rx(0.9)) @ CNOT @ np.kron(H, rz(0.3))
+        sim = StateVectorSimulator(n)
+        reference = _zero_state(n)
+        for q in range(n):
+            sim.apply_1q(rx(0.1 + q), q)
+            reference = _dense(rx(0.1 + q), [q], n) @ reference
+            np.testing.assert_allclose(sim.state, reference, atol=1e-12)
+        for qubits in ([7, 6], [6, 7], [1, 0], [0, 5], [6, 2]):
+            sim.apply_gate(gate, qubits)
+            reference = _dense(gate, qubits, n) @ reference
+            np.testing.assert_allclose(sim.state, reference, atol=1e-12)
+
+    def test_no_reallocation(self):
+        """测试门作用不分配新的态矢量"""
+        sim = StateVectorSimulator(6)
+        buffers = {id(sim._state), id(sim._scratch)}
+        for q in range(6):
+            sim.apply_1q(H, q)
+            sim.apply_2q(CNOT, q, (q + 1) % 6)
+        self.assertEqual({id(sim._state), id(sim._scratch)}, buffers)
+
+    def test_bell_state_sampling(self):
+        """测试 Bell 态批量采样"""
+        sim = QuantumResearchPlatform().initialize_quantum_state(2)
+        sim.apply_1q(H, 0)
+        sim.apply_2q(CNOT, 0, 1)
+
+        counts = sim.sample_counts(4_000, rng=1)
+        self.assertEqual(set(counts), {"00", "11"})
+        self.assertAlmostEqual(counts["00"] / 4_000, 0.5, delta=0.05)
+        bits = sim.sample_bits(100, rng=2)
+        self.assertTrue((bits[:, 0] == bits[:, 1]).all())
+        self.assertAlmostEqual(sim.expectation_z(0), 0.0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,50 @@
+"""
+无界面批量渲染测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import QuantumResearchPlatform
+from abn_qss_demo.rendering import BatchChartRenderer, render_charts_parallel
+
+class TestBatchChartRenderer(unittest.TestCase):
+    """批量渲染器测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        platform = QuantumResearchPlatform()
+        cls.results = [platform.demo_material_screening({}) for _ in range(6)]
+
+    def test_render_png_to_memory_reuses_figure(self):
+        """测试渲染到内存并复用同一个 Figure"""
+        renderer = BatchChartRenderer()
+        figure = renderer.figure
+        images = renderer.render_many(self.results[:3])
+
+        self.assertTrue(all(image.startswith(b"\x89PNG") for image in images))
+        self.assertIs(renderer.figure, figure)
+        self.assertEqual(renderer.charts_rendered, 3)
+
+    def test_render_svg_to_file(self):
+        """测试输出 SVG 文件"""
+        renderer = BatchChartRenderer(fmt="svg")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chart.svg")
+            renderer.render(self.results[0], path)
+            with open(path, "rb") as f:
+                self.assertIn(b"<svg", f.read(2048))
+
+    def test_parallel_rendering(self):
+        """测试多进程并行渲染"""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = render_charts_parallel(self.results, tmp, workers=2, batch_size=2)
+            self.assertEqual(len(paths), 6)
+            self.assertEqual(sorted(paths), paths)
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in paths))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
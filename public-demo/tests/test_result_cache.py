@@ -0,0 +1,120 @@
+"""
+结果缓存测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import time
+import sqlite3
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import QuantumResearchPlatform, MaterialScienceTools
+from abn_qss_demo.result_cache import ResultCache, stable_key
+
+PROPERTIES = ["band_gap", "conductivity", "stability"]
+
+class TestResultCache(unittest.TestCase):
+    """缓存层测试"""
+
+    def test_lru_eviction_and_counters(self):
+        """测试 LRU 淘汰与命中计数"""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_ttl_expiry(self):
+        """测试过期淘汰"""
+        cache = ResultCache(ttl=0.01)
+        cache.set("a", {"x": 1})
+        time.sleep(0.02)
+        self.assertEqual(cache.get("a"), (False, None))
+
+    def test_disk_tier_shared(self):
+        """测试磁盘层在不同缓存实例间共享"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            ResultCache(path=path).set("k", {"value": [1, 2]})
+
+            other = ResultCache(path=path)
+            self.assertEqual(other.get("k"), (True, {"value": [1, 2]}))
+            self.assertEqual(other.disk_hits, 1)
+
+    def test_stable_key(self):
+        """测试键与字典顺序无关"""
+        self.assertEqual(stable_key("f", {"a": 1, "b": 2}), stable_key("f", {"b": 2, "a": 1}))
+        self.assertNotEqual(stable_key("f", "CsPbI3"), stable_key("f", "MAPbI3"))
+
+    def test_stable_key_normalises_numpy_and_rejects_objects(self):
+        """测试 NumPy 值按 Python 值取键，没有 JSON 形式的参数报错而不是退回 repr"""
+        self.assertEqual(stable_key("f", np.float64(1.5), np.arange(3)), stable_key("f", 1.5, [0, 1, 2]))
+        self.assertEqual(stable_key("f", {"b", "a"}), stable_key("f", {"a", "b"}))
+        for value in (object(), np.random.default_rng(0)):
+            with self.assertRaises(TypeError):
+                stable_key("f", value)
+
+    def test_disk_tier_purges_expired_rows(self):
+        """测试打开磁盘层与读到过期行时删除过期行"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            writer = ResultCache(path=path)
+            for key in ("a", "b", "c"):
+                writer.set(key, key)
+            with sqlite3.connect(path) as conn:
+                conn.execute("UPDATE results SET created = ? WHERE key != 'c'", (time.time() - 100,))
+
+            reader = ResultCache(ttl=10, path=path)
+            self.assertEqual(reader.get("c"), (True, "c"))
+            with sqlite3.connect(path) as conn:
+                self.assertEqual([row[0] for row in conn.execute("SELECT key FROM results")], ["c"])
+
+            reader.set("d", "d")
+            with sqlite3.connect(path) as conn:
+                conn.execute("UPDATE results SET created = ? WHERE key = 'd'", (time.time() - 100,))
+            self.assertEqual(ResultCache(path=path).get("d"), (True, "d"))
+            self.assertEqual(reader.get("d"), (True, "d"))  # 内存层尚未过期
+            reader._memory.clear()
+            self.assertEqual(reader.get("d"), (False, None))
+            self.assertEqual(reader.purge_expired(), 0)
+            with sqlite3.connect(path) as conn:
+                self.assertEqual(conn.execute("SELECT COUNT(*) FROM results").fetchone()[0], 1)
+
+class TestCachedPredictions(unittest.TestCase):
+    """缓存预测测试"""
+
+    def test_property_prediction_hits_equal_fresh(self):
+        """测试命中结果与重新计算一致"""
+        cache = ResultCache()
+        platform = QuantumResearchPlatform(cache=cache)
+        first = platform.quantum_property_prediction("Perovskite_CsPbI3", PROPERTIES)
+        first["predictions"]["band_gap"] = -1
+        second = platform.quantum_property_prediction("Perovskite_CsPbI3", PROPERTIES)
+
+        fresh = QuantumResearchPlatform(cache=ResultCache()).quantum_property_prediction("Perovskite_CsPbI3", PROPERTIES)
+        self.assertEqual(second, fresh)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+        other_seed = QuantumResearchPlatform(seed=7, cache=cache).quantum_property_prediction("Perovskite_CsPbI3", PROPERTIES)
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(other_seed["composition"], "Perovskite_CsPbI3")
+
+    def test_crystal_analysis_cached(self):
+        """测试晶体分析缓存"""
+        cache = ResultCache()
+        first = MaterialScienceTools.quantum_crystal_analysis("CsPbI3", {"band_gap": "tunable"}, cache=cache)
+        second = MaterialScienceTools.quantum_crystal_analysis("CsPbI3", {"band_gap": "tunable"}, cache=cache)
+
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
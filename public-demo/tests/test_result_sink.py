@@ -0,0 +1,115 @@
+"""
+列式结果导出测试用例
+"""
+import unittest
+import tempfile
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import MaterialScreeningEngine, PharmaResearchTools, ResultSink, read_results
+from abn_qss_demo.docking import stream_docking_screen
+from abn_qss_demo.result_sink import _load_pyarrow, iter_result_groups
+
+BACKENDS = ["npz"] + (["parquet"] if _load_pyarrow() is not None else [])
+
+class TestResultSink(unittest.TestCase):
+    """列式结果导出测试"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_streaming_screen_export(self):
+        """测试筛选流式导出全部候选，且 top-N 不受影响"""
+        engine = MaterialScreeningEngine(seed=3, chunk_size=1_000, workers=1)
+        expected = engine.screen_records(4_500, top_n=5)
+        all_records = np.concatenate(list(engine.iter_chunks(4_500)))
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                path = os.path.join(self.tmp.name, backend)
+                with ResultSink(path, backend=backend) as sink:
+                    best = engine.screen_records(4_500, top_n=5, sink=sink)
+
+                self.assertEqual(best.tobytes(), expected.tobytes())
+                self.assertEqual(sink.rows, 4_500)
+                self.assertEqual(len(list(iter_result_groups(path, ["index"]))), 5)
+                columns = read_results(path, ["efficiency", "index"])
+                self.assertEqual(list(columns), ["efficiency", "index"])
+                np.testing.assert_array_equal(columns["efficiency"], all_records["efficiency"])
+                np.testing.assert_array_equal(columns["index"], np.arange(4_500))
+
+    def test_append_mode(self):
+        """测试追加模式与 schema 校验"""
+        ids = [f"CPD_{i:05d}" for i in range(3_000)]
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                path = os.path.join(self.tmp.name, backend)
+                with ResultSink(path, backend=backend) as sink:
+                    stream_docking_screen("7T9L", ids[:2_000], chunk_size=500, sink=sink)
+                with ResultSink(path, mode="a") as sink:
+                    stream_docking_screen("7T9L", ids[2_000:], chunk_size=500, sink=sink)
+                    with self.assertRaises(ValueError):
+                        sink.append({"compound_id": ids[:2]})
+
+                columns = read_results(path, ["compound_id", "docking_score"])
+                self.assertEqual(len(columns["compound_id"]), 3_000)
+                self.assertEqual(len(os.listdir(path)), 3 if backend == "parquet" else 7)
+                self.assertEqual(columns["compound_id"][2_500], b"CPD_02500")
+
+    def test_row_dicts_and_missing_columns(self):
+        """测试行字典输入与不存在的列"""
+        path = os.path.join(self.tmp.name, "admet")
+        rows = [PharmaResearchTools.admet_prediction({"compound_id": f"CPD_{i}"}) for i in range(10)]
+        with ResultSink(path, backend="npz") as sink:
+            sink.append(rows)
+        columns = read_results(path)
+        self.assertEqual(columns["metabolism"].dtype.kind, "S")
+        self.assertAlmostEqual(float(columns["toxicity"][3]), rows[3]["toxicity"])
+        with self.assertRaises(KeyError):
+            read_results(path, ["solubility"])
+
+    def test_manifest_batched(self):
+        """测试 manifest 只在每 manifest_every 个行组与 flush/close 时重写"""
+        path = os.path.join(self.tmp.name, "batched")
+        batch = {"index": np.arange(10), "label": np.array([b"a", b"bc"] * 5)}
+        with ResultSink(path, backend="npz", manifest_every=2) as sink:
+            for _ in range(3):
+                sink.append(batch)
+            self.assertEqual(len(list(iter_result_groups(path))), 2)
+            sink.flush()
+            self.assertEqual(len(list(iter_result_groups(path))), 3)
+            sink.append(batch)
+        self.assertEqual(len(read_results(path)["label"]), 40)
+        with self.assertRaises(ValueError):
+            ResultSink(path, manifest_every=-1)
+
+    def test_overwrite_and_crash_recovery(self):
+        """测试 mode="w" 清除旧分片，mode="a" 收录崩溃前未登记的行组并删除损坏的分片"""
+        path = os.path.join(self.tmp.name, "recover")
+        batch = {"index": np.arange(10), "label": np.array([b"a", b"bc"] * 5)}
+        sink = ResultSink(path, backend="npz", manifest_every=4)
+        for _ in range(6):
+            sink.append(batch)
+        # 模拟崩溃：不调用 close()，第 6 个行组之后还留下一个写了一半的文件
+        with open(os.path.join(path, "rg-000006.npz"), "wb") as f:
+            f.write(b"PK\x03\x04 truncated")
+        self.assertEqual(len(list(iter_result_groups(path))), 4)
+
+        with ResultSink(path, mode="a") as sink:
+            self.assertEqual(sink.rows, 60)
+            sink.append(batch)
+        self.assertEqual(len(read_results(path)["index"]), 70)
+        self.assertEqual(len(os.listdir(path)), 8)
+
+        with ResultSink(path, backend="npz") as sink:
+            sink.append(batch)
+        self.assertEqual(sorted(os.listdir(path)), ["manifest.json", "rg-000000.npz"])
+        self.assertEqual(len(read_results(path)["index"]), 10)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+"""
+紧凑结果类型测试用例
+"""
+import unittest
+import pickle
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import (DockedCompound, MaterialCandidate, PropertyPrediction, QuantumResearchPlatform,
+                          ResultCache)
+from abn_qss_demo.docking import stream_docking_screen
+
+class TestCompactResults(unittest.TestCase):
+    """紧凑结果类型测试"""
+
+    def test_screening_records_match_dicts(self):
+        """测试筛选的记录输出与字典输出一致"""
+        platform = QuantumResearchPlatform()
+        legacy = platform.large_scale_screening(5_000, top_n=5, workers=1)
+        typed = platform.large_scale_screening(5_000, top_n=5, workers=1, as_records=True)
+
+        self.assertTrue(all(isinstance(c, MaterialCandidate) for c in typed["candidates"]))
+        self.assertEqual([c.to_dict() for c in typed["candidates"]], legacy["candidates"])
+        self.assertEqual(typed["best_efficiency"], legacy["best_efficiency"])
+        self.assertFalse(hasattr(typed["candidates"][0], "__dict__"))
+        self.assertEqual(MaterialCandidate.UNITS["band_gap"], "eV")
+
+    def test_docking_records_are_numeric(self):
+        """测试对接记录的结合亲和力为数值"""
+        ids = [f"CPD_{i:05d}" for i in range(2_000)]
+        legacy = stream_docking_screen("7T9L", ids, top_k=3)
+        typed = stream_docking_screen("7T9L", ids, top_k=3, as_records=True)
+
+        compound = typed["top_compounds"][0]
+        self.assertIsInstance(compound, DockedCompound)
+        self.assertIsInstance(compound.binding_affinity, float)
+        self.assertEqual(legacy["top_compounds"][0]["binding_affinity"], f"{compound.binding_affinity:.1f} nM")
+        self.assertEqual([c.to_dict() for c in typed["top_compounds"]], legacy["top_compounds"])
+
+    def test_property_prediction_record_through_cache(self):
+        """测试性质预测记录可经缓存与 pickle 往返"""
+        properties = ["band_gap", "conductivity"]
+        platform = QuantumResearchPlatform(cache=ResultCache())
+        record = platform.quantum_property_prediction("Perovskite_CsPbI3", properties, as_records=True)
+        legacy = platform.quantum_property_prediction("Perovskite_CsPbI3", properties)
+
+        self.assertIsInstance(record, PropertyPrediction)
+        self.assertIsNone(record.stability)
+        self.assertEqual(record.to_dict(), legacy)
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(platform.cache.stats()["hits"], 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+"""
+混合任务调度测试用例
+"""
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo.docking import stream_docking_screen
+from abn_qss_demo.scheduler import HybridScheduler, ProcessPoolBackend, SerialBackend, ThreadPoolBackend
+from abn_qss_demo.screening import MaterialScreeningEngine
+
+def _square(x):
+    return x * x
+
+class TestBackends(unittest.TestCase):
+    """计算后端测试"""
+
+    def test_all_backends_return_futures(self):
+        """测试三种后端都返回正确结果"""
+        for backend in (SerialBackend(), ThreadPoolBackend(2), ProcessPoolBackend(2)):
+            with backend:
+                futures = [backend.submit(_square, i) for i in range(5)]
+                self.assertEqual([f.result() for f in futures], [0, 1, 4, 9, 16])
+
+    def test_serial_backend_captures_exceptions(self):
+        """测试串行后端把异常放进 Future"""
+        future = SerialBackend().submit(_square, None)
+        self.assertIsInstance(future.exception(), TypeError)
+
+class TestHybridScheduler(unittest.TestCase):
+    """调度器测试"""
+
+    def test_backend_selection_by_cost(self):
+        """测试按代价选择后端"""
+        scheduler = HybridScheduler(serial_threshold=100, process_threshold=10_000)
+        self.assertEqual(scheduler.select_backend(10).name, "serial")
+        self.assertEqual(scheduler.select_backend(500).name, "thread")
+        self.assertEqual(scheduler.select_backend(50_000).name, "process")
+        self.assertEqual(scheduler.estimate_cost("property_prediction", composition="X",
+                                                 properties=["band_gap", "stability"]), 2)
+        with self.assertRaises(ValueError):
+            scheduler.estimate_cost("unknown")
+
+    def test_jobs_match_direct_computation(self):
+        """测试各类任务结果与直接计算一致"""
+        ids = [f"CPD_{i:05d}" for i in range(2_000)]
+        with HybridScheduler(serial_threshold=1_000, process_threshold=5_000, max_workers=2) as scheduler:
+            small = scheduler.submit_screening(500, top_n=3, chunk_size=200)
+            large = scheduler.submit_screening(8_000, top_n=3, chunk_size=1_000)
+            docking = scheduler.submit_docking("7T9L", ids, top_k=4)
+            prediction = scheduler.submit_property_prediction("Perovskite_CsPbI3", ["band_gap"])
+
+            self.assertEqual(large.result(), MaterialScreeningEngine(chunk_size=1_000, workers=1).screen(8_000, 3))
+            self.assertEqual(small.result(), MaterialScreeningEngine(chunk_size=200, workers=1).screen(500, 3))
+            self.assertEqual(docking.result(), stream_docking_screen("7T9L", ids, top_k=4))
+            self.assertIn("band_gap", prediction.result()["predictions"])
+            self.assertEqual(scheduler.dispatch_counts, {"serial": 2, "thread": 1, "process": 1})
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+"""
+大规模材料筛选引擎测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import QuantumResearchPlatform
+from abn_qss_demo.pareto import ParetoFront, nondominated_mask, objective_costs
+from abn_qss_demo.screening import (CANDIDATE_DTYPE, MATERIAL_OBJECTIVES, MaterialScreeningEngine,
+                                    filter_candidates, parse_target_properties)
+from abn_qss_demo.selection import select_top_k
+
+def brute_force_front(records):
+    """两两比较求非支配集"""
+    costs = objective_costs(records, MATERIAL_OBJECTIVES)
+    weakly = (costs[:, None, :] <= costs[None, :, :]).all(axis=2)
+    strictly = (costs[:, None, :] < costs[None, :, :]).any(axis=2)
+    return records[~(weakly & strictly).any(axis=0)]
+
+class TestSelectTopK(unittest.TestCase):
+    """top-k 选择测试"""
+
+    def test_matches_stable_sort_with_ties(self):
+        """测试平分情况下与稳定排序切片一致"""
+        scores = np.random.default_rng(3).integers(0, 20, 500).astype(float)
+        order = np.arange(500)
+        expected = sorted(range(500), key=lambda i: scores[i], reverse=True)[:37]
+
+        self.assertEqual(select_top_k(scores, order, 37).tolist(), expected)
+        self.assertEqual(select_top_k(scores[:10], order[:10], 37).tolist(),
+                         sorted(range(10), key=lambda i: scores[i], reverse=True))
+
+class TestMaterialScreeningEngine(unittest.TestCase):
+    """材料筛选引擎测试"""
+
+    def test_bit_identical_across_workers(self):
+        """测试不同进程数下结果逐位一致"""
+        serial = MaterialScreeningEngine(seed=7, chunk_size=2_000, workers=1).screen_records(10_000, 25)
+        parallel = MaterialScreeningEngine(seed=7, chunk_size=2_000, workers=3).screen_records(10_000, 25)
+
+        self.assertEqual(serial.tobytes(), parallel.tobytes())
+
+    def test_top_n_matches_full_sort(self):
+        """测试 top-N 与全量排序一致"""
+        engine = MaterialScreeningEngine(seed=11, chunk_size=1_000, workers=1)
+        everything = np.concatenate(list(engine.iter_chunks(5_500)))
+        expected = everything[np.lexsort((everything["index"], -everything["efficiency"]))][:10]
+
+        self.assertEqual(len(everything), 5_500)
+        self.assertEqual(engine.screen_records(5_500, 10).tobytes(), expected.tobytes())
+
+    def test_platform_entry_point(self):
+        """测试平台入口返回结构"""
+        results = QuantumResearchPlatform().large_scale_screening(3_000, top_n=5, chunk_size=1_000, workers=1)
+
+        self.assertEqual(len(results["candidates"]), 5)
+        self.assertEqual(results["candidates"][0]["efficiency"], results["best_efficiency"])
+        self.assertTrue(results["candidates"][0]["material_id"].startswith("MAT_"))
+
+class TestParetoScreening(unittest.TestCase):
+    """Pareto 前沿筛选测试"""
+
+    def test_incremental_front_matches_brute_force(self):
+        """测试逐块增量维护的前沿与两两比较一致，且与并入顺序无关"""
+        chunks = list(MaterialScreeningEngine(seed=5, chunk_size=300, workers=1).iter_chunks(3_000))
+        for chunk in chunks:
+            chunk["efficiency"] = np.round(chunk["efficiency"], 2)  # 制造平分与完全相同的目标向量
+            chunk["stability"] = np.round(chunk["stability"], 2)
+        expected = np.sort(brute_force_front(np.concatenate(chunks))["index"])
+
+        forward = ParetoFront(MATERIAL_OBJECTIVES, CANDIDATE_DTYPE, order="index")
+        backward = ParetoFront(MATERIAL_OBJECTIVES, CANDIDATE_DTYPE, order="index")
+        for chunk in chunks:
+            forward.update(chunk)
+        for chunk in reversed(chunks):
+            backward.update(chunk)
+
+        np.testing.assert_array_equal(np.sort(forward.records["index"]), expected)
+        self.assertEqual(forward.records.tobytes(), backward.records.tobytes())
+        self.assertEqual(len(nondominated_mask(np.empty((0, 3)))), 0)
+
+    def test_target_properties(self):
+        """测试目标性质的解析与过滤"""
+        ranges = parse_target_properties({"band_gap": (1.0, 2.0), "stability": "high", "efficiency": ">80%",
+                                          "synthesis_complexity": "Medium"})
+        self.assertEqual(ranges["band_gap"], (1.0, 2.0))
+        self.assertEqual(ranges["stability"], (0.9, np.inf))
+        self.assertGreater(ranges["efficiency"][0], 0.8)
+        self.assertEqual(ranges["synthesis_complexity"], (0.0, 1.0))
+        self.assertEqual(parse_target_properties({"band_gap": "<= 2.5"})["band_gap"], (-np.inf, 2.5))
+
+        records = np.concatenate(list(MaterialScreeningEngine(seed=2, chunk_size=1_000).iter_chunks(1_000)))
+        kept = filter_candidates(records, ranges)
+        self.assertTrue(0 < len(kept) < len(records))
+        self.assertTrue(((kept["band_gap"] >= 1.0) & (kept["band_gap"] <= 2.0)).all())
+        self.assertTrue((kept["efficiency"] > 0.8).all() and (kept["synthesis_complexity"] <= 1).all())
+
+        with self.assertRaises(KeyError):
+            parse_target_properties({"toughness": "high"})
+        with self.assertRaises(ValueError):
+            parse_target_properties({"efficiency": "very"})
+        for scalar in (1.5, 2, "1.5", "=1.5"):
+            with self.assertRaisesRegex(ValueError, "下限, 上限"):
+                parse_target_properties({"band_gap": scalar})
+
+    def test_pareto_screen_across_workers(self):
+        """测试 Pareto 筛选与全量过滤后的两两比较一致，且与进程数无关"""
+        targets = {"band_gap": (1.0, 2.0), "stability": "medium"}
+        serial = MaterialScreeningEngine(seed=9, chunk_size=1_000, workers=1)
+        parallel = MaterialScreeningEngine(seed=9, chunk_size=1_000, workers=3)
+        matched = filter_candidates(np.concatenate(list(serial.iter_chunks(6_000))), parse_target_properties(targets))
+        expected = brute_force_front(matched)
+
+        results = serial.pareto_screen(6_000, targets)
+        self.assertEqual(results, parallel.pareto_screen(6_000, targets))
+        self.assertEqual(results["n_matched"], len(matched))
+        self.assertEqual(results["front_size"], len(expected))
+        self.assertEqual(sorted(c["material_id"] for c in results["candidates"]),
+                         sorted(f"MAT_{i + 1:04d}" for i in expected["index"]))
+        efficiencies = [c["efficiency"] for c in results["candidates"]]
+        self.assertEqual(efficiencies, sorted(efficiencies, reverse=True))
+
+    def test_platform_entry_point(self):
+        """测试平台入口"""
+        results = QuantumResearchPlatform().pareto_screening(2_000, {"efficiency": ">85%"}, chunk_size=500,
+                                                             workers=1, as_records=True)
+        self.assertEqual(results["n_screened"], 2_000)
+        self.assertTrue(all(candidate.efficiency > 85 for candidate in results["candidates"]))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,76 @@
+"""
+传感器帧测试用例
+"""
+import unittest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo import CohortMonitor, HealthMonitoringSystem
+from abn_qss_demo.health_monitoring import SENSOR_CHANNELS
+from abn_qss_demo.sensor_frames import FRAME_DTYPE, FRAME_SIZE, decode_frames, encode_frames
+
+BASELINE = {"heart_rate": 72, "hrv": 45, "blood_oxygen": 98, "skin_conductance": 2.5,
+            "temperature": 36.8, "impedance": 480}
+
+class TestSensorFrames(unittest.TestCase):
+    """二进制帧编解码测试"""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.block = rng.uniform(0.8, 1.2, (50, len(SENSOR_CHANNELS))) * [BASELINE[c] for c in SENSOR_CHANNELS]
+        self.system = HealthMonitoringSystem()
+        self.system.initialize_baseline(BASELINE)
+
+    def test_layout(self):
+        """测试帧布局：40 字节、小端序、字段偏移固定"""
+        self.assertEqual(FRAME_SIZE, 40)
+        self.assertEqual([FRAME_DTYPE.fields[name][1] for name in FRAME_DTYPE.names],
+                         [0, 4, 8, 16, 20, 24, 28, 32, 36])
+        data = encode_frames([{"heart_rate": 1.0}], device_id=0x01020304, timestamp_ms=5)
+        self.assertEqual(data[:4], b"\x04\x03\x02\x01")
+        self.assertEqual(data[8:16], (5).to_bytes(8, "little"))
+
+    def test_round_trip_zero_copy(self):
+        """测试编解码往返，解码结果与缓冲区共享内存"""
+        buffer = bytearray(encode_frames(self.block, device_id=7, timestamp_ms=np.arange(50) * 10))
+        frames = decode_frames(memoryview(buffer))
+        self.assertTrue(np.shares_memory(frames, np.frombuffer(buffer, dtype=np.uint8)))
+        self.assertEqual(len(frames), 50)
+        np.testing.assert_array_equal(frames["sequence"], np.arange(50))
+        np.testing.assert_array_equal(frames["timestamp_ms"], np.arange(50) * 10)
+        for i, name in enumerate(SENSOR_CHANNELS):
+            np.testing.assert_array_equal(frames[name], self.block[:, i].astype(np.float32))
+        with self.assertRaises(ValueError):
+            decode_frames(bytes(buffer[:-1]))
+
+    def test_missing_channels_are_nan(self):
+        """测试缺失通道编码为 NaN，且批量结果与逐个字典监测一致"""
+        readings = [{"heart_rate": 80.0, "impedance": 500.0}, {"hrv": 40.0, "temperature": 37.0}]
+        frames = decode_frames(encode_frames(readings))
+        self.assertTrue(np.isnan(frames["hrv"][0]))
+        result = self.system.batch_monitoring(frames)
+        for i, reading in enumerate(readings):
+            expected = self.system.real_time_monitoring(reading)
+            self.assertAlmostEqual(result["deviation_score"][i], expected["deviation_score"])
+            self.assertEqual(result["metabolic_state"][i], expected["metabolic_analysis"]["state"])
+
+    def test_frames_match_dict_path(self):
+        """测试帧数组走批量路径的结果与 float32 取值的字典路径一致"""
+        frames = decode_frames(encode_frames(self.block))
+        result = self.system.batch_monitoring(frames)
+        for i in range(len(frames)):
+            reading = {name: float(frames[name][i]) for name in SENSOR_CHANNELS}
+            expected = self.system.real_time_monitoring(reading)
+            self.assertEqual(result["deviation_score"][i], expected["deviation_score"])
+            self.assertEqual(result["metabolic_rate"][i], expected["metabolic_analysis"]["metabolic_rate"])
+
+        cohort = CohortMonitor()
+        for pid in range(len(frames)):
+            cohort.add_patient(pid, BASELINE)
+        np.testing.assert_array_equal(cohort.monitor_tick(frames)["deviation_score"], result["deviation_score"])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+"""
+流式监测模块测试用例
+"""
+import unittest
+import asyncio
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from abn_qss_demo.streaming import RunningStats, StreamingMonitor
+
+def _readings(n, heart_rate=72.0, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        yield {
+            "heart_rate": heart_rate + rng.normal(0, 2),
+            "hrv": 45 + rng.normal(0, 1),
+            "impedance": 480 + rng.normal(0, 5)
+        }
+
+class TestRunningStats(unittest.TestCase):
+    """增量统计测试"""
+
+    def test_sliding_window_matches_numpy(self):
+        """测试滑动窗口均值/方差与直接计算一致"""
+        values = np.random.default_rng(2).normal(10, 3, 1000)
+        stats = RunningStats(window=50)
+        for value in values:
+            stats.push(float(value))
+
+        self.assertEqual(stats.count, 50)
+        self.assertAlmostEqual(stats.mean, values[-50:].mean(), places=9)
+        self.assertAlmostEqual(stats.variance, values[-50:].var(ddof=1), places=7)
+
+class TestStreamingMonitor(unittest.TestCase):
+    """流式监测测试"""
+
+    def test_lazy_results_after_warmup(self):
+        """测试预热后惰性产出结果"""
+        monitor = StreamingMonitor(window=100, warmup=20)
+        results = monitor.process(_readings(120))
+
+        first = next(results)
+        self.assertEqual(first["samples_seen"], 20)
+        self.assertIn("deviation_score", first)
+        self.assertEqual(len(list(results)), 99)
+
+    def test_detects_drift(self):
+        """测试检测到心率漂移"""
+        monitor = StreamingMonitor(window=100, warmup=50)
+        list(monitor.process(_readings(100)))
+
+        result = monitor.update({"heart_rate": 110.0, "hrv": 45.0, "impedance": 480.0})
+        self.assertIn("heart_rate", result["drift_channels"])
+        self.assertNotIn("hrv", result["drift_channels"])
+
+    def test_async_stream(self):
+        """测试异步数据流"""
+        async def feed():
+            for reading in _readings(40):
+                yield reading
+
+        async def collect():
+            monitor = StreamingMonitor(window=20, warmup=10)
+            return [result async for result in monitor.aprocess(feed())]
+
+        self.assertEqual(len(asyncio.run(collect())), 30)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)